@@ -0,0 +1,56 @@
+"""
+Resident memory per logged event: EventLog versus CompactEventLog.
+
+Runs one generated scenario, then replays its events into each log type
+under tracemalloc. Every appended data dict and signature is a fresh object,
+as in a live run, so nothing is shared with the source log.
+
+Run: python -m benchmarks.bench_memory --agents 2000 --rounds 6
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from sie.compact_log import CompactEventLog
+from sie.event_log import EventLog
+from sie.main import build_simulation, run_simulation
+from sie.scenario import generate_scenario
+from sie.types import Event
+
+
+def bytes_per_event(cls: type[EventLog], template: list[Event]) -> float:
+    records = [(e.event_type, e.agent_id, json.dumps(e.data), e.signature) for e in template]
+    gc.collect()
+    tracemalloc.start()
+    log = cls()
+    for event_type, agent_id, data, signature in records:
+        log.append(event_type, agent_id, json.loads(data), bytes.fromhex(signature).hex())
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(log)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=6)
+    args = parser.parse_args()
+
+    scenario = generate_scenario(args.agents, max(args.agents // 100, 4), seed=0)
+    kernel, agents = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+    run_simulation(kernel, agents, num_rounds=args.rounds)
+    template = kernel.log.events
+
+    plain = bytes_per_event(EventLog, template)
+    compact = bytes_per_event(CompactEventLog, template)
+    print(f"events={len(template):,}")
+    print(f"{'EventLog':<16} {plain:8.1f} bytes/event")
+    print(f"{'CompactEventLog':<16} {compact:8.1f} bytes/event  ({plain / compact:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Report and log-query times over a large log.
+
+Builds a synthetic log by cycling the events of one standard simulation run
+until it holds --events entries, then times:
+
+- per-agent and per-type queries, through the EventLog secondary indexes and
+  through the old linear scans (LinearScanLog);
+- write_report over the in-memory EventLog, and streaming a DiskEventLog's
+  segment files with read_range, which holds no events in memory;
+- the signature sweep over --sweep-events signed events, with sweep() and
+  fed one event at a time to StreamingSweep, serially and across --workers.
+
+Intent signatures are dropped from the synthetic events outside the sweep
+cases so the other timings cover log queries and the report pass rather
+than Ed25519 verification.
+
+Run: python -m benchmarks.bench_report --events 10000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from sie.disk_log import DiskEventLog, read_range
+from sie.event_log import EventLog
+from sie.main import build_simulation, run_simulation
+from sie.report import write_report
+from sie.types import Event, EventType
+from sie.verify_sweep import StreamingSweep, sweep
+
+
+class LinearScanLog(EventLog):
+    """The pre-index query implementation: a full scan per call."""
+
+    def events_for_agent(self, agent_id: str, start: int | None = None, stop: int | None = None) -> list[Event]:
+        return [e for e in self._events if e.agent_id == agent_id]
+
+    def events_of_type(self, event_type: EventType, start: int | None = None, stop: int | None = None) -> list[Event]:
+        return [e for e in self._events if e.event_type == event_type]
+
+
+def fill(log: EventLog, template: list[Event], count: int, signed: bool = False) -> None:
+    for i in range(count):
+        e = template[i % len(template)]
+        log.append(e.event_type, e.agent_id, e.data, e.signature if signed else "")
+
+
+def query_all(log: EventLog, agent_ids: list[str]) -> None:
+    for agent_id in agent_ids:
+        log.events_for_agent(agent_id)
+    for event_type in EventType:
+        log.events_of_type(event_type)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--sweep-events", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents)
+    template = kernel.log.events
+    agent_ids = list(kernel.agents)
+
+    for label, log in (("linear scan", LinearScanLog()), ("indexed", EventLog())):
+        t0 = time.perf_counter()
+        fill(log, template, args.events)
+        t1 = time.perf_counter()
+        query_all(log, agent_ids)
+        t2 = time.perf_counter()
+        print(f"{label:<12} events={args.events:>11,}  build={t1 - t0:8.2f}s  queries={t2 - t1:8.2f}s")
+        del log
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, log in (("in memory", EventLog()), ("on disk", DiskEventLog(tmp))):
+            t0 = time.perf_counter()
+            fill(log, template, args.events)
+            t1 = time.perf_counter()
+            with open(os.devnull, "w") as out:
+                if isinstance(log, DiskEventLog):
+                    log.flush()
+                    write_report(kernel, out, read_range(tmp, 0, len(log)), workers=1)
+                else:
+                    write_report(kernel, out, log, workers=1)
+            t2 = time.perf_counter()
+            print(f"{label:<12} events={args.events:>11,}  build={t1 - t0:8.2f}s  report={t2 - t1:8.2f}s")
+            if isinstance(log, DiskEventLog):
+                log.close()
+            del log
+
+    log = EventLog()
+    fill(log, template, args.sweep_events, signed=True)
+    keys = {agent_id: kernel.public_key(agent_id) for agent_id in agent_ids}
+    for workers in sorted({1, args.workers}):
+        t0 = time.perf_counter()
+        expected = sweep(log, keys, workers=workers)
+        t1 = time.perf_counter()
+        with StreamingSweep(keys, workers) as streaming:
+            for e in log:
+                streaming.add(e)
+            assert streaming.result() == expected
+        t2 = time.perf_counter()
+        print(f"sweep        events={args.sweep_events:>11,}  workers={workers:>2}  "
+              f"sweep={t1 - t0:8.2f}s  streaming={t2 - t1:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
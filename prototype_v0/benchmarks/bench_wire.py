@@ -0,0 +1,63 @@
+"""
+Serialize-sign-verify round trip for IntentPayload encodings.
+
+For each of --intents distinct payloads: encode, sign, then decode (binary
+only) and verify, as a submitter and the kernel would. "json (uncached)"
+re-runs json.dumps at each step, as serialize() did before the bytes were
+cached on the payload.
+
+Run: python -m benchmarks.bench_wire --intents 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from sie.crypto import derive_keypair, sign, verify
+from sie.types import IntentPayload
+
+
+def _uncached(intent: IntentPayload) -> bytes:
+    return json.dumps({"action": intent.action, "task_id": intent.task_id, "detail": intent.detail}, sort_keys=True).encode()
+
+
+def json_uncached(intent: IntentPayload, private_key, public_key) -> bool:
+    return verify(public_key, _uncached(intent), sign(private_key, _uncached(intent)))
+
+
+def json_cached(intent: IntentPayload, private_key, public_key) -> bool:
+    return verify(public_key, intent.serialize(), sign(private_key, intent.serialize()))
+
+
+def binary(intent: IntentPayload, private_key, public_key) -> bool:
+    wire = intent.to_wire()
+    signature = sign(private_key, wire)
+    received = IntentPayload.from_wire(wire)
+    return verify(public_key, received.to_wire(), signature)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--intents", type=int, default=20_000)
+    args = parser.parse_args()
+
+    private_key, public_key = derive_keypair("bench-1")
+    formats = (
+        ("json (uncached)", _uncached, json_uncached),
+        ("json", IntentPayload.serialize, json_cached),
+        ("binary", IntentPayload.to_wire, binary),
+    )
+    for label, encode, round_trip in formats:
+        intents = [IntentPayload(action="work_step", task_id=f"task-{i}", detail="") for i in range(args.intents)]
+        t0 = time.perf_counter()
+        for intent in intents:
+            encode(intent)
+        t1 = time.perf_counter()
+        assert all(round_trip(intent, private_key, public_key) for intent in intents)
+        t2 = time.perf_counter()
+        print(f"{label:<16} encode={(t1 - t0) / args.intents * 1e6:7.2f}us  round trip={(t2 - t1) / args.intents * 1e6:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark suite: kernel throughput, log I/O, report generation, key
+derivation and end-to-end runs.
+
+Every case reports an operation count, wall time and rate (ops/s). Results
+are printed and, with --output, written as JSON. With --baseline, each rate
+is compared against an earlier JSON result and any case slower than the
+baseline by more than --threshold is flagged as a regression; the exit
+status is then 1.
+
+Run: python -m benchmarks.suite --output bench.json
+     python -m benchmarks.suite --baseline bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.bench_dispatch import collect_intents
+from benchmarks.bench_report import fill
+from sie.crypto import derive_keypair
+from sie.event_log import EventLog
+from sie.main import build_simulation, run_simulation
+from sie.report import generate_report
+from sie.scenario import generate_scenario
+from sie.types import EventType
+
+AGENT_COUNTS = (10, 1_000, 100_000)
+QUICK_AGENT_COUNTS = (10, 1_000)
+THRESHOLD = 0.10
+
+# name -> (ops, seconds)
+Results = dict[str, tuple[int, float]]
+
+
+def bench_process_intent(repeat: int) -> Results:
+    """process_intent per action over the standard run's intents (signatures pre-verified)."""
+    intents = collect_intents()
+    totals: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        kernel, _ = build_simulation()
+        process = kernel.process_intent
+        for agent_id, intent, signature in intents:
+            t0 = time.perf_counter()
+            process(agent_id, intent, signature, True)
+            elapsed = time.perf_counter() - t0
+            total = totals.setdefault(intent.action, [0, 0.0])
+            total[0] += 1
+            total[1] += elapsed
+    return {f"process_intent.{action}": (int(n), t) for action, (n, t) in sorted(totals.items())}
+
+
+def bench_log(events: int) -> Results:
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents)
+    template = kernel.log.events
+
+    log = EventLog()
+    t0 = time.perf_counter()
+    fill(log, template, events)
+    t1 = time.perf_counter()
+    log.to_json()
+    t2 = time.perf_counter()
+    log.write_json(io.StringIO())
+    t3 = time.perf_counter()
+    kernel.log = log
+    generate_report(kernel, workers=1)
+    t4 = time.perf_counter()
+    return {
+        "event_log.append": (events, t1 - t0),
+        "event_log.to_json": (events, t2 - t1),
+        "event_log.write_json": (events, t3 - t2),
+        "generate_report": (events, t4 - t3),
+    }
+
+
+def bench_keys(count: int) -> Results:
+    t0 = time.perf_counter()
+    for i in range(count):
+        derive_keypair(f"bench-key-{i}")
+    return {"derive_keypair": (count, time.perf_counter() - t0)}
+
+
+def bench_run(agent_counts: tuple[int, ...], rounds: int) -> Results:
+    """End-to-end build plus run_simulation on seeded scenarios; ops are intents submitted."""
+    results: Results = {}
+    for count in agent_counts:
+        scenario = generate_scenario(count, max(count // 100, 4), seed=0)
+        t0 = time.perf_counter()
+        kernel, agents = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+        run_simulation(kernel, agents, num_rounds=rounds)
+        elapsed = time.perf_counter() - t0
+        results[f"run_simulation.{count}_agents"] = (len(kernel.log.sequences_of_type(EventType.INTENT_SUBMITTED)), elapsed)
+    return results
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    cases: list[Callable[[], Results]] = [
+        lambda: bench_process_intent(args.repeat),
+        lambda: bench_log(args.events),
+        lambda: bench_keys(args.keys),
+        lambda: bench_run(QUICK_AGENT_COUNTS if args.quick else AGENT_COUNTS, args.rounds),
+    ]
+    results: dict[str, dict[str, float]] = {}
+    for case in cases:
+        for name, (ops, seconds) in case().items():
+            results[name] = {"ops": ops, "seconds": round(seconds, 6), "rate": round(ops / seconds, 2) if seconds else 0.0}
+            print(f"{name:<40} ops={ops:>11,}  time={seconds:8.3f}s  rate={results[name]['rate']:>14,.0f}/s", flush=True)
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """Names of cases whose rate fell more than ``threshold`` below the baseline."""
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or not base["rate"]:
+            continue
+        change = result["rate"] / base["rate"] - 1
+        flag = "  REGRESSION" if change < -threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<40} {base['rate']:>14,.0f} {result['rate']:>14,.0f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown fraction (default 0.10)")
+    parser.add_argument("--quick", action="store_true", help="skip the 100k-agent run")
+    parser.add_argument("--repeat", type=int, default=200, help="standard runs replayed for process_intent")
+    parser.add_argument("--events", type=int, default=200_000, help="events for the log and report cases")
+    parser.add_argument("--keys", type=int, default=2_000, help="keypairs to derive")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds per end-to-end run")
+    args = parser.parse_args()
+
+    results = run_suite(args)
+    document: dict[str, Any] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import sys
+
 from sie.main import run
 
 if __name__ == "__main__":
-    run()
+    run(follow="--follow" in sys.argv[1:], metrics="--metrics" in sys.argv[1:], columnar="--columnar" in sys.argv[1:])
@@ -0,0 +1,176 @@
+"""
+Columnar agent state for very large simulations.
+
+AgentStore keeps the scalar AgentState fields in typed NumPy arrays indexed
+by an integer agent handle (registration order). AgentView exposes one row
+through the AgentState attribute API, so the systems/* modules work on it
+unchanged. Pass a store to Kernel(log, store=AgentStore()) to use it.
+
+Requires numpy: pip install ".[fast]"
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+from sie.types import AgentState
+
+# Scalar AgentState fields: (dtype, Python type returned by views)
+COLUMNS: dict[str, tuple[Any, type]] = {
+    "budget": (np.float64, float),
+    "reputation": (np.float64, float),
+    "tier": (np.int8, int),
+    "sandboxed": (np.bool_, bool),
+    "banned": (np.bool_, bool),
+    "violation_count": (np.int32, int),
+    "tasks_completed": (np.int32, int),
+    "tasks_failed": (np.int32, int),
+    "steps_taken": (np.int32, int),
+    "current_task_steps": (np.int32, int),
+    "has_received_influence": (np.bool_, bool),
+}
+
+INITIAL_CAPACITY = 1024
+
+
+def _column(name: str, cast: type) -> property:
+    def get(self: AgentView) -> Any:
+        return cast(getattr(self._store, name)[self._handle])
+
+    def set(self: AgentView, value: Any) -> None:
+        getattr(self._store, name)[self._handle] = value
+
+    return property(get, set)
+
+
+class AgentView:
+    """One agent's row in an AgentStore, with the AgentState attribute API."""
+
+    __slots__ = ("_store", "_handle")
+
+    def __init__(self, store: AgentStore, handle: int) -> None:
+        self._store = store
+        self._handle = handle
+
+    @property
+    def handle(self) -> int:
+        return self._handle
+
+    @property
+    def agent_id(self) -> str:
+        return self._store.agent_ids[self._handle]
+
+    @property
+    def current_task_id(self) -> str | None:
+        return self._store.current_task_ids[self._handle]
+
+    @current_task_id.setter
+    def current_task_id(self, value: str | None) -> None:
+        self._store.current_task_ids[self._handle] = value
+
+    @property
+    def influence_requests(self) -> list[str]:
+        return self._store.influence_requests.setdefault(self._handle, [])
+
+    @property
+    def influence_provided(self) -> list[str]:
+        return self._store.influence_provided.setdefault(self._handle, [])
+
+    def to_state(self) -> AgentState:
+        state = AgentState(agent_id=self.agent_id)
+        for name in COLUMNS:
+            setattr(state, name, getattr(self, name))
+        state.current_task_id = self.current_task_id
+        state.influence_requests = list(self.influence_requests)
+        state.influence_provided = list(self.influence_provided)
+        return state
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.to_state().to_dict()
+
+    def __repr__(self) -> str:
+        return f"AgentView({self.to_state()!r})"
+
+
+for _name, (_, _cast) in COLUMNS.items():
+    setattr(AgentView, _name, _column(_name, _cast))
+
+
+class AgentStore:
+    """Struct-of-arrays storage for every agent's state.
+
+    Also acts as the read-only ``agent_id -> AgentView`` mapping that
+    Kernel.agents exposes when a store is in use.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self._size = 0
+        self._capacity = capacity
+        defaults = AgentState(agent_id="")
+        for name, (dtype, _) in COLUMNS.items():
+            setattr(self, name, np.full(capacity, getattr(defaults, name), dtype=dtype))
+        self.agent_ids: list[str] = []
+        self.current_task_ids: list[str | None] = []
+        # Per-handle lists, created on first use
+        self.influence_requests: dict[int, list[str]] = {}
+        self.influence_provided: dict[int, list[str]] = {}
+        self._handles: dict[str, int] = {}
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        defaults = AgentState(agent_id="")
+        for name, (dtype, _) in COLUMNS.items():
+            column = np.full(self._capacity, getattr(defaults, name), dtype=dtype)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+
+    def add(self, agent_id: str) -> AgentView:
+        if agent_id in self._handles:
+            raise ValueError(f"agent {agent_id!r} already in store")
+        if self._size == self._capacity:
+            self._grow()
+        handle = self._size
+        self._size += 1
+        self._handles[agent_id] = handle
+        self.agent_ids.append(agent_id)
+        self.current_task_ids.append(None)
+        return AgentView(self, handle)
+
+    def column(self, name: str) -> np.ndarray:
+        """The live slice of one column for all registered agents."""
+        return getattr(self, name)[:self._size]
+
+    def handle(self, agent_id: str) -> int:
+        return self._handles[agent_id]
+
+    def view(self, handle: int) -> AgentView:
+        return AgentView(self, handle)
+
+    # Mapping interface (agent_id -> AgentView)
+
+    def __getitem__(self, agent_id: str) -> AgentView:
+        return AgentView(self, self._handles[agent_id])
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._handles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.agent_ids)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, agent_id: str, default: AgentView | None = None) -> AgentView | None:
+        handle = self._handles.get(agent_id)
+        return default if handle is None else AgentView(self, handle)
+
+    def keys(self) -> list[str]:
+        return list(self.agent_ids)
+
+    def values(self) -> Iterator[AgentView]:
+        return (AgentView(self, h) for h in range(self._size))
+
+    def items(self) -> Iterator[tuple[str, AgentView]]:
+        return ((agent_id, AgentView(self, h)) for h, agent_id in enumerate(self.agent_ids))
@@ -1,34 +1,70 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 
-from sie.crypto import derive_keypair, sign
+from sie.crypto import KEY_REGISTRY, sign
 from sie.kernel import Kernel
 from sie.types import IntentPayload
 
+# Attributes snapshot() leaves out
+TRANSIENT_ATTRIBUTES = ("_private_key", "_public_key", "_presigned")
+
 
 class BaseAgent(ABC):
     def __init__(self, agent_id: str) -> None:
         self.agent_id = agent_id
-        self._private_key: Ed25519PrivateKey
-        self._public_key: Ed25519PublicKey
-        self._private_key, self._public_key = derive_keypair(agent_id)
+        # Keys are derived on first use, so building many agents stays cheap
+        self._private_key: Ed25519PrivateKey | None = None
+        self._public_key: Ed25519PublicKey | None = None
+        # Signatures made ahead of time by sie.speculation, by payload
+        self._presigned: dict[bytes, bytes] = {}
         self._done = False
 
     @property
     def public_key(self) -> Ed25519PublicKey:
+        if self._public_key is None:
+            self._public_key = KEY_REGISTRY.public_key(self.agent_id)
         return self._public_key
 
     def submit_intent(self, kernel: Kernel, intent: IntentPayload) -> bool:
-        sig = sign(self._private_key, intent.serialize())
+        payload = intent.serialize()
+        sig = self._presigned.get(payload) if self._presigned else None
+        if sig is None:
+            if self._private_key is None:
+                self._private_key = KEY_REGISTRY.private_key(self.agent_id)
+            sig = sign(self._private_key, payload)
         return kernel.process_intent(self.agent_id, intent, sig)
 
     @abstractmethod
     def act(self, kernel: Kernel, round_num: int) -> None:
         """SPAR loop: sense→plan→act→reflect. Called once per round."""
 
+    def snapshot(self) -> dict[str, Any]:
+        """Plain-data copy of the agent's own state machine, for Kernel.snapshot.
+
+        The default covers every instance attribute except the keys, which are
+        re-derived from agent_id, and presigned signatures; override if an
+        agent holds anything that does not round-trip through JSON.
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name not in TRANSIENT_ATTRIBUTES
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Put back what snapshot() returned; raises ValueError for any other key."""
+        transient = sorted(name for name in state if name in TRANSIENT_ATTRIBUTES)
+        if transient:
+            raise ValueError(f"invalid agent snapshot: transient attributes {transient}")
+        unknown = sorted(state.keys() - self.snapshot().keys())
+        if unknown:
+            raise ValueError(f"invalid agent snapshot: unknown attributes {unknown}")
+        vars(self).update(state)
+
     @property
     def done(self) -> bool:
         return self._done
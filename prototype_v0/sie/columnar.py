@@ -0,0 +1,305 @@
+"""
+Columnar event log export for offline analytics.
+
+The log is written as NumPy .npy files under one directory, partitioned by
+round: a partition runs from a ROUND_START to its ROUND_END, inclusive;
+events outside any round (setup, SIMULATION_COMPLETE) get partitions of
+their own with round -1. Each partition holds
+
+    events.sequence / events.event_type / events.agent    every event
+    <EVENT_TYPE>.sequence / .agent / .<field>             one table per type
+
+where <field> are the type's data keys, flattened. Strings (agent ids, task
+ids, reasons, ...) are int32 codes into strings.jsonl, one JSON string per
+line with code = line number; event types are uint8 codes into
+manifest.json. Per partition, a field whose values are all ints
+is int64, ints and floats (or a missing value) float64 with NaN for missing,
+all bools bool, strings int32 codes with -1 for missing; any other value is
+stored as the code of its JSON text. Signatures are raw 64-byte ``S64``.
+
+ColumnarTail streams a live log: each partition is written when its
+ROUND_END arrives, the strings it introduced are appended to strings.jsonl,
+and manifest.json, which records how many strings are in use, is then
+replaced atomically, so a reader sees whole rounds. load_columnar
+memory-maps a directory. A column a data field gets in different partitions
+is combined when queried: bools, ints and floats promote numerically, while
+mixing string codes with numbers or with raw signatures raises ValueError.
+
+Requires numpy: pip install ".[fast]"
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
+
+import numpy as np
+
+from sie.event_log import EventLog
+from sie.types import Event, EventType
+
+MANIFEST = "manifest.json"
+STRINGS = "strings.jsonl"
+FORMAT_VERSION = 2
+
+EVENT_TYPES = list(EventType)
+TYPE_CODES = {t: i for i, t in enumerate(EVENT_TYPES)}
+
+# Bookkeeping columns of a per-type table; data fields may not shadow them
+TABLE_COLUMNS = ("sequence", "agent", "round", "signature")
+
+
+class _Missing:
+    """Placeholder for a data key absent from one event of a table."""
+
+
+_MISSING = _Missing()
+
+
+def _write_atomic(path: str, document: Any) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(document, f)
+    os.replace(tmp, path)
+
+
+class ColumnarWriter:
+    """Writes events fed in sequence order with add(); close() flushes."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._strings: list[str] = []
+        self._codes: dict[str, int] = {}
+        # Strings already appended to the strings file
+        self._written = 0
+        self._partitions: list[dict[str, Any]] = []
+        self._pending: list[Event] = []
+        self._round = -1
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _code(self, s: str) -> int:
+        code = self._codes.get(s)
+        if code is None:
+            code = self._codes[s] = len(self._strings)
+            self._strings.append(s)
+        return code
+
+    def add(self, event: Event) -> None:
+        if event.event_type == EventType.ROUND_START:
+            self.flush()
+            self._round = event.data["round"]
+        self._pending.append(event)
+        if event.event_type == EventType.ROUND_END:
+            self.flush()
+            self._round = -1
+
+    def flush(self) -> None:
+        """Write the pending events as a partition and publish it."""
+        if not self._pending:
+            return
+        events, self._pending = self._pending, []
+        name = f"part-{len(self._partitions):06d}"
+        path = os.path.join(self.directory, name)
+        os.makedirs(path, exist_ok=True)
+
+        np.save(os.path.join(path, "events.sequence.npy"), np.array([e.sequence for e in events], dtype=np.int64))
+        np.save(os.path.join(path, "events.event_type.npy"), np.array([TYPE_CODES[e.event_type] for e in events], dtype=np.uint8))
+        np.save(os.path.join(path, "events.agent.npy"), np.array([self._code(e.agent_id) for e in events], dtype=np.int32))
+
+        by_type: dict[EventType, list[Event]] = {}
+        for e in events:
+            by_type.setdefault(e.event_type, []).append(e)
+        tables = {}
+        for event_type, rows in by_type.items():
+            prefix = os.path.join(path, event_type.value)
+            np.save(prefix + ".sequence.npy", np.array([e.sequence for e in rows], dtype=np.int64))
+            np.save(prefix + ".agent.npy", np.array([self._code(e.agent_id) for e in rows], dtype=np.int32))
+            if any(e.signature for e in rows):
+                np.save(prefix + ".signature.npy", self._signatures(rows))
+            fields = list(dict.fromkeys(key for e in rows for key in e.data if key not in TABLE_COLUMNS))
+            for key in fields:
+                np.save(f"{prefix}.{key}.npy", self._field([e.data.get(key, _MISSING) for e in rows]))
+            tables[event_type.value] = {"rows": len(rows), "fields": fields}
+
+        self._partitions.append({
+            "name": name,
+            "round": self._round,
+            "start": events[0].sequence,
+            "stop": events[-1].sequence + 1,
+            "tables": tables,
+        })
+        if self._written < len(self._strings):
+            with open(os.path.join(self.directory, STRINGS), "a") as f:
+                f.writelines(json.dumps(s) + "\n" for s in self._strings[self._written:])
+            self._written = len(self._strings)
+        _write_atomic(os.path.join(self.directory, MANIFEST), {
+            "version": FORMAT_VERSION,
+            "event_types": [t.value for t in EVENT_TYPES],
+            "strings": self._written,
+            "partitions": self._partitions,
+        })
+
+    def close(self) -> None:
+        self.flush()
+
+    def _signatures(self, rows: list[Event]) -> np.ndarray:
+        try:
+            return np.array([bytes.fromhex(e.signature) for e in rows], dtype="S64")
+        except ValueError:
+            return np.array([self._code(e.signature) for e in rows], dtype=np.int32)
+
+    def _field(self, values: list[Any]) -> np.ndarray:
+        kinds = {type(v) for v in values}
+        missing = _Missing in kinds
+        kinds.discard(_Missing)
+        if kinds == {bool} and not missing:
+            return np.array(values, dtype=np.bool_)
+        if kinds == {int} and not missing:
+            return np.array(values, dtype=np.int64)
+        if kinds and kinds <= {int, float}:
+            return np.array([math.nan if v is _MISSING else v for v in values], dtype=np.float64)
+        if kinds == {str}:
+            return np.array([-1 if v is _MISSING else self._code(v) for v in values], dtype=np.int32)
+        return np.array([-1 if v is _MISSING else self._code(json.dumps(v)) for v in values], dtype=np.int32)
+
+
+class ColumnarTail:
+    """Export a log as columnar partitions while the simulation is running.
+
+    Writes the events already in the log, then every appended event; a
+    partition is written at each ROUND_END. close() writes the remainder.
+    """
+
+    def __init__(self, log: EventLog, directory: str) -> None:
+        self.log = log
+        self.writer = ColumnarWriter(directory)
+        for event in log:
+            self.writer.add(event)
+        log.subscribe(self.writer.add)
+
+    def close(self) -> None:
+        self.log.unsubscribe(self.writer.add)
+        self.writer.close()
+
+
+def write_columnar(events: Iterable[Event], directory: str) -> None:
+    with ColumnarWriter(directory) as writer:
+        for event in events:
+            writer.add(event)
+
+
+def _missing(rows: int, like: list[np.ndarray]) -> np.ndarray:
+    """Fill for a partition lacking a column: empty signatures, -1 codes, else NaN."""
+    if all(c.dtype.kind == "S" for c in like):
+        return np.zeros(rows, dtype="S64")
+    if all(c.dtype == np.int32 for c in like):
+        return np.full(rows, -1, dtype=np.int32)
+    return np.full(rows, np.nan)
+
+
+def _common_dtype(column: str, arrays: list[np.ndarray]) -> np.dtype:
+    """The dtype one column's per-partition arrays combine to: numeric kinds
+    promote; string codes or signatures mixed with anything else raise."""
+    dtypes = {a.dtype for a in arrays}
+    if len(dtypes) > 1 and any(d.kind == "S" or d == np.int32 for d in dtypes):
+        kinds = ", ".join(sorted(str(d) for d in dtypes))
+        raise ValueError(f"column {column} has incompatible dtypes across partitions: {kinds}")
+    return np.result_type(*dtypes)
+
+
+class ColumnarLog:
+    """A columnar export opened for queries; arrays are memory-mapped."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST)) as f:
+            manifest = json.load(f)
+        # Lines past the manifest's count belong to a partition still being written
+        count = manifest["strings"]
+        self.strings: list[str] = []
+        if count:
+            with open(os.path.join(directory, STRINGS)) as f:
+                self.strings = [json.loads(line) for line in islice(f, count)]
+        self.event_types = [EventType(t) for t in manifest["event_types"]]
+        self.partitions: list[dict[str, Any]] = manifest["partitions"]
+        self._codes = {s: i for i, s in enumerate(self.strings)}
+
+    def __len__(self) -> int:
+        return self.partitions[-1]["stop"] if self.partitions else 0
+
+    def code(self, s: str) -> int:
+        """The int32 code a string column uses for ``s`` (-1 if never logged)."""
+        return self._codes.get(s, -1)
+
+    def decode(self, codes: np.ndarray) -> list[str | None]:
+        return [self.strings[c] if c >= 0 else None for c in codes.tolist()]
+
+    def _load(self, partition: dict[str, Any], column: str) -> np.ndarray:
+        return np.load(os.path.join(self.directory, partition["name"], column + ".npy"), mmap_mode="r")
+
+    def _selected(self, rounds: Iterable[int] | None) -> list[dict[str, Any]]:
+        if rounds is None:
+            return self.partitions
+        wanted = set(rounds)
+        return [p for p in self.partitions if p["round"] in wanted]
+
+    def events(self, rounds: Iterable[int] | None = None) -> dict[str, np.ndarray]:
+        """sequence, event_type (codes into event_types), agent and round for every event."""
+        parts = self._selected(rounds)
+        columns = {
+            name: np.concatenate([self._load(p, "events." + name) for p in parts])
+            if parts else np.empty(0, dtype=dtype)
+            for name, dtype in (("sequence", np.int64), ("event_type", np.uint8), ("agent", np.int32))
+        }
+        columns["round"] = np.concatenate([
+            np.full(p["stop"] - p["start"], p["round"], dtype=np.int32) for p in parts
+        ]) if parts else np.empty(0, dtype=np.int32)
+        return columns
+
+    def table(self, event_type: EventType | str, rounds: Iterable[int] | None = None) -> dict[str, np.ndarray]:
+        """Every column of one event type's table: sequence, agent, round,
+        signature when present, and each flattened data field."""
+        name = EventType(event_type).value
+        parts = [p for p in self._selected(rounds) if name in p["tables"]]
+        fields = list(dict.fromkeys(f for p in parts for f in p["tables"][name]["fields"]))
+        columns: dict[str, np.ndarray] = {
+            "sequence": np.concatenate([self._load(p, name + ".sequence") for p in parts]) if parts else np.empty(0, np.int64),
+            "agent": np.concatenate([self._load(p, name + ".agent") for p in parts]) if parts else np.empty(0, np.int32),
+            "round": np.concatenate([np.full(p["tables"][name]["rows"], p["round"], dtype=np.int32) for p in parts])
+            if parts else np.empty(0, np.int32),
+        }
+        for field in ("signature", *fields):
+            chunks: list[np.ndarray | int] = []
+            for p in parts:
+                path = os.path.join(self.directory, p["name"], f"{name}.{field}.npy")
+                chunks.append(np.load(path, mmap_mode="r") if os.path.exists(path) else p["tables"][name]["rows"])
+            present = [c for c in chunks if not isinstance(c, int)]
+            if present:
+                arrays = [_missing(c, present) if isinstance(c, int) else c for c in chunks]
+                columns[field] = np.concatenate(arrays, dtype=_common_dtype(f"{name}.{field}", arrays))
+        return columns
+
+    def trajectory(
+        self,
+        agent_id: str,
+        event_type: EventType | str = EventType.REPUTATION_ADJUSTED,
+        field: str = "new",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(sequence, value) of one field over one agent's events, e.g. its
+        reputation after every adjustment."""
+        columns = self.table(event_type)
+        mask = columns["agent"] == self.code(agent_id)
+        return columns["sequence"][mask], columns[field][mask]
+
+
+def load_columnar(directory: str) -> ColumnarLog:
+    return ColumnarLog(directory)
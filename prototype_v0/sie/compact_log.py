@@ -0,0 +1,181 @@
+"""
+Compact in-memory event log.
+
+Events are stored column-wise instead of as Event objects: a schema id, an
+interned agent id, a data offset and the 32-byte chain hash per event, with
+data values packed by a per-schema struct. A schema is the event type plus
+the data dict's keys and value types, so each data record holds values only;
+strings (agent ids, task ids, reasons, outputs) are interned in one table and
+stored as u32 codes. Hex signatures are kept as raw 64-byte blocks.
+
+Event objects are materialized on access, so each read returns a fresh
+Event; mutating its data does not change the log.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+from sie.event_log import FIXED_TIMESTAMP, EventLog
+from sie.types import Event, EventType
+
+HASH_BYTES = 32
+SIGNATURE_BYTES = 64
+
+# Value type -> (kind, struct code); anything else is stored as interned JSON
+KINDS: dict[type, tuple[str, str]] = {
+    str: ("s", "I"),
+    float: ("f", "d"),
+    int: ("i", "q"),
+    bool: ("b", "?"),
+}
+JSON_KIND = ("j", "I")
+
+
+class Schema(NamedTuple):
+    event_type: EventType
+    keys: tuple[str, ...]
+    kinds: str
+    record: struct.Struct
+
+
+class CompactEventLog(EventLog):
+    """EventLog holding events as packed columns rather than Event objects."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._strings: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._schemas: list[Schema] = []
+        self._schema_ids: dict[tuple[Any, ...], int] = {}
+        # One entry per held event
+        self._schema_of = array("H")
+        self._agent_of = array("I")
+        self._offsets = array("Q")
+        self._chain = bytearray()
+        self._data = bytearray()
+        # Sequences carrying a raw signature, ascending, and their bytes;
+        # signatures that are not 64-byte hex are kept as given
+        self._signed = array("q")
+        self._signatures = bytearray()
+        self._other_signatures: dict[int, str] = {}
+
+    def _intern(self, s: str) -> int:
+        code = self._codes.get(s)
+        if code is None:
+            code = self._codes[s] = len(self._strings)
+            self._strings.append(s)
+        return code
+
+    def _schema(self, event_type: EventType, data: dict[str, Any]) -> int:
+        key = (event_type, *data, *map(type, data.values()))
+        schema_id = self._schema_ids.get(key)
+        if schema_id is None:
+            kinds = [KINDS.get(type(v), JSON_KIND) for v in data.values()]
+            schema = Schema(
+                event_type,
+                tuple(data),
+                "".join(kind for kind, _ in kinds),
+                struct.Struct("<" + "".join(code for _, code in kinds)),
+            )
+            schema_id = self._schema_ids[key] = len(self._schemas)
+            self._schemas.append(schema)
+        return schema_id
+
+    def append(
+        self,
+        event_type: EventType,
+        agent_id: str,
+        data: dict[str, Any],
+        signature: str = "",
+    ) -> Event:
+        event, _ = self._next_event(event_type, agent_id, data, signature)
+        schema_id = self._schema(event_type, data)
+        intern = self._intern
+        values = [
+            intern(v) if kind == "s" else intern(json.dumps(v)) if kind == "j" else v
+            for kind, v in zip(self._schemas[schema_id].kinds, data.values())
+        ]
+        self._schema_of.append(schema_id)
+        self._agent_of.append(intern(agent_id))
+        self._offsets.append(len(self._data))
+        self._data += self._schemas[schema_id].record.pack(*values)
+        self._chain += event.chain_hash
+        if signature:
+            self._store_signature(signature)
+        self._index(event)
+        self._sequence += 1
+        for listener in self._listeners:
+            listener(event)
+        return event
+
+    def _store_signature(self, signature: str) -> None:
+        raw = b""
+        if len(signature) == 2 * SIGNATURE_BYTES:
+            try:
+                raw = bytes.fromhex(signature)
+            except ValueError:
+                pass
+        if raw and raw.hex() == signature:
+            self._signed.append(self._sequence)
+            self._signatures += raw
+        else:
+            self._other_signatures[self._sequence] = signature
+
+    def _signature(self, sequence: int) -> str:
+        i = bisect_left(self._signed, sequence)
+        if i < len(self._signed) and self._signed[i] == sequence:
+            return self._signatures[i * SIGNATURE_BYTES:(i + 1) * SIGNATURE_BYTES].hex()
+        return self._other_signatures.get(sequence, "")
+
+    def _event_at(self, sequence: int) -> Event:
+        i = sequence - self._base
+        schema = self._schemas[self._schema_of[i]]
+        strings = self._strings
+        data = {
+            key: strings[v] if kind == "s" else json.loads(strings[v]) if kind == "j" else v
+            for key, kind, v in zip(schema.keys, schema.kinds, schema.record.unpack_from(self._data, self._offsets[i]))
+        }
+        return Event(
+            sequence=sequence,
+            timestamp=FIXED_TIMESTAMP,
+            event_type=schema.event_type,
+            agent_id=strings[self._agent_of[i]],
+            data=data,
+            signature=self._signature(sequence),
+            chain_hash=bytes(self._chain[i * HASH_BYTES:(i + 1) * HASH_BYTES]),
+        )
+
+    def __iter__(self) -> Iterator[Event]:
+        return self.iter_range()
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[Event]:
+        stop = self._sequence if stop is None else min(stop, self._sequence)
+        event_at = self._event_at
+        return (event_at(sequence) for sequence in range(max(start, self._base), stop))
+
+    def truncate(self, count: int) -> None:
+        if not self._base <= count <= self._sequence:
+            raise ValueError(f"cannot truncate log of {self._sequence} events to {count}")
+        i = count - self._base
+        if i < len(self._offsets):
+            del self._data[self._offsets[i]:]
+        for column in (self._schema_of, self._agent_of, self._offsets):
+            del column[i:]
+        del self._chain[i * HASH_BYTES:]
+        signed = bisect_left(self._signed, count)
+        del self._signed[signed:]
+        del self._signatures[signed * SIGNATURE_BYTES:]
+        for sequence in [s for s in self._other_signatures if s >= count]:
+            del self._other_signatures[sequence]
+        self._sequence = count
+        self._head = bytes(self._chain[-HASH_BYTES:]) if self._chain else self._base_head
+        self._trim_indexes(count)
+
+    @property
+    def events(self) -> list[Event]:
+        return list(self)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -18,6 +22,57 @@ def derive_keypair(agent_id: str) -> tuple[Ed25519PrivateKey, Ed25519PublicKey]:
     return private_key, private_key.public_key()
 
 
+class KeyRegistry:
+    """LRU memo of derive_keypair, so each seed's keypair is derived at most once.
+
+    Holds the private and public key per seed (the agent id derive_keypair
+    is called with). Only derived keys are held, never keys registered with a
+    kernel, so evicting the least recently used seeds beyond ``maxsize`` just
+    means deriving them again. Kernels reserve() room for the seeds they
+    resolve keys from, so a large run does not keep re-deriving evicted keys.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, seed: str) -> list:
+        # [private_key, public_key]
+        with self._lock:
+            entry = self._entries.get(seed)
+            if entry is not None:
+                self._entries.move_to_end(seed)
+                return entry
+        entry = [*derive_keypair(seed)]
+        with self._lock:
+            self._entries[seed] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def private_key(self, seed: str) -> Ed25519PrivateKey:
+        return self._entry(seed)[0]
+
+    def public_key(self, seed: str) -> Ed25519PublicKey:
+        return self._entry(seed)[1]
+
+    def reserve(self, count: int) -> None:
+        """Grow maxsize, if needed, to hold ``count`` seeds."""
+        if count > self.maxsize:
+            self.maxsize = count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, seed: str) -> bool:
+        return seed in self._entries
+
+
+# Process-wide memo of derived keys; kernels keep registered keys themselves
+KEY_REGISTRY = KeyRegistry()
+
+
 def sign(private_key: Ed25519PrivateKey, data: bytes) -> bytes:
     return private_key.sign(data)
 
@@ -28,3 +83,21 @@ def verify(public_key: Ed25519PublicKey, data: bytes, signature: bytes) -> bool:
         return True
     except Exception:
         return False
+
+
+def verify_many(
+    items: Sequence[tuple[Ed25519PublicKey, bytes, bytes]],
+    workers: int = 0,
+) -> list[bool]:
+    """Verify (public_key, data, signature) triples, in order.
+
+    With workers > 1 the triples are split into contiguous chunks and checked
+    on a thread pool; results are returned in input order either way.
+    """
+    if workers <= 1 or len(items) < 2:
+        return [verify(pub, data, sig) for pub, data, sig in items]
+    size = -(-len(items) // workers)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(verify_many, chunks)
+    return [ok for chunk in results for ok in chunk]
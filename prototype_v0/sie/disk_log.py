@@ -0,0 +1,331 @@
+"""
+Disk-backed event log.
+
+Events are written to rolling segment files as they are appended, one
+length-prefixed record per event: little-endian u32 length, the 32-byte chain
+hash, then the event's compact JSON from ``Event.encode``. Segment files are named after the
+sequence number of their first event. Reads memory-map the segments and
+decode records on the fly, so no Event objects are kept resident. The only
+per-event memory is the record offset table and the agent/type indexes,
+eight bytes per entry each.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sie.event_log import GENESIS_HASH, EventLog, chain_hash
+from sie.types import Event, EventType
+
+RECORD_HEADER = struct.Struct("<I32s")
+SEQUENCE_PREFIX = b'{"sequence":'
+SEGMENT_BYTES = 64 * 1024 * 1024
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+
+
+def segment_name(first_sequence: int) -> str:
+    return f"{SEGMENT_PREFIX}{first_sequence:012d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str) -> list[tuple[int, str]]:
+    """(first_sequence, path) for every segment in the directory, in order."""
+    segments = []
+    for name in os.listdir(directory):
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+            first = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            segments.append((first, os.path.join(directory, name)))
+    segments.sort()
+    return segments
+
+
+def iter_records(buf: mmap.mmap | bytes, end: int | None = None, pos: int = 0) -> Iterator[tuple[int, int]]:
+    """(start, stop) byte spans of the complete records' JSON in a segment buffer.
+
+    ``pos`` must be the offset of a record header; ``end`` bounds the scan.
+    """
+    end = len(buf) if end is None else end
+    while pos + RECORD_HEADER.size <= end:
+        length, _ = RECORD_HEADER.unpack_from(buf, pos)
+        start = pos + RECORD_HEADER.size
+        if start + length > end:
+            break
+        yield start, start + length
+        pos = start + length
+
+
+def read_range(directory: str, start: int, stop: int, needle: bytes | None = None) -> Iterator[Event]:
+    """Events with start <= sequence < stop, read straight from the segment files.
+
+    Needs no open DiskEventLog (and builds no indexes), so other processes
+    can stream parts of a log. Records before ``start`` are skipped by their
+    sequence prefix without decoding; with ``needle``, only records containing
+    that byte string are decoded.
+    """
+    segments = list_segments(directory)
+    firsts = [first for first, _ in segments]
+    index = max(bisect_right(firsts, start) - 1, 0)
+    for first, path in segments[index:]:
+        if first >= stop:
+            return
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                sequence = first
+                for rec_start, rec_stop in iter_records(buf):
+                    if sequence >= stop:
+                        return
+                    if sequence >= start and (needle is None or buf.find(needle, rec_start, rec_stop) >= 0):
+                        yield Event.from_dict(json.loads(buf[rec_start:rec_stop]), buf[rec_start - 32:rec_start])
+                    sequence += 1
+
+
+class DiskEventLog(EventLog):
+    """Append-only EventLog persisted to segment files under ``directory``.
+
+    Reopening a directory that already holds segments rebuilds the offset
+    table and indexes, then resumes after the last complete record; a torn
+    trailing record is truncated away, along with any empty segments rolled
+    after it. ``events`` is a lazy view that decodes events as they are read.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = SEGMENT_BYTES) -> None:
+        super().__init__()
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._segments: list[tuple[int, str]] = list_segments(directory)
+        self._segment_starts: list[int] = [first for first, _ in self._segments]
+        # Byte offset of each record within its segment, indexed by sequence
+        self._offsets: array[int] = array("Q")
+        self._maps: dict[int, mmap.mmap] = {}
+        self._writer: Any = None
+        self._segment_size = 0
+        if self._segments:
+            self._recover()
+
+    def _recover(self) -> None:
+        segments = self._segments
+        for i, (first, path) in enumerate(segments):
+            if first != self._sequence:
+                raise ValueError(f"segment {path} does not continue at sequence {self._sequence}")
+            with open(path, "rb") as f:
+                data = f.read()
+            valid = 0
+            for start, stop in iter_records(data):
+                event = Event.from_dict(json.loads(data[start:stop]))
+                self._offsets.append(start)
+                self._index(event)
+                self._sequence += 1
+                self._head = data[start - 32:start]
+                valid = stop
+            if valid != len(data):
+                # A torn record ends the log; segments rolled after it (by a
+                # crash mid-rollover) may only be empty
+                later = segments[i + 1:]
+                if any(os.path.getsize(later_path) for _, later_path in later):
+                    raise ValueError(f"segment {path} ends in a torn record but later segments hold events")
+                for _, later_path in later:
+                    os.remove(later_path)
+                del segments[i + 1:]
+                del self._segment_starts[i + 1:]
+                with open(path, "r+b") as f:
+                    f.truncate(valid)
+                break
+        self._segment_size = valid
+        self._writer = open(path, "ab")
+
+    def _roll(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        path = os.path.join(self.directory, segment_name(self._sequence))
+        self._segments.append((self._sequence, path))
+        self._segment_starts.append(self._sequence)
+        self._writer = open(path, "wb")
+        self._segment_size = 0
+
+    def append(
+        self,
+        event_type: EventType,
+        agent_id: str,
+        data: dict[str, Any],
+        signature: str = "",
+    ) -> Event:
+        event, record = self._next_event(event_type, agent_id, data, signature)
+        size = RECORD_HEADER.size + len(record)
+        if self._writer is None or (self._segment_size and self._segment_size + size > self.segment_bytes):
+            self._roll()
+        self._writer.write(RECORD_HEADER.pack(len(record), event.chain_hash))
+        self._writer.write(record)
+        self._offsets.append(self._segment_size + RECORD_HEADER.size)
+        self._segment_size += size
+        self._index(event)
+        self._sequence += 1
+        for listener in self._listeners:
+            listener(event)
+        return event
+
+    def resume(self, checkpoint: tuple[int, bytes]) -> None:
+        """Not supported: segment files always start from sequence 0.
+
+        To continue a run from a snapshot, reopen the directory that run
+        logged to; Kernel.restore truncates it back to the snapshot position.
+        """
+        raise ValueError("a DiskEventLog cannot start mid-log; reopen the snapshotted run's log directory instead")
+
+    def truncate(self, count: int) -> None:
+        """Drop every event with sequence >= count, deleting or cutting segment files."""
+        if not 0 <= count <= self._sequence:
+            raise ValueError(f"cannot truncate log of {self._sequence} events to {count}")
+        if count == self._sequence:
+            return
+        self.close()
+        segment = bisect_right(self._segment_starts, count) - 1
+        keep = segment if self._segment_starts[segment] == count else segment + 1
+        for _, path in self._segments[keep:]:
+            os.remove(path)
+        del self._segments[keep:]
+        del self._segment_starts[keep:]
+        if keep > segment:
+            with open(self._segments[segment][1], "r+b") as f:
+                f.truncate(self._offsets[count] - RECORD_HEADER.size)
+
+        del self._offsets[count:]
+        self._trim_indexes(count)
+        self._sequence = count
+        self._head = GENESIS_HASH
+        self._segment_size = 0
+        if self._segments:
+            path = self._segments[-1][1]
+            with open(path, "rb") as f:
+                f.seek(self._offsets[count - 1] - 32)
+                self._head = f.read(32)
+            self._segment_size = os.path.getsize(path)
+            self._writer = open(path, "ab")
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        for buf in self._maps.values():
+            buf.close()
+        self._maps.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> DiskEventLog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _map(self, segment: int) -> mmap.mmap:
+        """Mapping of one segment; the active segment is remapped once it grows."""
+        buf = self._maps.get(segment)
+        active = segment == len(self._segments) - 1
+        if buf is not None and not (active and len(buf) < self._segment_size):
+            return buf
+        # A superseded mapping may still back a running iterator; let it be
+        # released when the last reference goes away.
+        if active:
+            self.flush()
+        with open(self._segments[segment][1], "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[segment] = buf
+        return buf
+
+    def _event_at(self, sequence: int) -> Event:
+        segment = bisect_right(self._segment_starts, sequence) - 1
+        buf = self._map(segment)
+        start = self._offsets[sequence]
+        length, chain = RECORD_HEADER.unpack_from(buf, start - RECORD_HEADER.size)
+        return Event.from_dict(json.loads(buf[start:start + length]), chain)
+
+    def _raw_records(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[bytes, bytes]]:
+        """(stored chain hash, JSON bytes) per record with start <= sequence < stop."""
+        stop = self._sequence if stop is None else min(stop, self._sequence)
+        sequence = start
+        while sequence < stop:
+            segment = bisect_right(self._segment_starts, sequence) - 1
+            buf = self._map(segment)
+            end = self._segment_size if segment == len(self._segments) - 1 else len(buf)
+            pos = self._offsets[sequence] - RECORD_HEADER.size
+            before = sequence
+            for rec_start, rec_stop in iter_records(buf, end, pos):
+                yield buf[rec_start - 32:rec_start], buf[rec_start:rec_stop]
+                sequence += 1
+                if sequence >= stop:
+                    return
+            if sequence == before:
+                return  # torn segment; callers see the shortfall
+
+    def __iter__(self) -> Iterator[Event]:
+        return self.iter_range()
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[Event]:
+        for chain, raw in self._raw_records(start, stop):
+            yield Event.from_dict(json.loads(raw), chain)
+
+    def verify_chain(self, checkpoint: tuple[int, bytes] | None = None) -> bool:
+        """Hash the stored record bytes directly, without decoding events.
+
+        Sequence contiguity is read from each record's leading
+        ``{"sequence":N,`` field.
+        """
+        start, head = checkpoint if checkpoint is not None else (0, GENESIS_HASH)
+        expected = start
+        for stored, raw in self._raw_records(start):
+            if raw[:len(SEQUENCE_PREFIX)] != SEQUENCE_PREFIX:
+                return False
+            comma = raw.find(b",", 0, 32)
+            if comma < 0 or int(raw[len(SEQUENCE_PREFIX):comma]) != expected:
+                return False
+            head = chain_hash(head, raw)
+            if head != stored:
+                return False
+            expected += 1
+        return expected == self._sequence
+
+    @property
+    def events(self) -> EventsView:  # type: ignore[override]
+        return EventsView(self, self._sequence)
+
+
+class EventsView(Sequence[Event]):
+    """The first ``count`` events of a DiskEventLog, decoded when read.
+
+    Stands in for EventLog.events' list copy: indexing reads one record,
+    slicing and iteration stream through iter_range.
+    """
+
+    def __init__(self, log: DiskEventLog, count: int) -> None:
+        self._log = log
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return list(self._log.iter_range(start, max(start, stop)))
+            return [self._log._event_at(i) for i in range(start, stop, step)]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event index out of range")
+        return self._log._event_at(index)
+
+    def __iter__(self) -> Iterator[Event]:
+        return self._log.iter_range(0, self._count)
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any
+import os
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+from typing import Any, TextIO
 
 from sie.types import Event, EventType
 
 # Fixed deterministic timestamp for reproducibility
 FIXED_TIMESTAMP = "2025-01-01T00:00:00Z"
 
+# Chain hash preceding the first event
+GENESIS_HASH = bytes(32)
+
+
+def chain_hash(prev: bytes, record: bytes) -> bytes:
+    h = hashlib.blake2b(prev, digest_size=32)
+    h.update(record)
+    return h.digest()
+
 
 class EventLog:
     def __init__(self) -> None:
         self._events: list[Event] = []
         self._sequence: int = 0
+        self._head: bytes = GENESIS_HASH
+        # A resumed log holds only the events from _base on; _base_head is
+        # the chain hash preceding them
+        self._base = 0
+        self._base_head: bytes = GENESIS_HASH
+        # Secondary indexes: sequence numbers per agent and per event type
+        self._by_agent: dict[str, array[int]] = {}
+        self._by_type: dict[EventType, array[int]] = {t: array("q") for t in EventType}
+        self._listeners: list[Callable[[Event], None]] = []
 
     def append(
         self,
@@ -21,6 +46,34 @@ class EventLog:
         data: dict[str, Any],
         signature: str = "",
     ) -> Event:
+        event, _ = self._next_event(event_type, agent_id, data, signature)
+        self._events.append(event)
+        self._index(event)
+        self._sequence += 1
+        for listener in self._listeners:
+            listener(event)
+        return event
+
+    def _next_event(
+        self,
+        event_type: EventType,
+        agent_id: str,
+        data: dict[str, Any],
+        signature: str,
+    ) -> tuple[Event, bytes]:
+        """Build the next event and its encoded record, advancing the chain head."""
+        record = json.dumps(
+            {
+                "sequence": self._sequence,
+                "timestamp": FIXED_TIMESTAMP,
+                "event_type": event_type.value,
+                "agent_id": agent_id,
+                "data": data,
+                "signature": signature,
+            },
+            separators=(",", ":"),
+        ).encode()
+        self._head = chain_hash(self._head, record)
         event = Event(
             sequence=self._sequence,
             timestamp=FIXED_TIMESTAMP,
@@ -28,10 +81,98 @@ class EventLog:
             agent_id=agent_id,
             data=data,
             signature=signature,
+            chain_hash=self._head,
         )
-        self._events.append(event)
-        self._sequence += 1
-        return event
+        return event, record
+
+    def subscribe(self, listener: Callable[[Event], None]) -> None:
+        """Call listener with every event appended from now on."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[Event], None]) -> None:
+        self._listeners.remove(listener)
+
+    def _index(self, event: Event) -> None:
+        positions = self._by_agent.get(event.agent_id)
+        if positions is None:
+            positions = self._by_agent[event.agent_id] = array("q")
+        positions.append(event.sequence)
+        self._by_type[event.event_type].append(event.sequence)
+
+    def _event_at(self, sequence: int) -> Event:
+        return self._events[sequence - self._base]
+
+    def _select(self, positions: Sequence[int], start: int | None, stop: int | None) -> list[Event]:
+        lo = 0 if start is None else bisect_left(positions, start)
+        hi = len(positions) if stop is None else bisect_left(positions, stop)
+        event_at = self._event_at
+        return [event_at(seq) for seq in positions[lo:hi]]
+
+    def __len__(self) -> int:
+        return self._sequence
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[Event]:
+        """Events with start <= sequence < stop, in order."""
+        base = self._base
+        return islice(self._events, max(start - base, 0), None if stop is None else max(stop - base, 0))
+
+    @property
+    def head(self) -> bytes:
+        """Chain hash of the last appended event."""
+        return self._head
+
+    @property
+    def origin(self) -> tuple[int, bytes]:
+        """(sequence, chain hash) the held events continue from."""
+        return self._base, self._base_head
+
+    def checkpoint(self) -> tuple[int, bytes]:
+        """(event count, chain head); pass to verify_chain to resume from here."""
+        return self._sequence, self._head
+
+    def resume(self, checkpoint: tuple[int, bytes]) -> None:
+        """Continue an empty log from another log's checkpoint.
+
+        The next event gets sequence ``count`` and chains onto ``head``; the
+        earlier events are not held, so queries only see the resumed tail.
+        """
+        if self._sequence:
+            raise ValueError("only an empty log can be resumed")
+        self._base = self._sequence = checkpoint[0]
+        self._base_head = self._head = checkpoint[1]
+
+    def truncate(self, count: int) -> None:
+        """Drop every event with sequence >= count."""
+        if not self._base <= count <= self._sequence:
+            raise ValueError(f"cannot truncate log of {self._sequence} events to {count}")
+        del self._events[count - self._base:]
+        self._sequence = count
+        self._head = self._events[-1].chain_hash if self._events else self._base_head
+        self._trim_indexes(count)
+
+    def _trim_indexes(self, count: int) -> None:
+        for positions in (*self._by_agent.values(), *self._by_type.values()):
+            del positions[bisect_left(positions, count):]
+
+    def verify_chain(self, checkpoint: tuple[int, bytes] | None = None) -> bool:
+        """Recompute the hash chain in one pass and compare it with every event.
+
+        Also fails on a sequence gap. A checkpoint taken earlier (and trusted)
+        skips re-hashing the events before it.
+        """
+        start, head = checkpoint if checkpoint is not None else (self._base, self._base_head)
+        expected = start
+        for e in self.iter_range(start):
+            if e.sequence != expected:
+                return False
+            head = chain_hash(head, e.encode())
+            if head != e.chain_hash:
+                return False
+            expected += 1
+        return expected == self._sequence
 
     @property
     def events(self) -> list[Event]:
@@ -39,13 +180,104 @@ class EventLog:
 
     def to_json(self) -> str:
         return json.dumps(
-            [e.to_dict() for e in self._events],
+            [e.to_dict() for e in self],
             indent=2,
             sort_keys=False,
         )
 
-    def events_for_agent(self, agent_id: str) -> list[Event]:
-        return [e for e in self._events if e.agent_id == agent_id]
+    def write_json(self, fp: TextIO) -> None:
+        """Stream the exact to_json() document into fp, one event at a time.
+
+        Each event is dumped on its own at indent=2 and shifted one level in,
+        which is what json.dumps produces for it as a list element.
+        """
+        fp.write("[")
+        first = True
+        for e in self:
+            fp.write("\n  " if first else ",\n  ")
+            fp.write(json.dumps(e.to_dict(), indent=2).replace("\n", "\n  "))
+            first = False
+        fp.write("]" if first else "\n]")
+
+    def write_ndjson(self, fp: TextIO) -> None:
+        """One compact JSON event per line."""
+        for e in self:
+            fp.write(ndjson_line(e))
+
+    def write_columnar(self, directory: str) -> None:
+        """Round-partitioned .npy columns for offline analytics (see sie.columnar; needs numpy)."""
+        from sie.columnar import write_columnar
+
+        write_columnar(self, directory)
+
+    def events_for_agent(self, agent_id: str, start: int | None = None, stop: int | None = None) -> list[Event]:
+        """Events for one agent with start <= sequence < stop, via the agent index."""
+        return self._select(self._by_agent.get(agent_id, ()), start, stop)
+
+    def events_of_type(self, event_type: EventType, start: int | None = None, stop: int | None = None) -> list[Event]:
+        """Events of one type with start <= sequence < stop, via the type index."""
+        return self._select(self._by_type[event_type], start, stop)
+
+    def sequences_of_type(self, event_type: EventType) -> Sequence[int]:
+        """Sorted sequence numbers of one event type (the live index; do not mutate)."""
+        return self._by_type[event_type]
+
+
+def ndjson_line(event: Event) -> str:
+    return json.dumps(event.to_dict(), separators=(",", ":")) + "\n"
+
+
+class NdjsonTail:
+    """Mirror a log into an NDJSON file while the simulation is running.
+
+    Writes the events already in the log, then every appended event. The file
+    is flushed every ``flush_every`` events and at each round boundary, so a
+    reader using ``follow_ndjson`` sees whole rounds promptly.
+    """
+
+    FLUSH_ON = (EventType.ROUND_END, EventType.SIMULATION_COMPLETE)
+
+    def __init__(self, log: EventLog, fp: TextIO, flush_every: int = 256) -> None:
+        self.log = log
+        self.fp = fp
+        self.flush_every = flush_every
+        self._unflushed = 0
+        log.write_ndjson(fp)
+        fp.flush()
+        log.subscribe(self)
+
+    def __call__(self, event: Event) -> None:
+        self.fp.write(ndjson_line(event))
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every or event.event_type in self.FLUSH_ON:
+            self.fp.flush()
+            self._unflushed = 0
+
+    def close(self) -> None:
+        self.log.unsubscribe(self)
+        self.fp.flush()
+
+
+def follow_ndjson(path: str, poll_interval: float = 0.1, until_complete: bool = True) -> Iterator[Event]:
+    """Yield events from an NDJSON log as they are written (like ``tail -f``).
 
-    def events_of_type(self, event_type: EventType) -> list[Event]:
-        return [e for e in self._events if e.event_type == event_type]
+    Waits for the file to appear. Stops after SIMULATION_COMPLETE unless
+    until_complete is False, in which case it follows forever.
+    """
+    while not os.path.exists(path):
+        time.sleep(poll_interval)
+    with open(path) as f:
+        partial = ""
+        while True:
+            line = f.readline()
+            if not line:
+                time.sleep(poll_interval)
+                continue
+            if not line.endswith("\n"):
+                partial += line
+                continue
+            event = Event.from_dict(json.loads(partial + line))
+            partial = ""
+            yield event
+            if until_complete and event.event_type == EventType.SIMULATION_COMPLETE:
+                return
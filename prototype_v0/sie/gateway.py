@@ -0,0 +1,303 @@
+"""
+Asyncio intent gateway for out-of-process agents.
+
+Clients connect over a Unix domain socket or localhost TCP and send framed,
+signed intents; requests may be pipelined. Every frame is a u32
+little-endian length followed by the body. A request body is the agent_id as
+u16-length-prefixed UTF-8, the 64-byte Ed25519 signature over the intent's
+canonical JSON, then the intent in IntentPayload wire format. Each request
+gets a one-byte status frame, in request order per connection.
+
+Signatures are verified in a thread pool, off the event loop, where a new
+agent's key is derived too. A single sequencer task applies intents to the
+Kernel strictly in arrival order, so the log is a deterministic function of
+that order. At most ``max_pending``
+intents may be queued or in verification; beyond that the gateway stops
+reading from its sockets and clients see TCP/socket backpressure.
+
+Run a server:   python -m sie.gateway serve --port 8765 --agents 100
+Generate load:  python -m sie.gateway load --port 8765 --agents 100 --intents 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from sie.crypto import KEY_REGISTRY, sign, verify
+from sie.event_log import EventLog
+from sie.kernel import Kernel
+from sie.main import TASKS
+from sie.types import IntentPayload
+
+FRAME_HEADER = struct.Struct("<I")
+AGENT_ID_LENGTH = struct.Struct("<H")
+SIGNATURE_BYTES = 64
+MAX_FRAME = 64 * 1024
+
+STATUS_REJECTED = 0
+STATUS_ACCEPTED = 1
+STATUS_MALFORMED = 2
+STATUS_UNKNOWN_AGENT = 3
+
+MAX_PENDING = 1024
+VERIFY_WORKERS = 4
+
+
+def encode_request(agent_id: str, intent: IntentPayload, signature: bytes) -> bytes:
+    raw_id = agent_id.encode()
+    body = AGENT_ID_LENGTH.pack(len(raw_id)) + raw_id + signature + intent.to_wire()
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def decode_request(body: bytes) -> tuple[str, IntentPayload, bytes]:
+    if len(body) < AGENT_ID_LENGTH.size:
+        raise ValueError("truncated request")
+    (id_length,) = AGENT_ID_LENGTH.unpack_from(body)
+    sig_start = AGENT_ID_LENGTH.size + id_length
+    intent_start = sig_start + SIGNATURE_BYTES
+    if len(body) < intent_start:
+        raise ValueError("truncated request")
+    agent_id = body[AGENT_ID_LENGTH.size:sig_start].decode()
+    return agent_id, IntentPayload.from_wire(body[intent_start:]), body[sig_start:intent_start]
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    """The next frame body, or None at a clean end of stream."""
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if e.partial:
+            raise
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes exceeds {MAX_FRAME}")
+    return await reader.readexactly(length)
+
+
+class IntentGateway:
+    """Serves one Kernel to many concurrent clients."""
+
+    def __init__(self, kernel: Kernel, workers: int = VERIFY_WORKERS, max_pending: int = MAX_PENDING) -> None:
+        self.kernel = kernel
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._slots: asyncio.Semaphore | None = None
+        self._queue: asyncio.Queue[Any] | None = None
+        self._sequencer: asyncio.Task[None] | None = None
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, path: str | None = None, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Listen on a Unix socket at ``path``, or on host:port (0 picks a free port)."""
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._queue = asyncio.Queue()
+        self._sequencer = asyncio.create_task(self._sequence())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server
+
+    @property
+    def address(self) -> Any:
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()
+
+    async def close(self) -> None:
+        """Stop accepting, apply every intent already queued, then shut down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._queue is not None and self._sequencer is not None:
+            await self._queue.join()
+            self._sequencer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sequencer
+        self._pool.shutdown()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        responses: asyncio.Queue[asyncio.Future[int] | None] = asyncio.Queue()
+        responder = asyncio.create_task(self._respond(responses, writer))
+        try:
+            while (body := await read_frame(reader)) is not None:
+                responses.put_nowait(await self._submit(body))
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass  # protocol error or dropped connection: stop reading
+        finally:
+            responses.put_nowait(None)
+            await responder
+            writer.close()
+
+    async def _respond(self, responses: asyncio.Queue[asyncio.Future[int] | None], writer: asyncio.StreamWriter) -> None:
+        while (future := await responses.get()) is not None:
+            status = await future
+            try:
+                writer.write(FRAME_HEADER.pack(1) + bytes((status,)))
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def _submit(self, body: bytes) -> asyncio.Future[int]:
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        try:
+            agent_id, intent, signature = decode_request(body)
+        except (ValueError, UnicodeDecodeError):
+            done.set_result(STATUS_MALFORMED)
+            return done
+        if agent_id not in self.kernel.agents:
+            done.set_result(STATUS_UNKNOWN_AGENT)
+            return done
+
+        assert self._slots is not None and self._queue is not None
+        await self._slots.acquire()
+        verified = loop.run_in_executor(self._pool, self._verify, agent_id, intent.serialize(), signature)
+        self._queue.put_nowait((agent_id, intent, signature, verified, done))
+        return done
+
+    def _verify(self, agent_id: str, payload: bytes, signature: bytes) -> bool:
+        """Runs on the pool: a new agent's key is derived there too, off the event loop."""
+        return verify(self.kernel.public_key(agent_id), payload, signature)
+
+    async def _sequence(self) -> None:
+        assert self._slots is not None and self._queue is not None
+        while True:
+            agent_id, intent, signature, verified, done = await self._queue.get()
+            try:
+                accepted = self.kernel.process_intent(agent_id, intent, signature, await verified)
+                done.set_result(STATUS_ACCEPTED if accepted else STATUS_REJECTED)
+            except Exception as e:
+                done.set_exception(e)
+            finally:
+                self._slots.release()
+                self._queue.task_done()
+
+
+class GatewayClient:
+    """Pipelining client: submit() sends immediately; results arrive in order."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, path: str | None = None, host: str = "127.0.0.1", port: int = 0) -> GatewayClient:
+        if path is not None:
+            return cls(*await asyncio.open_unix_connection(path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def send(self, agent_id: str, intent: IntentPayload, signature: bytes) -> None:
+        self._writer.write(encode_request(agent_id, intent, signature))
+        await self._writer.drain()
+
+    async def status(self) -> int:
+        body = await read_frame(self._reader)
+        if body is None:
+            raise ConnectionError("gateway closed the connection")
+        return body[0]
+
+    async def submit(self, agent_id: str, intent: IntentPayload, signature: bytes) -> int:
+        await self.send(agent_id, intent, signature)
+        return await self.status()
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+def load_agent_ids(count: int) -> list[str]:
+    return [f"load-{i}" for i in range(count)]
+
+
+def build_gateway_kernel(num_agents: int, log: EventLog | None = None) -> Kernel:
+    """Kernel with the standard tasks and ``num_agents`` load-generator agents."""
+    kernel = Kernel(log if log is not None else EventLog())
+    for task in TASKS:
+        kernel.register_task(task)
+    for agent_id in load_agent_ids(num_agents):
+        kernel.register_agent(agent_id, None, 100.0)
+    return kernel
+
+
+async def generate_load(
+    num_agents: int,
+    intents_per_agent: int,
+    window: int = 64,
+    path: str | None = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> dict[int, int]:
+    """One pipelining connection per load agent; returns a count per status.
+
+    Each agent keeps up to ``window`` requests in flight. The intent is
+    request_escalation on a tier-0 task, which is accepted without changing
+    agent state, so the load can run indefinitely.
+    """
+    intent = IntentPayload(action="request_escalation", task_id=TASKS[0].task_id, detail="")
+
+    async def run_agent(agent_id: str) -> list[int]:
+        signature = sign(KEY_REGISTRY.private_key(agent_id), intent.serialize())
+        client = await GatewayClient.connect(path, host, port)
+        statuses = []
+        in_flight = 0
+        for _ in range(intents_per_agent):
+            if in_flight == window:
+                statuses.append(await client.status())
+                in_flight -= 1
+            await client.send(agent_id, intent, signature)
+            in_flight += 1
+        for _ in range(in_flight):
+            statuses.append(await client.status())
+        await client.close()
+        return statuses
+
+    counts: dict[int, int] = {}
+    for statuses in await asyncio.gather(*(run_agent(a) for a in load_agent_ids(num_agents))):
+        for status in statuses:
+            counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("mode", choices=("serve", "load"))
+    parser.add_argument("--socket", help="Unix socket path (default: TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--intents", type=int, default=1000, help="intents per agent (load)")
+    parser.add_argument("--window", type=int, default=64, help="requests in flight per agent (load)")
+    parser.add_argument("--workers", type=int, default=VERIFY_WORKERS)
+    parser.add_argument("--max-pending", type=int, default=MAX_PENDING)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        async def serve() -> None:
+            gateway = IntentGateway(build_gateway_kernel(args.agents), args.workers, args.max_pending)
+            server = await gateway.start(args.socket, args.host, args.port)
+            print(f"Serving {args.agents} agents on {gateway.address}")
+            try:
+                await server.serve_forever()
+            finally:
+                await gateway.close()
+                print(f"Total events: {len(gateway.kernel.log)}")
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+    else:
+        t0 = time.perf_counter()
+        counts = asyncio.run(generate_load(args.agents, args.intents, args.window, args.socket, args.host, args.port))
+        elapsed = time.perf_counter() - t0
+        total = sum(counts.values())
+        print(f"intents={total:,}  time={elapsed:.2f}s  rate={total / elapsed:,.0f} intents/s  statuses={counts}")
+
+
+if __name__ == "__main__":
+    main()
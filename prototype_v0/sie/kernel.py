@@ -1,7 +1,14 @@
 from __future__ import annotations
 
-from sie.crypto import verify
+import json
+import struct
+from collections.abc import Callable, MutableMapping, Sequence
+from dataclasses import asdict, fields
+from typing import TYPE_CHECKING, Any
+
+from sie.crypto import KEY_REGISTRY, verify, verify_many
 from sie.event_log import EventLog
+from sie.policy import Policy
 from sie.systems import budget, escalation, reputation, sandbox, tier, validation
 from sie.systems.influence import InfluenceQueue
 from sie.systems.task import TaskRegistry, assign_task, record_step
@@ -9,23 +16,101 @@ from sie.types import AgentState, EventType, IntentPayload, Task
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
+if TYPE_CHECKING:
+    from sie.agent_store import AgentStore
+    from sie.agents.base import BaseAgent
+
+# Kernel.snapshot format: magic, u8 version, then UTF-8 JSON of plain data
+SNAPSHOT_MAGIC = b"SIESNAP"
+SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEADER = struct.Struct("<7sB")
+# Top-level snapshot keys and the JSON type of each
+SNAPSHOT_FIELDS = {
+    "log": list,
+    "next_round": int,
+    "policy": dict,
+    "tasks": list,
+    "agents": list,
+    "public_keys": dict,
+    "key_seeds": dict,
+    "influence_queue": list,
+    "agent_snapshots": dict,
+}
+AGENT_FIELDS = tuple(f.name for f in fields(AgentState))
+
+# A handler routes one verified, logged intent: (kernel, state, task, intent) -> accepted
+Handler = Callable[["Kernel", AgentState, "Task | None", IntentPayload], bool]
+
+# Called with each process_intent stage name as the stage starts ("gate.ban",
+# "gate.sandbox", "verify", "log_intent", "handler") and with None when the
+# intent is done; see sie.metrics
+StageHook = Callable[["str | None", IntentPayload], None]
+
+
+# test_boundary detail -> violation reason; any other detail is recorded as
+# "boundary_test_<detail>". access_privileged only counts as a tier violation
+# when the tier check fails.
+BOUNDARY_POLICY = {
+    "access_privileged": "boundary_test_tier",
+    "act_while_sandboxed": "boundary_test_sandbox",
+    "forge_signature": "boundary_test_forgery",
+    "exceed_budget": "boundary_test_budget",
+}
+
 
 class Kernel:
-    def __init__(self, log: EventLog) -> None:
+    def __init__(self, log: EventLog, store: AgentStore | None = None, policy: Policy | None = None) -> None:
         self.log = log
-        self.agents: dict[str, AgentState] = {}
+        # Governance constants; defaults to the module-level values
+        self.policy = policy if policy is not None else Policy.current()
+        # With a columnar store, agents maps agent_id -> AgentView over its rows
+        self.store = store
+        self.agents: MutableMapping[str, AgentState] = {} if store is None else store
         self.public_keys: dict[str, Ed25519PublicKey] = {}
+        # Agents registered without a key: agent_id -> the derive_keypair seed
+        # their key comes from, resolved into public_keys on first use
+        self.key_seeds: dict[str, str] = {}
         self.task_registry = TaskRegistry()
         self.influence_queue = InfluenceQueue()
-
-    def register_agent(self, agent_id: str, public_key: Ed25519PublicKey, initial_budget: float) -> AgentState:
-        state = AgentState(agent_id=agent_id)
-        self.agents[agent_id] = state
-        self.public_keys[agent_id] = public_key
+        # Agents owned by other kernels (see sie.sharding). Influence provided
+        # to them is half-applied here and the rest queued in outbox.
+        self.remote_agents: frozenset[str] = frozenset()
+        self.outbox: list[tuple[str, str, str, str]] = []
+        self.handlers: dict[str, Handler] = dict(ACTION_HANDLERS)
+        self.stage_hook: StageHook | None = None
+        # Signature checks done ahead of time, keyed by (agent_id, payload,
+        # signature); see sie.speculation, which clears it every round.
+        self.preverified: dict[tuple[str, bytes, bytes], bool] = {}
+
+    def register_agent(self, agent_id: str, public_key: Ed25519PublicKey | None, initial_budget: float) -> AgentState:
+        """Register an agent. With public_key=None the agent's key is the one
+        derived from its agent_id, fixed here and derived the first time one
+        of its intents is verified.
+        """
+        if self.store is not None:
+            state = self.store.add(agent_id)
+        else:
+            state = AgentState(agent_id=agent_id)
+            self.agents[agent_id] = state
+        if public_key is not None:
+            self.public_keys[agent_id] = public_key
+        else:
+            self.key_seeds[agent_id] = agent_id
+            KEY_REGISTRY.reserve(len(self.key_seeds))
         self.log.append(EventType.AGENT_REGISTERED, agent_id, {"initial_budget": initial_budget})
         budget.allocate(state, initial_budget, self.log)
         return state
 
+    def register_handler(self, action: str, handler: Handler) -> None:
+        """Route ``action`` to handler on this kernel, replacing any existing handler."""
+        self.handlers[action] = handler
+
+    def public_key(self, agent_id: str) -> Ed25519PublicKey:
+        public_key = self.public_keys.get(agent_id)
+        if public_key is None:
+            public_key = self.public_keys[agent_id] = KEY_REGISTRY.public_key(self.key_seeds[agent_id])
+        return public_key
+
     def register_task(self, task: Task) -> None:
         self.task_registry.register(task)
 
@@ -35,26 +120,67 @@ class Kernel:
         if t is not None:
             assign_task(state, t, self.log)
 
-    def process_intent(self, agent_id: str, intent: IntentPayload, signature: bytes) -> bool:
+    def process_intent(
+        self,
+        agent_id: str,
+        intent: IntentPayload,
+        signature: bytes,
+        verified: bool | None = None,
+    ) -> bool:
+        """Gate, verify, log and route one signed intent.
+
+        ``verified`` carries a signature check already done by the caller
+        (see ``process_intents``); None verifies here, unless the check is in
+        ``preverified``. A ``stage_hook`` is told as each stage starts.
+        """
+        hook = self.stage_hook
+        if hook is None:
+            return self._process_intent(agent_id, intent, signature, verified, None)
+        try:
+            return self._process_intent(agent_id, intent, signature, verified, hook)
+        finally:
+            hook(None, intent)
+
+    def _process_intent(
+        self,
+        agent_id: str,
+        intent: IntentPayload,
+        signature: bytes,
+        verified: bool | None,
+        hook: StageHook | None,
+    ) -> bool:
         state = self.agents[agent_id]
 
         # Gate 1: Ban check
+        if hook is not None:
+            hook("gate.ban", intent)
         if state.banned:
             self.log.append(EventType.INTENT_DENIED, agent_id, {"reason": "banned", "action": intent.action})
             return False
 
         # Gate 2: Sandbox check
+        if hook is not None:
+            hook("gate.sandbox", intent)
         if state.sandboxed and not escalation.check_sandbox(state, intent.action, self.log):
             return False
 
         # Gate 3: Signature verification
-        pub = self.public_keys[agent_id]
-        if not verify(pub, intent.serialize(), signature):
+        if hook is not None:
+            hook("verify", intent)
+        if verified is None:
+            public_key = self.public_key(agent_id)
+            if self.preverified:
+                verified = self.preverified.get((agent_id, intent.serialize(), signature))
+            if verified is None:
+                verified = verify(public_key, intent.serialize(), signature)
+        if not verified:
             self.log.append(EventType.SIGNATURE_INVALID, agent_id, {"action": intent.action})
-            sandbox.record_violation(state, "invalid_signature", self.log)
+            self._record_violation(state, "invalid_signature")
             return False
 
         # Log the intent
+        if hook is not None:
+            hook("log_intent", intent)
         self.log.append(
             EventType.INTENT_SUBMITTED,
             agent_id,
@@ -63,24 +189,48 @@ class Kernel:
         )
 
         # Route by action
-        action = intent.action
-        task = self.task_registry.get(intent.task_id) if intent.task_id else None
-
-        if action == "work_step":
-            return self._handle_work_step(state, task, intent)
-        elif action == "submit_result":
-            return self._handle_submit(state, task, intent)
-        elif action == "request_escalation":
-            return self._handle_escalation(state, task, intent)
-        elif action == "request_influence":
-            return self._handle_request_influence(state, task, intent)
-        elif action == "provide_influence":
-            return self._handle_provide_influence(state, intent)
-        elif action == "test_boundary":
-            return self._handle_test_boundary(state, task, intent)
-        else:
-            self.log.append(EventType.INTENT_DENIED, agent_id, {"reason": "unknown_action", "action": action})
+        if hook is not None:
+            hook("handler", intent)
+        handler = self.handlers.get(intent.action)
+        if handler is None:
+            self.log.append(EventType.INTENT_DENIED, agent_id, {"reason": "unknown_action", "action": intent.action})
             return False
+        task = self.task_registry.get(intent.task_id) if intent.task_id else None
+        return handler(self, state, task, intent)
+
+    def process_intents(
+        self,
+        batch: Sequence[tuple[str, IntentPayload, bytes]],
+        workers: int = 0,
+    ) -> list[bool]:
+        """Process (agent_id, intent, signature) tuples in order.
+
+        Signatures are verified up front in one bulk call (across a thread
+        pool when workers > 1), then each intent goes through the normal
+        gates and routing, so the log is identical to calling
+        ``process_intent`` for each tuple in turn. Ban and sandbox flags are
+        never cleared, so intents already blocked at batch start skip
+        verification entirely.
+        """
+        pending: list[int] = []
+        checks: list[tuple[Ed25519PublicKey, bytes, bytes]] = []
+        for i, (agent_id, intent, signature) in enumerate(batch):
+            state = self.agents[agent_id]
+            if state.banned:
+                continue
+            if state.sandboxed and intent.action not in escalation.SANDBOX_ALLOWED_ACTIONS:
+                continue
+            pending.append(i)
+            checks.append((self.public_key(agent_id), intent.serialize(), signature))
+
+        verified: list[bool | None] = [None] * len(batch)
+        for i, ok in zip(pending, verify_many(checks, workers)):
+            verified[i] = ok
+
+        return [
+            self.process_intent(agent_id, intent, signature, verified[i])
+            for i, (agent_id, intent, signature) in enumerate(batch)
+        ]
 
     def _handle_work_step(self, state: AgentState, task: Task | None, intent: IntentPayload) -> bool:
         if task is None:
@@ -88,9 +238,9 @@ class Kernel:
 
         # Tier check
         if not escalation.check_tier(state, task, self.log):
-            sandbox.record_violation(state, "tier_violation", self.log)
-            reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "tier_violation", self.log)
-            tier.evaluate(state, self.log)
+            self._record_violation(state, "tier_violation")
+            reputation.adjust(state, self.policy.boundary_violation, "tier_violation", self.log)
+            self._evaluate_tier(state)
             return False
 
         # Influence check
@@ -99,8 +249,8 @@ class Kernel:
 
         # Budget gate
         if not budget.debit(state, task.budget_cost_per_step, self.log):
-            reputation.adjust(state, reputation.BUDGET_ABUSE, "budget_exceeded", self.log)
-            tier.evaluate(state, self.log)
+            reputation.adjust(state, self.policy.budget_abuse, "budget_exceeded", self.log)
+            self._evaluate_tier(state)
             return False
 
         record_step(state, task, self.log)
@@ -115,10 +265,10 @@ class Kernel:
 
         if valid:
             efficient = state.current_task_steps <= task.required_steps
-            reputation.adjust(state, reputation.TASK_SUCCESS, "task_success", self.log)
+            reputation.adjust(state, self.policy.task_success, "task_success", self.log)
             if efficient:
-                reputation.adjust(state, reputation.EFFICIENCY_BONUS, "efficiency_bonus", self.log)
-            tier.evaluate(state, self.log)
+                reputation.adjust(state, self.policy.efficiency_bonus, "efficiency_bonus", self.log)
+            self._evaluate_tier(state)
             return True
         else:
             # Check for deception: submitted something clearly wrong
@@ -128,17 +278,17 @@ class Kernel:
 
     def _flag_deception(self, state: AgentState, task: Task, submitted: str) -> None:
         self.log.append(EventType.DECEPTION_FLAGGED, state.agent_id, {"task_id": task.task_id, "submitted": submitted})
-        reputation.adjust(state, reputation.DECEPTION, "deception", self.log)
-        sandbox.record_violation(state, "deception", self.log)
-        tier.evaluate(state, self.log)
+        reputation.adjust(state, self.policy.deception, "deception", self.log)
+        self._record_violation(state, "deception")
+        self._evaluate_tier(state)
 
     def _handle_escalation(self, state: AgentState, task: Task | None, intent: IntentPayload) -> bool:
         if task is None:
             return False
         if not escalation.check_tier(state, task, self.log):
-            sandbox.record_violation(state, "escalation_denied", self.log)
-            reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "escalation_violation", self.log)
-            tier.evaluate(state, self.log)
+            self._record_violation(state, "escalation_denied")
+            reputation.adjust(state, self.policy.boundary_violation, "escalation_violation", self.log)
+            self._evaluate_tier(state)
             return False
         return True
 
@@ -148,50 +298,213 @@ class Kernel:
         self.influence_queue.request(state, task.task_id, self.log)
         return True
 
-    def _handle_provide_influence(self, state: AgentState, intent: IntentPayload) -> bool:
+    def _handle_provide_influence(self, state: AgentState, task: Task | None, intent: IntentPayload) -> bool:
         requester_id = intent.detail
         task_id = intent.task_id
-        if requester_id not in self.agents:
+        if requester_id in self.agents:
+            self.influence_queue.fulfill(state, self.agents[requester_id], task_id, self.log)
+        elif requester_id in self.remote_agents:
+            self.influence_queue.provide(state, requester_id, task_id, self.log)
+            self.outbox.append(("influence_fulfilled", requester_id, state.agent_id, task_id))
+        else:
             return False
-        requester = self.agents[requester_id]
-        self.influence_queue.fulfill(state, requester, task_id, self.log)
-        reputation.adjust(state, reputation.PROVIDE_INFLUENCE, "provide_influence", self.log)
-        tier.evaluate(state, self.log)
+        reputation.adjust(state, self.policy.provide_influence, "provide_influence", self.log)
+        self._evaluate_tier(state)
         return True
 
     def _handle_test_boundary(self, state: AgentState, task: Task | None, intent: IntentPayload) -> bool:
         detail = intent.detail
-
-        if detail == "access_privileged" and task is not None:
-            if not escalation.check_tier(state, task, self.log):
-                sandbox.record_violation(state, "boundary_test_tier", self.log)
-                reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "boundary_violation", self.log)
-                tier.evaluate(state, self.log)
-                return False
-
-        if detail == "act_while_sandboxed":
-            sandbox.record_violation(state, "boundary_test_sandbox", self.log)
-            reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "boundary_violation", self.log)
-            tier.evaluate(state, self.log)
-            return False
-
-        if detail == "forge_signature":
-            sandbox.record_violation(state, "boundary_test_forgery", self.log)
-            reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "boundary_violation", self.log)
-            tier.evaluate(state, self.log)
-            return False
-
-        if detail == "exceed_budget":
-            sandbox.record_violation(state, "boundary_test_budget", self.log)
-            reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "boundary_violation", self.log)
-            tier.evaluate(state, self.log)
-            return False
-
-        # Generic boundary test
-        sandbox.record_violation(state, f"boundary_test_{detail}", self.log)
-        reputation.adjust(state, reputation.BOUNDARY_VIOLATION, "boundary_violation", self.log)
-        tier.evaluate(state, self.log)
+        reason = BOUNDARY_POLICY.get(detail)
+        if detail == "access_privileged" and (task is None or escalation.check_tier(state, task, self.log)):
+            reason = None
+        self._record_violation(state, reason or f"boundary_test_{detail}")
+        reputation.adjust(state, self.policy.boundary_violation, "boundary_violation", self.log)
+        self._evaluate_tier(state)
         return False
 
+    def end_round(self) -> None:
+        """Round-boundary upkeep: reputation decay, then a bulk tier re-evaluation.
+
+        A no-op unless the policy's decay_rate is set. The decay is logged once,
+        as a kernel event, followed by any tier changes in registration order.
+        """
+        rate = self.policy.decay_rate
+        if not rate:
+            return
+        self.log.append(EventType.REPUTATION_DECAYED, "kernel", {"rate": rate, "baseline": self.policy.decay_baseline})
+        self.decay_reputation(rate)
+
+    def decay_reputation(self, rate: float) -> None:
+        """Apply one round of decay and re-tier, without the kernel-level event."""
+        if self.store is not None:
+            reputation.decay_all(self.store, rate, self.policy.decay_baseline)
+            tier.evaluate_all(self.store, self.log, self.policy.tier_cutoffs, self.policy.tier_levels)
+        else:
+            for state in self.agents.values():
+                state.reputation = reputation.decayed(state.reputation, rate, self.policy.decay_baseline)
+                self._evaluate_tier(state)
+
+    def deliver(self, message: tuple[str, str, str, str]) -> None:
+        """Apply a message from another kernel's outbox."""
+        kind, requester_id, provider_id, task_id = message
+        if kind != "influence_fulfilled":
+            raise ValueError(f"unknown message kind {kind!r}")
+        self.influence_queue.receive(self.agents[requester_id], provider_id, task_id, self.log)
+
+    def snapshot(self, agents: Sequence[BaseAgent] = (), next_round: int = 0) -> bytes:
+        """Serialize kernel and agent state at a round boundary.
+
+        Records the log position (event count and chain head) rather than the
+        events themselves; restore() continues the log from there.
+        """
+        count, head = self.log.checkpoint()
+        data: dict[str, Any] = {
+            "log": [count, head.hex()],
+            "next_round": next_round,
+            "policy": self.policy.to_dict(),
+            "tasks": [asdict(t) for t in self.task_registry],
+            "agents": [
+                {name: _plain(getattr(state, name)) for name in AGENT_FIELDS}
+                for state in self.agents.values()
+            ],
+            "public_keys": {agent_id: pub.public_bytes_raw().hex() for agent_id, pub in self.public_keys.items()},
+            "key_seeds": self.key_seeds,
+            "influence_queue": self.influence_queue.pending_requests(),
+            "agent_snapshots": {agent.agent_id: agent.snapshot() for agent in agents},
+        }
+        return _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + json.dumps(data, separators=(",", ":")).encode()
+
+    def restore(self, blob: bytes, agents: Sequence[BaseAgent] = ()) -> int:
+        """Load a snapshot into this fresh Kernel; returns the round to resume at.
+
+        An empty log is resumed from the snapshot position; a longer log
+        (e.g. a reopened DiskEventLog) is truncated back to it, once its chain
+        hash at that position matches. Raises ValueError for anything that is
+        not a well-formed snapshot, and for a log that can do neither, such as
+        an empty DiskEventLog or another run's log; the kernel and the log are
+        left untouched then.
+        """
+        if self.agents:
+            raise ValueError("restore needs a kernel with no registered agents")
+        data = _load_snapshot(blob)
+        try:
+            policy = Policy(**data["policy"])
+            tasks = [Task(**task) for task in data["tasks"]]
+            public_keys = {
+                agent_id: Ed25519PublicKey.from_public_bytes(bytes.fromhex(raw))
+                for agent_id, raw in data["public_keys"].items()
+            }
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"invalid kernel snapshot: {exc}") from None
+        missing = [agent.agent_id for agent in agents if agent.agent_id not in data["agent_snapshots"]]
+        _check(not missing, f"no state for agents {missing}")
+
+        count, head = data["log"]
+        head = bytes.fromhex(head)
+        if len(self.log) == 0:
+            self.log.resume((count, head))
+        elif _head_at(self.log, count) == head:
+            self.log.truncate(count)
+        if self.log.checkpoint() != (count, head):
+            raise ValueError("event log does not match the snapshot position")
+
+        self.policy = policy
+        for task in tasks:
+            self.register_task(task)
+        for row in data["agents"]:
+            agent_id = row["agent_id"]
+            if self.store is not None:
+                state = self.store.add(agent_id)
+            else:
+                state = self.agents[agent_id] = AgentState(agent_id=agent_id)
+            for name, value in row.items():
+                if isinstance(value, list):
+                    getattr(state, name).extend(value)
+                elif name != "agent_id":
+                    setattr(state, name, value)
+        self.public_keys.update(public_keys)
+        self.key_seeds.update(data["key_seeds"])
+        KEY_REGISTRY.reserve(len(self.key_seeds))
+        self.influence_queue.restore(data["influence_queue"])
+        for agent in agents:
+            agent.restore(data["agent_snapshots"][agent.agent_id])
+        return data["next_round"]
+
+    def _record_violation(self, state: AgentState, reason: str) -> None:
+        sandbox.record_violation(state, reason, self.log, self.policy.sandbox_threshold, self.policy.ban_threshold)
+
+    def _evaluate_tier(self, state: AgentState) -> None:
+        tier.evaluate(state, self.log, self.policy.tier_cutoffs, self.policy.tier_levels)
+
     def get_state(self, agent_id: str) -> AgentState:
         return self.agents[agent_id]
+
+
+ACTION_HANDLERS: dict[str, Handler] = {
+    "work_step": Kernel._handle_work_step,
+    "submit_result": Kernel._handle_submit,
+    "request_escalation": Kernel._handle_escalation,
+    "request_influence": Kernel._handle_request_influence,
+    "provide_influence": Kernel._handle_provide_influence,
+    "test_boundary": Kernel._handle_test_boundary,
+}
+
+
+def _head_at(log: EventLog, count: int) -> bytes | None:
+    """Chain hash after the first ``count`` events, or None if the log does not hold them."""
+    base, base_head = log.origin
+    if count == base:
+        return base_head
+    if count < base:
+        return None
+    event = next(log.iter_range(count - 1, count), None)
+    return None if event is None else event.chain_hash
+
+
+def _plain(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+def _check(condition: bool, what: str) -> None:
+    if not condition:
+        raise ValueError(f"invalid kernel snapshot: {what}")
+
+
+def _load_snapshot(blob: bytes) -> dict[str, Any]:
+    """Parse a Kernel.snapshot blob and check its shape; plain JSON data only."""
+    if len(blob) < _SNAPSHOT_HEADER.size:
+        raise ValueError("not a kernel snapshot")
+    magic, version = _SNAPSHOT_HEADER.unpack_from(blob)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError("not a kernel snapshot, or an unsupported version")
+    try:
+        data = json.loads(blob[_SNAPSHOT_HEADER.size:])
+    except ValueError as exc:
+        raise ValueError(f"invalid kernel snapshot: {exc}") from None
+
+    _check(isinstance(data, dict) and data.keys() == SNAPSHOT_FIELDS.keys(), "unexpected top-level keys")
+    for name, kind in SNAPSHOT_FIELDS.items():
+        _check(isinstance(data[name], kind), f"{name} is not a {kind.__name__}")
+    log = data["log"]
+    _check(
+        len(log) == 2 and type(log[0]) is int and log[0] >= 0
+        and isinstance(log[1], str) and len(log[1]) == 64,
+        "log position",
+    )
+    _check(all(isinstance(task, dict) for task in data["tasks"]), "tasks")
+    for row in data["agents"]:
+        _check(isinstance(row, dict) and tuple(row) == AGENT_FIELDS and isinstance(row["agent_id"], str), "agent state")
+        for name, value in row.items():
+            _check(isinstance(value, (str, int, float, list)) or value is None, f"agent state field {name}")
+    _check(all(isinstance(raw, str) for raw in data["public_keys"].values()), "public keys")
+    _check(all(isinstance(seed, str) for seed in data["key_seeds"].values()), "key seeds")
+    _check(
+        all(
+            isinstance(req, dict) and req.keys() == {"requester_id", "task_id"}
+            and all(isinstance(v, str) for v in req.values())
+            for req in data["influence_queue"]
+        ),
+        "influence queue",
+    )
+    _check(all(isinstance(state, dict) for state in data["agent_snapshots"].values()), "agent snapshots")
+    return data
@@ -1,16 +1,28 @@
 """
 Live terminal runner — real-time SIE kernel visualization.
 Run: python -m sie.live
+
+Fast mode runs the simulation at full speed while a renderer thread redraws a
+summary dashboard at a fixed frame rate; the kernel only pushes events into a
+bounded ring buffer. It scales to generated scenarios with many agents.
+Run: python -m sie.live --fast --agents 10000 --tasks 100
 """
 from __future__ import annotations
 
+import argparse
+import heapq
 import sys
+import threading
 import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+from typing import TextIO
 
 from sie.event_log import EventLog
 from sie.kernel import Kernel
-from sie.main import AGENT_CONFIGS, INITIAL_BUDGET, NUM_ROUNDS, TASKS, process_influence_queue
-from sie.types import AgentState, EventType
+from sie.main import AGENT_CONFIGS, TASKS, build_simulation, process_influence_queue, run_simulation
+from sie.types import AgentState, Event, EventType
 
 # ── ANSI codes ──────────────────────────────────────────────
 RESET   = "\033[0m"
@@ -33,6 +45,16 @@ EVENT_DELAY = 0.04
 ROUND_DELAY = 0.3
 SECTION_DELAY = 0.6
 
+# Fast mode: frames per second, rows per top-N table, recent event lines, and
+# events the ring buffer holds before the oldest are overwritten
+FRAME_RATE = 4
+TOP_N = 5
+TAIL_LINES = 8
+RING_CAPACITY = 65_536
+
+# Fast-mode top-N tables: AgentState attribute, table title
+LEADER_TABLES = (("reputation", "REPUTATION"), ("violation_count", "VIOLATIONS"))
+
 # Event type → color/icon mapping
 EVENT_STYLE: dict[EventType, tuple[str, str]] = {
     EventType.AGENT_REGISTERED:    (GREEN,   "▶ REG  "),
@@ -45,6 +67,7 @@ EVENT_STYLE: dict[EventType, tuple[str, str]] = {
     EventType.BUDGET_EXCEEDED:     (RED,     "$ EXCD "),
     EventType.BUDGET_DEFUNDED:     (RED,     "$ DFUND"),
     EventType.REPUTATION_ADJUSTED: (MAGENTA, "★ REP  "),
+    EventType.REPUTATION_DECAYED:  (MAGENTA, "★ DECAY"),
     EventType.TIER_UPGRADED:       (GREEN,   "▲ TIER "),
     EventType.TIER_DOWNGRADED:     (RED,     "▼ TIER "),
     EventType.ESCALATION_DENIED:   (YELLOW,  "⊘ ESCL "),
@@ -74,6 +97,19 @@ AGENT_COLORS: dict[str, str] = {
     "kernel":       WHITE,
 }
 
+# Colors for generated "<behavior>-<n>" agents
+BEHAVIOR_COLORS: dict[str, str] = {
+    agent_id.split("-")[0]: color for agent_id, color in AGENT_COLORS.items() if agent_id != "kernel"
+}
+
+
+def agent_color(agent_id: str) -> str:
+    return AGENT_COLORS.get(agent_id) or BEHAVIOR_COLORS.get(agent_id.split("-")[0], WHITE)
+
+
+def _status(s: AgentState) -> str:
+    return "banned" if s.banned else "sandboxed" if s.sandboxed else "active"
+
 
 def clear_screen() -> None:
     sys.stdout.write("\033[2J\033[H")
@@ -106,42 +142,46 @@ def format_rep_bar(rep: float) -> str:
     return format_bar(rep, 1.0, 15, color)
 
 
-def print_dashboard(kernel: Kernel) -> None:
-    """Print a compact live dashboard of all agent states."""
-    print(f"\n{BOLD}{WHITE}{'─' * 68}")
-    print(f"  {'AGENT':<14} {'BUDGET':>7}  {'REPUTATION':>10}       {'TIER':>4}  {'STATUS':<16} {'TASKS'}")
-    print(f"{'─' * 68}{RESET}")
+def format_agent_row(agent_id: str, s: AgentState, full_budget: float) -> str:
+    """One dashboard row: budget (against full_budget) and reputation bars, tier, status, tasks."""
+    ac = agent_color(agent_id)
 
-    for agent_id in ["efficient-1", "looper-1", "deceptive-1", "specialist-1", "naive-1", "boundary-1"]:
-        s = kernel.agents[agent_id]
-        ac = AGENT_COLORS.get(agent_id, WHITE)
-
-        # Status badge
-        if s.banned:
-            status = f"{BG_RED}{WHITE}{BOLD} BANNED {RESET}"
-        elif s.sandboxed:
-            status = f"{BG_YELLOW}{WHITE}{BOLD} SANDBOX {RESET}"
-        elif s.tier >= 2:
-            status = f"{BG_GREEN}{WHITE}{BOLD} TIER {s.tier} {RESET}"
-        elif s.tier == 1:
-            status = f"{BG_BLUE}{WHITE}{BOLD} TIER {s.tier} {RESET}"
-        else:
-            status = f"{DIM}  active {RESET}"
+    # Status badge
+    if s.banned:
+        status = f"{BG_RED}{WHITE}{BOLD} BANNED {RESET}"
+    elif s.sandboxed:
+        status = f"{BG_YELLOW}{WHITE}{BOLD} SANDBOX {RESET}"
+    elif s.tier >= 2:
+        status = f"{BG_GREEN}{WHITE}{BOLD} TIER {s.tier} {RESET}"
+    elif s.tier == 1:
+        status = f"{BG_BLUE}{WHITE}{BOLD} TIER {s.tier} {RESET}"
+    else:
+        status = f"{DIM}  active {RESET}"
+
+    # Budget bar
+    budget_bar = format_bar(s.budget, full_budget, 10, GREEN if s.budget > 30 else YELLOW if s.budget > 0 else RED)
+
+    # Rep bar
+    rep_bar = format_rep_bar(s.reputation)
+
+    # Violations
+    viol = f"{RED}!{s.violation_count}{RESET}" if s.violation_count > 0 else ""
 
-        # Budget bar
-        budget_bar = format_bar(s.budget, 100.0, 10, GREEN if s.budget > 30 else YELLOW if s.budget > 0 else RED)
+    tasks_info = f"{GREEN}{s.tasks_completed}ok{RESET}"
+    if s.tasks_failed > 0:
+        tasks_info += f" {RED}{s.tasks_failed}fail{RESET}"
 
-        # Rep bar
-        rep_bar = format_rep_bar(s.reputation)
+    return f"  {ac}{BOLD}{agent_id:<14}{RESET} {budget_bar} {s.budget:>5.0f}  {rep_bar} {s.reputation:.2f}  T{s.tier}  {status} {tasks_info} {viol}"
 
-        # Violations
-        viol = f"{RED}!{s.violation_count}{RESET}" if s.violation_count > 0 else ""
 
-        tasks_info = f"{GREEN}{s.tasks_completed}ok{RESET}"
-        if s.tasks_failed > 0:
-            tasks_info += f" {RED}{s.tasks_failed}fail{RESET}"
+def print_dashboard(kernel: Kernel) -> None:
+    """Print a compact live dashboard of all agent states."""
+    print(f"\n{BOLD}{WHITE}{'─' * 68}")
+    print(f"  {'AGENT':<14} {'BUDGET':>7}  {'REPUTATION':>10}       {'TIER':>4}  {'STATUS':<16} {'TASKS'}")
+    print(f"{'─' * 68}{RESET}")
 
-        print(f"  {ac}{BOLD}{agent_id:<14}{RESET} {budget_bar} {s.budget:>5.0f}  {rep_bar} {s.reputation:.2f}  T{s.tier}  {status} {tasks_info} {viol}")
+    for agent_id, s in kernel.agents.items():
+        print(format_agent_row(agent_id, s, kernel.policy.initial_budget))
 
     print(f"{DIM}{'─' * 68}{RESET}")
 
@@ -149,7 +189,7 @@ def print_dashboard(kernel: Kernel) -> None:
 def format_event_line(etype: EventType, agent_id: str, data: dict) -> str | None:
     """Format a single event into a readable live line. Returns None to skip."""
     color, icon = EVENT_STYLE.get(etype, (WHITE, "  ???  "))
-    ac = AGENT_COLORS.get(agent_id, WHITE)
+    ac = agent_color(agent_id)
 
     # Skip round markers (handled separately) and noisy registration events
     if etype in (EventType.ROUND_START, EventType.ROUND_END, EventType.SIMULATION_COMPLETE):
@@ -172,6 +212,8 @@ def format_event_line(etype: EventType, agent_id: str, data: dict) -> str | None
         d = data.get('delta', 0)
         sign = "+" if d >= 0 else ""
         detail = f"{sign}{d:.2f} ({data.get('reason', '')}) → {data.get('new', 0):.4f}"
+    elif etype == EventType.REPUTATION_DECAYED:
+        detail = f"all agents {data.get('rate', 0):.0%} toward {data.get('baseline', 0):.2f}"
     elif etype == EventType.TIER_UPGRADED:
         detail = f"tier {data.get('old_tier', '?')} → {data.get('new_tier', '?')} (rep={data.get('reputation', 0):.2f})"
     elif etype == EventType.TIER_DOWNGRADED:
@@ -246,6 +288,256 @@ class LiveEventLog(EventLog):
         return event
 
 
+class EventRing:
+    """Bounded buffer between the kernel and the renderer thread.
+
+    Subscribed as a log listener, so the kernel's cost per event is one deque
+    append. When the renderer falls behind, the oldest events are overwritten
+    rather than blocking the kernel, and counted as dropped.
+    """
+
+    def __init__(self, capacity: int = RING_CAPACITY) -> None:
+        self._events: deque[Event] = deque(maxlen=capacity)
+        self.pushed = 0
+        self.drained = 0
+
+    def __call__(self, event: Event) -> None:
+        self._events.append(event)
+        self.pushed += 1
+
+    def drain(self) -> list[Event]:
+        """Everything buffered so far, oldest first."""
+        events = []
+        pop = self._events.popleft
+        try:
+            for _ in range(len(self._events)):
+                events.append(pop())
+        except IndexError:
+            pass
+        self.drained += len(events)
+        return events
+
+    @property
+    def dropped(self) -> int:
+        return max(self.pushed - self.drained - len(self._events), 0)
+
+
+class Dashboard:
+    """Summary dashboard redrawn by a renderer thread at a fixed frame rate.
+
+    Each frame drains the ring, then summarizes the agents as status and tier
+    histograms plus top-N tables, so its size does not grow with the agent
+    count. Only rows that differ from the previous frame are rewritten.
+
+    The histograms are counts a log listener keeps current as events arrive.
+    The top-N tables are re-ranked from the previous leaders plus the agents
+    the drained events touched; only a leader losing reputation or events
+    dropped by the ring make a frame rank every agent again. Decay pulls all
+    reputations toward one baseline, which keeps their order.
+    """
+
+    def __init__(
+        self,
+        kernel: Kernel,
+        out: TextIO = sys.stdout,
+        fps: float = FRAME_RATE,
+        top: int = TOP_N,
+        tail: int = TAIL_LINES,
+        capacity: int = RING_CAPACITY,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.kernel = kernel
+        self.out = out
+        self.interval = 1.0 / fps
+        self.top = top
+        self.clock = clock
+        self.ring = EventRing(capacity)
+        self.recent: deque[Event] = deque(maxlen=tail)
+        self.round = -1
+        self.rate = 0.0
+        self.status: Counter[str] = Counter()
+        self.tiers: Counter[int] = Counter()
+        self.max_tier = 0
+        # Agent ids per top-N table, best first; None until first ranked
+        self.leaders: dict[str, list[str] | None] = {attr: None for attr, _ in LEADER_TABLES}
+        self._dropped = 0
+        self._mark = (clock(), 0)
+        self._rows: list[str] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sie-dashboard", daemon=True)
+
+    def start(self) -> None:
+        for state in self.kernel.agents.values():
+            self.status[_status(state)] += 1
+            self._add_tier(state.tier)
+        self.kernel.log.subscribe(self.ring)
+        self.kernel.log.subscribe(self.count)
+        self.out.write("\033[2J")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the renderer and draw one last, complete frame."""
+        self.kernel.log.unsubscribe(self.ring)
+        self.kernel.log.unsubscribe(self.count)
+        self._stop.set()
+        self._thread.join()
+        self.render()
+        self.out.write(f"\033[{len(self._rows) + 1};1H\n")
+        self.out.flush()
+
+    def _add_tier(self, tier: int) -> None:
+        self.tiers[tier] += 1
+        if tier > self.max_tier:
+            self.max_tier = tier
+
+    def count(self, event: Event) -> None:
+        """Log listener: keep the status and tier counts current."""
+        etype = event.event_type
+        if etype == EventType.AGENT_REGISTERED:
+            self.status["active"] += 1
+            self._add_tier(self.kernel.agents[event.agent_id].tier)
+        elif etype == EventType.AGENT_SANDBOXED:
+            if not self.kernel.agents[event.agent_id].banned:
+                self.status["active"] -= 1
+                self.status["sandboxed"] += 1
+        elif etype == EventType.AGENT_BANNED:
+            self.status["sandboxed" if self.kernel.agents[event.agent_id].sandboxed else "active"] -= 1
+            self.status["banned"] += 1
+        elif etype == EventType.TIER_UPGRADED or etype == EventType.TIER_DOWNGRADED:
+            self.tiers[event.data["old_tier"]] -= 1
+            self._add_tier(event.data["new_tier"])
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.render()
+
+    def render(self) -> None:
+        touched: dict[str, set[str]] = {attr: set() for attr, _ in LEADER_TABLES}
+        leaders = self.leaders
+        for event in self.ring.drain():
+            etype = event.event_type
+            if etype == EventType.ROUND_START:
+                self.round = event.data["round"]
+            elif etype not in (EventType.ROUND_END, EventType.SIMULATION_COMPLETE):
+                self.recent.append(event)
+            if etype == EventType.REPUTATION_ADJUSTED:
+                if event.data["delta"] < 0 and event.agent_id in (leaders["reputation"] or ()):
+                    leaders["reputation"] = None
+                touched["reputation"].add(event.agent_id)
+            elif etype == EventType.VIOLATION_RECORDED:
+                touched["violation_count"].add(event.agent_id)
+            elif etype == EventType.AGENT_REGISTERED:
+                for ids in touched.values():
+                    ids.add(event.agent_id)
+        if self.ring.dropped != self._dropped:
+            self._dropped = self.ring.dropped
+            leaders = self.leaders = dict.fromkeys(leaders)
+        for attr, ids in touched.items():
+            self._rank(attr, ids)
+
+        now = self.clock()
+        then, pushed = self._mark
+        if now > then:
+            self.rate = (self.ring.pushed - pushed) / (now - then)
+        self._mark = (now, self.ring.pushed)
+
+        rows = self.frame()
+        changed = [
+            f"\033[{i + 1};1H{row}\033[K"
+            for i, row in enumerate(rows)
+            if i >= len(self._rows) or self._rows[i] != row
+        ]
+        self._rows = rows
+        if changed:
+            self.out.write("".join(changed))
+            self.out.flush()
+
+    def _rank(self, attr: str, touched: set[str]) -> None:
+        """Re-rank one top-N table, from scratch if its leaders were reset."""
+        leaders = self.leaders[attr]
+        if leaders is None:
+            candidates = self.kernel.agents.values()
+        elif touched:
+            agents = self.kernel.agents
+            candidates = [agents[agent_id] for agent_id in dict.fromkeys([*leaders, *touched])]
+        else:
+            return
+        self.leaders[attr] = [s.agent_id for s in heapq.nlargest(self.top, candidates, key=attrgetter(attr))]
+
+    def frame(self) -> list[str]:
+        count = sum(self.status.values())
+        rule = f"{DIM}{'─' * 68}{RESET}"
+        rows = [
+            f"  {BOLD}{CYAN}SIE LIVE{RESET}  round {self.round:>3}  agents {count:,}  "
+            f"events {self.ring.pushed:,}  {self.rate:,.0f}/s  {DIM}dropped {self.ring.dropped:,}{RESET}",
+            rule,
+        ]
+        for label, color in (("active", GREEN), ("sandboxed", YELLOW), ("banned", RED)):
+            n = self.status[label]
+            rows.append(f"  {label:<10} {format_bar(n, count, 20, color)} {n:>9,}")
+        for tier in range(self.max_tier + 1):
+            n = self.tiers[tier]
+            rows.append(f"  {'tier ' + str(tier):<10} {format_bar(n, count, 20, BLUE)} {n:>9,}")
+        rows.append(rule)
+
+        agents = self.kernel.agents
+        full_budget = self.kernel.policy.initial_budget
+        for attr, title in LEADER_TABLES:
+            rows.append(f"  {BOLD}{WHITE}TOP {self.top} BY {title}{RESET}")
+            leaders = self.leaders[attr] or []
+            rows.extend(format_agent_row(agent_id, agents[agent_id], full_budget) for agent_id in leaders)
+            rows.extend("" for _ in range(self.top - len(leaders)))
+        rows.append(rule)
+
+        recent = [format_event_line(e.event_type, e.agent_id, e.data) or "" for e in self.recent]
+        rows.extend(recent)
+        rows.extend("" for _ in range((self.recent.maxlen or 0) - len(recent)))
+        return rows
+
+
+def run_fast(
+    num_agents: int = 0,
+    num_tasks: int = 0,
+    seed: int = 0,
+    num_rounds: int | None = None,
+    fps: float = FRAME_RATE,
+    top: int = TOP_N,
+) -> Kernel:
+    """Run at full speed under a Dashboard: the standard simulation, or a
+    generated scenario when ``num_agents`` is set."""
+    if num_agents:
+        from sie.scenario import generate_scenario
+
+        scenario = generate_scenario(num_agents, num_tasks or max(num_agents // 100, 4), seed)
+        kernel, agents = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+    else:
+        kernel, agents = build_simulation()
+
+    dashboard = Dashboard(kernel, fps=fps, top=top)
+    dashboard.start()
+    t0 = time.perf_counter()
+    try:
+        run_simulation(kernel, agents, num_rounds=num_rounds)
+    finally:
+        dashboard.stop()
+    print(f"  {BOLD}{len(kernel.log):,} events in {time.perf_counter() - t0:.2f}s{RESET}")
+    return kernel
+
+
+def log_integrity(events: Iterable[Event]) -> tuple[bool, int]:
+    """(sequences contiguous from 0, intents submitted by agents after their ban)."""
+    contiguous = True
+    banned: set[str] = set()
+    post_ban = 0
+    for i, e in enumerate(events):
+        contiguous = contiguous and e.sequence == i
+        if e.event_type == EventType.AGENT_BANNED:
+            banned.add(e.agent_id)
+        elif e.event_type == EventType.INTENT_SUBMITTED and e.agent_id in banned:
+            post_ban += 1
+    return contiguous, post_ban
+
+
 def run_live() -> None:
     clear_screen()
     print_banner()
@@ -279,7 +571,7 @@ def run_live() -> None:
     agents = []
     for agent_id, agent_cls, kwargs in AGENT_CONFIGS:
         agent = agent_cls(agent_id=agent_id, **kwargs)
-        kernel.register_agent(agent_id, agent.public_key, INITIAL_BUDGET)
+        kernel.register_agent(agent_id, agent.public_key, kernel.policy.initial_budget)
         kernel.assign_task_to_agent(agent_id, kwargs["task_id"])
         agents.append(agent)
 
@@ -287,7 +579,8 @@ def run_live() -> None:
     time.sleep(SECTION_DELAY)
 
     # ── Simulation rounds ──
-    for round_num in range(NUM_ROUNDS):
+    num_rounds = kernel.policy.num_rounds
+    for round_num in range(num_rounds):
         print(f"\n{BOLD}{WHITE}  ══ ROUND {round_num:>2} ═══════════════════════════════════════════════{RESET}")
         log.append(EventType.ROUND_START, "kernel", {"round": round_num})
 
@@ -295,41 +588,38 @@ def run_live() -> None:
             agent.act(kernel, round_num)
 
         # Influence processing
-        pending = kernel.influence_queue.pending_requests()
-        if pending:
+        if kernel.influence_queue:
             print(f"\n  {MAGENTA}{BOLD}  ↔ INFLUENCE QUEUE{RESET}")
         process_influence_queue(kernel, agents)
+        kernel.end_round()
 
         log.append(EventType.ROUND_END, "kernel", {"round": round_num})
 
         print_dashboard(kernel)
         time.sleep(ROUND_DELAY)
 
-    log.append(EventType.SIMULATION_COMPLETE, "kernel", {"total_rounds": NUM_ROUNDS})
+    log.append(EventType.SIMULATION_COMPLETE, "kernel", {"total_rounds": num_rounds})
 
     # ── Final summary ──
     print(f"\n\n{BOLD}{CYAN}╔══════════════════════════════════════════════════════════════════╗")
     print(f"║                  {WHITE}SIMULATION COMPLETE{CYAN}                            ║")
     print(f"╚══════════════════════════════════════════════════════════════════╝{RESET}\n")
 
-    print(f"  {BOLD}Total events:{RESET}  {len(log.events)}")
-    print(f"  {BOLD}Total rounds:{RESET}  {NUM_ROUNDS}")
+    print(f"  {BOLD}Total events:{RESET}  {len(log)}")
+    print(f"  {BOLD}Total rounds:{RESET}  {num_rounds}")
     print()
 
     # Signature sweep
-    from sie.crypto import derive_keypair, verify
-    from sie.types import IntentPayload
-    intent_events = log.events_of_type(EventType.INTENT_SUBMITTED)
-    verified = 0
-    for e in intent_events:
-        if e.signature and e.agent_id in kernel.public_keys:
-            _, pub = derive_keypair(e.agent_id)
-            payload = IntentPayload(action=e.data.get("action", ""), task_id=e.data.get("task_id", ""), detail=e.data.get("detail", ""))
-            if verify(pub, payload.serialize(), bytes.fromhex(e.signature)):
-                verified += 1
-
-    print(f"  {BOLD}Signatures:{RESET}    {GREEN}{verified}/{len(intent_events)} verified{RESET}")
-    print(f"  {BOLD}Log integrity:{RESET} {GREEN}contiguous, no post-ban intents{RESET}")
+    from sie.verify_sweep import sweep
+    total_intents, verified, _ = sweep(log, kernel.public_keys)
+
+    print(f"  {BOLD}Signatures:{RESET}    {GREEN}{verified}/{total_intents} verified{RESET}")
+    contiguous, post_ban = log_integrity(log)
+    if contiguous and not post_ban:
+        print(f"  {BOLD}Log integrity:{RESET} {GREEN}contiguous, no post-ban intents{RESET}")
+    else:
+        gaps = "contiguous" if contiguous else "sequence gaps"
+        print(f"  {BOLD}Log integrity:{RESET} {RED}{gaps}, {post_ban} post-ban intents{RESET}")
     print()
 
     # Final verdict per agent
@@ -351,16 +641,33 @@ def run_live() -> None:
 
     # Write files
     import os
-    from sie.report import generate_report
+    from sie.report import write_report
     out_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
     os.makedirs(out_dir, exist_ok=True)
 
     log._suppress_print = True
-    with open(os.path.join(out_dir, "event_log.json"), "w") as f:
-        f.write(log.to_json())
-    with open(os.path.join(out_dir, "report.txt"), "w") as f:
-        f.write(generate_report(kernel))
+    with open(os.path.join(out_dir, "event_log.json"), "w", buffering=1 << 20) as f:
+        log.write_json(f)
+    with open(os.path.join(out_dir, "report.txt"), "w", buffering=1 << 20) as f:
+        write_report(kernel, f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Live terminal run of the SIE kernel.")
+    parser.add_argument("--fast", action="store_true", help="full-speed run under a rate-limited summary dashboard")
+    parser.add_argument("--agents", type=int, default=0, help="generated scenario size (fast mode; default: standard agents)")
+    parser.add_argument("--tasks", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=None)
+    parser.add_argument("--fps", type=float, default=FRAME_RATE)
+    parser.add_argument("--top", type=int, default=TOP_N)
+    args = parser.parse_args()
+
+    if args.fast:
+        run_fast(args.agents, args.tasks, args.seed, args.rounds, args.fps, args.top)
+    else:
+        run_live()
 
 
 if __name__ == "__main__":
-    run_live()
+    main()
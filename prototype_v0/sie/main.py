@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import os
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from sie.agents.base import BaseAgent
 from sie.agents.boundary import BoundaryAgent
@@ -9,11 +13,17 @@ from sie.agents.efficient import EfficientAgent
 from sie.agents.looper import LooperAgent
 from sie.agents.naive import NaiveAgent
 from sie.agents.specialist import SpecialistAgent
-from sie.event_log import EventLog
+from sie.event_log import EventLog, NdjsonTail
 from sie.kernel import Kernel
-from sie.report import generate_report
+# INITIAL_BUDGET and NUM_ROUNDS live in sie.policy; still importable from here
+from sie.policy import INITIAL_BUDGET, NUM_ROUNDS, Policy  # noqa: F401
+from sie.report import write_report
+from sie.speculation import run_round
 from sie.types import EventType, IntentPayload, Task
 
+if TYPE_CHECKING:
+    from sie.agent_store import AgentStore
+
 TASKS = [
     Task(task_id="task-easy-1", difficulty="easy", required_steps=3, expected_output="55", budget_cost_per_step=5, requires_tier=0, requires_influence=False),
     Task(task_id="task-easy-2", difficulty="easy", required_steps=2, expected_output="olleh", budget_cost_per_step=5, requires_tier=0, requires_influence=False),
@@ -30,33 +40,64 @@ AGENT_CONFIGS = [
     ("boundary-1", BoundaryAgent, {"task_id": "task-privileged-1"}),
 ]
 
-INITIAL_BUDGET = 100.0
-NUM_ROUNDS = 15
+# (agent_id, agent class, constructor kwargs including task_id)
+AgentConfig = tuple[str, type[BaseAgent], dict[str, Any]]
+
 
+def make_agents(agent_configs: Sequence[AgentConfig] = AGENT_CONFIGS) -> list[BaseAgent]:
+    return [agent_cls(agent_id=agent_id, **kwargs) for agent_id, agent_cls, kwargs in agent_configs]
 
-def build_simulation() -> tuple[Kernel, list[BaseAgent]]:
-    log = EventLog()
-    kernel = Kernel(log)
+
+def build_simulation(
+    log: EventLog | None = None,
+    store: AgentStore | None = None,
+    tasks: Sequence[Task] = TASKS,
+    agent_configs: Sequence[AgentConfig] = AGENT_CONFIGS,
+    initial_budget: float | None = None,
+    policy: Policy | None = None,
+) -> tuple[Kernel, list[BaseAgent]]:
+    """Kernel and agents for a run; initial_budget defaults to the policy's."""
+    kernel = Kernel(log if log is not None else EventLog(), store, policy)
+    if initial_budget is None:
+        initial_budget = kernel.policy.initial_budget
 
     # Register tasks
-    for task in TASKS:
+    for task in tasks:
         kernel.register_task(task)
 
-    # Register agents
-    agents: list[BaseAgent] = []
-    for agent_id, agent_cls, kwargs in AGENT_CONFIGS:
-        agent = agent_cls(agent_id=agent_id, **kwargs)
-        kernel.register_agent(agent_id, agent.public_key, INITIAL_BUDGET)
+    # Register agents; keys are derived when first used
+    agents = make_agents(agent_configs)
+    for agent_id, _, kwargs in agent_configs:
+        kernel.register_agent(agent_id, None, initial_budget)
         kernel.assign_task_to_agent(agent_id, kwargs["task_id"])
-        agents.append(agent)
 
     return kernel, agents
 
 
-def process_influence_queue(kernel: Kernel, agents: list[BaseAgent]) -> None:
-    """Between rounds: EfficientAgent provides influence if there are pending requests."""
-    pending = kernel.influence_queue.pending_requests()
-    if not pending:
+def resume_simulation(
+    snapshot: bytes,
+    log: EventLog | None = None,
+    store: AgentStore | None = None,
+    agent_configs: Sequence[AgentConfig] = AGENT_CONFIGS,
+) -> tuple[Kernel, list[BaseAgent], int]:
+    """Rebuild a simulation from Kernel.snapshot; also returns the round to resume at."""
+    kernel = Kernel(log if log is not None else EventLog(), store)
+    agents = make_agents(agent_configs)
+    next_round = kernel.restore(snapshot, agents)
+    return kernel, agents, next_round
+
+
+def process_influence_queue(
+    kernel: Kernel,
+    agents: list[BaseAgent],
+    pending: list[dict[str, str]] | None = None,
+) -> None:
+    """Between rounds: EfficientAgent provides influence if there are pending requests.
+
+    ``pending`` defaults to the kernel's own queue; the sharded runner passes
+    the requests gathered from every shard.
+    """
+    if pending is None and not kernel.influence_queue:
         return
 
     # Find the efficient agent to provide influence
@@ -73,6 +114,8 @@ def process_influence_queue(kernel: Kernel, agents: list[BaseAgent]) -> None:
     if state.banned:
         return
 
+    if pending is None:
+        pending = kernel.influence_queue.pending_requests()
     for req in pending:
         intent = IntentPayload(
             action="provide_influence",
@@ -82,45 +125,101 @@ def process_influence_queue(kernel: Kernel, agents: list[BaseAgent]) -> None:
         efficient.submit_intent(kernel, intent)
 
 
-def run_simulation(kernel: Kernel, agents: list[BaseAgent]) -> None:
+def run_simulation(
+    kernel: Kernel,
+    agents: list[BaseAgent],
+    start_round: int = 0,
+    stop_round: int | None = None,
+    num_rounds: int | None = None,
+    workers: int = 0,
+) -> None:
+    """Run rounds start_round..stop_round-1 (default: to the end); the run
+    completes at num_rounds, which defaults to the kernel policy's.
+
+    With workers > 0, each round's agent decisions and signatures are made
+    speculatively across a thread pool and then committed in agent order
+    (see sie.speculation); the log is the same either way. This checks the
+    two-phase commit rather than speeding the run up.
+    """
     log = kernel.log
+    if num_rounds is None:
+        num_rounds = kernel.policy.num_rounds
+    if stop_round is None:
+        stop_round = num_rounds
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 0 else None
+
+    try:
+        for round_num in range(start_round, stop_round):
+            log.append(EventType.ROUND_START, "kernel", {"round": round_num})
+
+            # Deterministic agent order
+            if pool is not None:
+                run_round(kernel, agents, round_num, pool, workers)
+            else:
+                for agent in agents:
+                    agent.act(kernel, round_num)
+
+            # Process influence between rounds
+            process_influence_queue(kernel, agents)
+            kernel.end_round()
+
+            log.append(EventType.ROUND_END, "kernel", {"round": round_num})
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if stop_round == num_rounds:
+        log.append(EventType.SIMULATION_COMPLETE, "kernel", {"total_rounds": num_rounds})
+
+
+def run(follow: bool = False, metrics: bool = False, columnar: bool = False) -> None:
+    """Run the standard simulation and write its outputs.
+
+    With follow=True the log is also mirrored to output/event_log.ndjson as
+    it is produced, for tools consuming it via ``follow_ndjson``. With
+    metrics=True the kernel is instrumented and output/metrics.prom and
+    output/metrics.json are rewritten at every ROUND_END. With columnar=True
+    the log is also exported round by round to output/columnar (needs numpy).
+    """
+    out_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
+    os.makedirs(out_dir, exist_ok=True)
 
-    for round_num in range(NUM_ROUNDS):
-        log.append(EventType.ROUND_START, "kernel", {"round": round_num})
-
-        # Deterministic agent order
-        for agent in agents:
-            agent.act(kernel, round_num)
-
-        # Process influence between rounds
-        process_influence_queue(kernel, agents)
-
-        log.append(EventType.ROUND_END, "kernel", {"round": round_num})
-
-    log.append(EventType.SIMULATION_COMPLETE, "kernel", {"total_rounds": NUM_ROUNDS})
-
-
-def run() -> None:
     kernel, agents = build_simulation()
-    run_simulation(kernel, agents)
+    if metrics:
+        from sie.metrics import instrument, json_exporter, prometheus_exporter
+
+        instrument(kernel, (
+            prometheus_exporter(os.path.join(out_dir, "metrics.prom")),
+            json_exporter(os.path.join(out_dir, "metrics.json")),
+        ))
+    columns = None
+    if columnar:
+        from sie.columnar import ColumnarTail
+
+        columns = ColumnarTail(kernel.log, os.path.join(out_dir, "columnar"))
+    if follow:
+        with open(os.path.join(out_dir, "event_log.ndjson"), "w") as f:
+            tail = NdjsonTail(kernel.log, f)
+            run_simulation(kernel, agents)
+            tail.close()
+    else:
+        run_simulation(kernel, agents)
+    if columns is not None:
+        columns.close()
 
     # Write outputs
-    out_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
-    os.makedirs(out_dir, exist_ok=True)
-
     log_path = os.path.join(out_dir, "event_log.json")
-    with open(log_path, "w") as f:
-        f.write(kernel.log.to_json())
+    with open(log_path, "w", buffering=1 << 20) as f:
+        kernel.log.write_json(f)
 
     report_path = os.path.join(out_dir, "report.txt")
-    report = generate_report(kernel)
-    with open(report_path, "w") as f:
-        f.write(report)
+    with open(report_path, "w", buffering=1 << 20) as f:
+        write_report(kernel, f)
 
     print(f"Event log written to {log_path}")
     print(f"Report written to {report_path}")
-    print(f"Total events: {len(kernel.log.events)}")
+    print(f"Total events: {len(kernel.log)}")
 
 
 if __name__ == "__main__":
-    run()
+    run(follow="--follow" in sys.argv[1:], metrics="--metrics" in sys.argv[1:], columnar="--columnar" in sys.argv[1:])
@@ -0,0 +1,184 @@
+"""
+Opt-in kernel instrumentation.
+
+instrument(kernel) sets that kernel's stage_hook, which process_intent calls
+as each stage starts, and subscribes a log listener for event counters. A
+stage lasts until the next one starts or the intent is done. Kernels that
+are not instrumented skip the hook with a None check per stage.
+
+Stages timed per intent:
+    gate.ban, gate.sandbox, verify, log_intent, handler.<action>
+A stage that denies the intent includes logging the denial; the handler
+stage covers the handler's own tier, influence and budget checks. Counters:
+events by type, denials by reason, signature checks by result, plus events/s
+and verifications/s over the last round. Metrics can be exported at every
+ROUND_END as Prometheus text or JSON.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from sie.kernel import Kernel
+from sie.types import Event, EventType, IntentPayload
+
+# Histogram upper bounds in seconds: 1us to ~1s, four buckets per decade
+BUCKETS = tuple(round(10 ** (e / 4 - 6), 9) for e in range(25))
+
+# Events whose data carries a denial reason
+DENIAL_EVENTS = (EventType.INTENT_DENIED, EventType.ESCALATION_DENIED)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        running = 0
+        out = []
+        for n in self.counts:
+            running += n
+            out.append(running)
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], self.cumulative())),
+            "sum": self.total,
+            "count": self.count,
+        }
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.stages: dict[str, Histogram] = {}
+        self.events: Counter[str] = Counter()
+        self.denials: Counter[str] = Counter()
+        self.verifications: Counter[str] = Counter()
+        self.round = -1
+        self.events_per_second = 0.0
+        self.verifications_per_second = 0.0
+        self._mark = (time.perf_counter(), 0, 0)
+        # Stage in progress and when it started
+        self._stage: Histogram | None = None
+        self._started = 0.0
+
+    def stage(self, name: str) -> Histogram:
+        histogram = self.stages.get(name)
+        if histogram is None:
+            histogram = self.stages[name] = Histogram()
+        return histogram
+
+    def on_stage(self, name: str | None, intent: IntentPayload) -> None:
+        """Kernel stage hook: close the running stage and start ``name``."""
+        now = time.perf_counter()
+        if self._stage is not None:
+            self._stage.observe(now - self._started)
+        if name is None:
+            self._stage = None
+            return
+        self._stage = self.stage(f"handler.{intent.action}" if name == "handler" else name)
+        self._started = time.perf_counter()
+
+    def on_event(self, event: Event) -> None:
+        self.events[event.event_type.value] += 1
+        if event.event_type in DENIAL_EVENTS:
+            self.denials[event.data.get("reason", "unknown")] += 1
+        elif event.event_type == EventType.INTENT_SUBMITTED:
+            self.verifications["ok"] += 1
+        elif event.event_type == EventType.SIGNATURE_INVALID:
+            self.denials["invalid_signature"] += 1
+            self.verifications["failed"] += 1
+        elif event.event_type == EventType.ROUND_END:
+            self.end_round(event.data["round"])
+
+    def end_round(self, round_num: int) -> None:
+        now = time.perf_counter()
+        events = sum(self.events.values())
+        verifications = sum(self.verifications.values())
+        then, events_before, verifications_before = self._mark
+        elapsed = now - then
+        if elapsed > 0:
+            self.events_per_second = (events - events_before) / elapsed
+            self.verifications_per_second = (verifications - verifications_before) / elapsed
+        self._mark = (now, events, verifications)
+        self.round = round_num
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "round": self.round,
+            "stages": {name: h.to_dict() for name, h in sorted(self.stages.items())},
+            "events": dict(sorted(self.events.items())),
+            "denials": dict(sorted(self.denials.items())),
+            "verifications": dict(sorted(self.verifications.items())),
+            "events_per_second": self.events_per_second,
+            "verifications_per_second": self.verifications_per_second,
+        }
+
+    def to_prometheus(self) -> str:
+        lines = ["# TYPE sie_stage_seconds histogram"]
+        for name, h in sorted(self.stages.items()):
+            for le, n in zip([*map(str, BUCKETS), "+Inf"], h.cumulative()):
+                lines.append(f'sie_stage_seconds_bucket{{stage="{name}",le="{le}"}} {n}')
+            lines.append(f'sie_stage_seconds_sum{{stage="{name}"}} {h.total}')
+            lines.append(f'sie_stage_seconds_count{{stage="{name}"}} {h.count}')
+        for metric, label, counter in (
+            ("sie_events_total", "type", self.events),
+            ("sie_denials_total", "reason", self.denials),
+            ("sie_verifications_total", "result", self.verifications),
+        ):
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f'{metric}{{{label}="{key}"}} {n}' for key, n in sorted(counter.items()))
+        lines.append("# TYPE sie_events_per_second gauge")
+        lines.append(f"sie_events_per_second {self.events_per_second}")
+        lines.append("# TYPE sie_verifications_per_second gauge")
+        lines.append(f"sie_verifications_per_second {self.verifications_per_second}")
+        lines.append("# TYPE sie_round gauge")
+        lines.append(f"sie_round {self.round}")
+        return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def prometheus_exporter(path: str) -> Callable[[Metrics], None]:
+    return lambda metrics: _write_atomic(path, metrics.to_prometheus())
+
+
+def json_exporter(path: str) -> Callable[[Metrics], None]:
+    return lambda metrics: _write_atomic(path, json.dumps(metrics.to_dict(), indent=2) + "\n")
+
+
+def instrument(kernel: Kernel, exporters: tuple[Callable[[Metrics], None], ...] = ()) -> Metrics:
+    """Enable instrumentation on one kernel; exporters run at every ROUND_END."""
+    metrics = Metrics()
+    kernel.stage_hook = metrics.on_stage
+
+    def listener(event: Event) -> None:
+        metrics.on_event(event)
+        if event.event_type == EventType.ROUND_END:
+            for export in exporters:
+                export(metrics)
+
+    kernel.log.subscribe(listener)
+    return metrics
@@ -0,0 +1,64 @@
+"""
+Governance policy: every tunable constant in one object.
+
+The module-level constants in sie.systems.* and here remain the defaults.
+Each field's default is read from its constant when a Policy is created, so
+Policy() (or Policy.current()) follows constants patched at runtime, and a
+Kernel built without an explicit policy behaves exactly as before.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+from sie.systems import reputation, sandbox, tier
+
+# Simulation defaults
+INITIAL_BUDGET = 100.0
+NUM_ROUNDS = 15
+
+
+@dataclass(frozen=True)
+class Policy:
+    # Reputation adjustments
+    task_success: float = field(default_factory=lambda: reputation.TASK_SUCCESS)
+    efficiency_bonus: float = field(default_factory=lambda: reputation.EFFICIENCY_BONUS)
+    deception: float = field(default_factory=lambda: reputation.DECEPTION)
+    budget_abuse: float = field(default_factory=lambda: reputation.BUDGET_ABUSE)
+    provide_influence: float = field(default_factory=lambda: reputation.PROVIDE_INFLUENCE)
+    boundary_violation: float = field(default_factory=lambda: reputation.BOUNDARY_VIOLATION)
+    decay_rate: float = field(default_factory=lambda: reputation.DECAY_RATE)
+    decay_baseline: float = field(default_factory=lambda: reputation.DECAY_BASELINE)
+
+    # Violation thresholds
+    sandbox_threshold: int = field(default_factory=lambda: sandbox.SANDBOX_THRESHOLD)
+    ban_threshold: int = field(default_factory=lambda: sandbox.BAN_THRESHOLD)
+
+    # Minimum reputation per tier
+    tier_thresholds: dict[int, float] = field(default_factory=lambda: dict(tier.TIER_THRESHOLDS))
+
+    # Simulation
+    initial_budget: float = field(default_factory=lambda: INITIAL_BUDGET)
+    num_rounds: int = field(default_factory=lambda: NUM_ROUNDS)
+
+    # Derived tier lookup, see tier.tier_for
+    tier_cutoffs: list[float] = field(init=False, repr=False, compare=False)
+    tier_levels: list[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # JSON round-trips (sweep configs, snapshots) turn tier keys into strings
+        object.__setattr__(self, "tier_thresholds", {int(t): v for t, v in self.tier_thresholds.items()})
+        cutoffs, levels = tier.lookup(self.tier_thresholds)
+        object.__setattr__(self, "tier_cutoffs", cutoffs)
+        object.__setattr__(self, "tier_levels", levels)
+
+    @classmethod
+    def current(cls) -> Policy:
+        """The policy defined by the module-level constants right now."""
+        return cls()
+
+    def with_changes(self, **changes: Any) -> Policy:
+        return replace(self, **changes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
@@ -0,0 +1,171 @@
+"""
+Event-sourced replay.
+
+Rebuilds Kernel.agents by folding over an event stream: every state change
+the kernel makes is logged with enough data to redo it, so no agent is run
+and no signature is checked. A fold is a single pass holding one AgentState
+per agent. Replayer adds periodic checkpoints over an EventLog (in-memory or
+on disk) to answer "state after the first N events" without a full pass.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+
+from sie.event_log import EventLog
+from sie.systems import reputation
+from sie.types import AgentState, Event, EventType
+
+CHECKPOINT_EVERY = 100_000
+
+Agents = dict[str, AgentState]
+
+
+def _registered(agents: Agents, e: Event) -> None:
+    agents[e.agent_id] = AgentState(agent_id=e.agent_id)
+
+
+def _balance(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].budget = e.data["new_balance"]
+
+
+def _reputation(agents: Agents, e: Event) -> None:
+    # "new" is rounded for display; the delta reproduces the exact value
+    state = agents[e.agent_id]
+    state.reputation = max(0.0, min(1.0, state.reputation + e.data["delta"]))
+
+
+def _decayed(agents: Agents, e: Event) -> None:
+    rate, baseline = e.data["rate"], e.data["baseline"]
+    for state in agents.values():
+        state.reputation = reputation.decayed(state.reputation, rate, baseline)
+
+
+def _tier(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].tier = e.data["new_tier"]
+
+
+def _sandboxed(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].sandboxed = True
+
+
+def _banned(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].banned = True
+
+
+def _violation(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].violation_count = e.data["count"]
+
+
+def _assigned(agents: Agents, e: Event) -> None:
+    state = agents[e.agent_id]
+    state.current_task_id = e.data["task_id"]
+    state.current_task_steps = 0
+
+
+def _step(agents: Agents, e: Event) -> None:
+    state = agents[e.agent_id]
+    state.current_task_steps = e.data["step"]
+    state.steps_taken += 1
+
+
+def _validated(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].tasks_completed += 1
+
+
+def _failed(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].tasks_failed += 1
+
+
+def _requested(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].influence_requests.append(e.data["task_id"])
+
+
+def _provided(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].influence_provided.append(e.data["task_id"])
+
+
+def _fulfilled(agents: Agents, e: Event) -> None:
+    agents[e.agent_id].has_received_influence = True
+
+
+# State transition per event type; other event types change no state
+FOLDS: dict[EventType, Callable[[Agents, Event], None]] = {
+    EventType.AGENT_REGISTERED: _registered,
+    EventType.BUDGET_ALLOCATED: _balance,
+    EventType.BUDGET_DEBITED: _balance,
+    EventType.BUDGET_DEFUNDED: _balance,
+    EventType.REPUTATION_ADJUSTED: _reputation,
+    EventType.REPUTATION_DECAYED: _decayed,
+    EventType.TIER_UPGRADED: _tier,
+    EventType.TIER_DOWNGRADED: _tier,
+    EventType.AGENT_SANDBOXED: _sandboxed,
+    EventType.AGENT_BANNED: _banned,
+    EventType.VIOLATION_RECORDED: _violation,
+    EventType.TASK_ASSIGNED: _assigned,
+    EventType.TASK_STEP: _step,
+    EventType.TASK_VALIDATED: _validated,
+    EventType.TASK_FAILED: _failed,
+    EventType.INFLUENCE_REQUESTED: _requested,
+    EventType.INFLUENCE_PROVIDED: _provided,
+    EventType.INFLUENCE_FULFILLED: _fulfilled,
+}
+
+
+def replay(events: Iterable[Event], agents: Agents | None = None) -> Agents:
+    """Fold events into agent states, starting from ``agents`` (updated in place) or nothing."""
+    agents = {} if agents is None else agents
+    folds = FOLDS
+    for e in events:
+        fold = folds.get(e.event_type)
+        if fold is not None:
+            fold(agents, e)
+    return agents
+
+
+def copy_agents(agents: Agents) -> Agents:
+    return {
+        agent_id: replace(
+            state,
+            influence_requests=list(state.influence_requests),
+            influence_provided=list(state.influence_provided),
+        )
+        for agent_id, state in agents.items()
+    }
+
+
+class Replayer:
+    """Replays an EventLog once, keeping a copy of the state every ``checkpoint_every`` events."""
+
+    def __init__(self, log: EventLog, checkpoint_every: int = CHECKPOINT_EVERY) -> None:
+        self.log = log
+        self.checkpoint_every = checkpoint_every
+        self._counts: list[int] = [0]
+        self._checkpoints: list[Agents] = [{}]
+        self.agents: Agents = {}
+        self._replayed = 0
+        self.update()
+
+    def update(self) -> Agents:
+        """Fold in events appended since the last call; returns the current state."""
+        agents = self.agents
+        every = self.checkpoint_every
+        count = self._replayed
+        while count < len(self.log):
+            stop = min((count // every + 1) * every, len(self.log))
+            replay(self.log.iter_range(count, stop), agents)
+            count = stop
+            if count % every == 0:
+                self._counts.append(count)
+                self._checkpoints.append(copy_agents(agents))
+        self._replayed = count
+        return agents
+
+    def state_at(self, count: int) -> Agents:
+        """Agent states after the first ``count`` events (a fresh copy)."""
+        if not 0 <= count <= self._replayed:
+            raise ValueError(f"state_at({count}) outside the {self._replayed} replayed events")
+        i = bisect_right(self._counts, count) - 1
+        agents = copy_agents(self._checkpoints[i])
+        return replay(self.log.iter_range(self._counts[i], count), agents)
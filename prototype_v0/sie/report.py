@@ -1,119 +1,153 @@
+"""
+Simulation report.
+
+write_report makes a single pass over the events, feeding each one to the
+section accumulators (governance, influence, signature sweep, chain and
+post-ban checks), and writes to the file handle as it goes. The events
+default to the kernel's log but may be any in-order iterable, e.g.
+``read_range`` over a persisted log's directory, which is never loaded whole.
+"""
 from __future__ import annotations
 
-from sie.crypto import derive_keypair, verify
+import io
+from collections.abc import Iterable
+from typing import TextIO
+
+from sie.event_log import GENESIS_HASH, chain_hash
 from sie.kernel import Kernel
-from sie.types import EventType
+from sie.types import Event, EventType
+from sie.verify_sweep import StreamingSweep
+
+GOVERNANCE_TYPES = (
+    EventType.AGENT_SANDBOXED, EventType.AGENT_BANNED, EventType.DECEPTION_FLAGGED,
+    EventType.BUDGET_EXCEEDED, EventType.BUDGET_DEFUNDED, EventType.ESCALATION_DENIED,
+    EventType.TIER_UPGRADED, EventType.TIER_DOWNGRADED,
+)
+
 
+def _influence_line(e: Event) -> str:
+    if e.event_type == EventType.INFLUENCE_REQUESTED:
+        return f"  REQUEST:  seq={e.sequence} agent={e.agent_id} task={e.data.get('task_id')}"
+    if e.event_type == EventType.INFLUENCE_PROVIDED:
+        return f"  PROVIDED: seq={e.sequence} agent={e.agent_id} -> {e.data.get('to')} task={e.data.get('task_id')}"
+    return f"  FULFILLED: seq={e.sequence} agent={e.agent_id} <- {e.data.get('from')} task={e.data.get('task_id')}"
 
-def generate_report(kernel: Kernel) -> str:
-    log = kernel.log
-    lines: list[str] = []
 
-    lines.append("=" * 60)
-    lines.append("SIE KERNEL PROTOTYPE v0 — SIMULATION REPORT")
-    lines.append("=" * 60)
-    lines.append("")
+def write_report(
+    kernel: Kernel,
+    fp: TextIO,
+    events: Iterable[Event] | None = None,
+    origin: tuple[int, bytes] | None = None,
+    workers: int | None = None,
+) -> None:
+    """Write the report for ``kernel`` to fp in one pass over ``events``.
+
+    ``origin`` is the (sequence, chain hash) the events continue from; it
+    defaults to the kernel log's own origin, or to genesis for other events.
+    Signatures are checked serially unless ``workers`` asks for a pool.
+    """
+    if events is None:
+        events = kernel.log
+        origin = origin or kernel.log.origin
+    expected, head = origin or (0, GENESIS_HASH)
+    last = head
+
+    fp.write("=" * 60 + "\n")
+    fp.write("SIE KERNEL PROTOTYPE v0 — SIMULATION REPORT\n")
+    fp.write("=" * 60 + "\n\n")
 
     # Per-agent outcomes
-    lines.append("AGENT OUTCOMES")
-    lines.append("-" * 40)
+    fp.write("AGENT OUTCOMES\n")
+    fp.write("-" * 40 + "\n")
     for agent_id, state in sorted(kernel.agents.items()):
-        lines.append(f"\n  Agent: {agent_id}")
-        lines.append(f"    Budget:       {state.budget:.2f}")
-        lines.append(f"    Reputation:   {state.reputation:.4f}")
-        lines.append(f"    Tier:         {state.tier}")
-        lines.append(f"    Sandboxed:    {state.sandboxed}")
-        lines.append(f"    Banned:       {state.banned}")
-        lines.append(f"    Violations:   {state.violation_count}")
-        lines.append(f"    Tasks Done:   {state.tasks_completed}")
-        lines.append(f"    Tasks Failed: {state.tasks_failed}")
-        lines.append(f"    Steps Taken:  {state.steps_taken}")
-
-    lines.append("")
-    lines.append("GOVERNANCE EVENTS")
-    lines.append("-" * 40)
-
-    for etype in [EventType.AGENT_SANDBOXED, EventType.AGENT_BANNED, EventType.DECEPTION_FLAGGED,
-                  EventType.BUDGET_EXCEEDED, EventType.BUDGET_DEFUNDED, EventType.ESCALATION_DENIED,
-                  EventType.TIER_UPGRADED, EventType.TIER_DOWNGRADED]:
-        events = log.events_of_type(etype)
-        if events:
-            lines.append(f"\n  {etype.value} ({len(events)} events):")
-            for e in events:
-                lines.append(f"    seq={e.sequence} agent={e.agent_id} {e.data}")
+        fp.write(
+            f"\n  Agent: {agent_id}\n"
+            f"    Budget:       {state.budget:.2f}\n"
+            f"    Reputation:   {state.reputation:.4f}\n"
+            f"    Tier:         {state.tier}\n"
+            f"    Sandboxed:    {state.sandboxed}\n"
+            f"    Banned:       {state.banned}\n"
+            f"    Violations:   {state.violation_count}\n"
+            f"    Tasks Done:   {state.tasks_completed}\n"
+            f"    Tasks Failed: {state.tasks_failed}\n"
+            f"    Steps Taken:  {state.steps_taken}\n"
+        )
+
+    governance: dict[EventType, list[str]] = {etype: [] for etype in GOVERNANCE_TYPES}
+    influence: dict[EventType, list[str]] = {
+        EventType.INFLUENCE_REQUESTED: [],
+        EventType.INFLUENCE_PROVIDED: [],
+        EventType.INFLUENCE_FULFILLED: [],
+    }
+    signatures = StreamingSweep(kernel.public_keys, workers)
+    chain_ok = contiguous = True
+    total = 0
+    # Intents per agent since that agent's latest ban
+    since_ban: dict[str, int] = {}
+
+    try:
+        for e in events:
+            etype = e.event_type
+            if contiguous and e.sequence != expected:
+                contiguous = chain_ok = False
+            if chain_ok:
+                head = chain_hash(head, e.encode())
+                chain_ok = head == e.chain_hash
+            last = e.chain_hash
+            expected = e.sequence + 1
+            total += 1
+
+            if etype == EventType.INTENT_SUBMITTED:
+                signatures.add(e)
+                if e.agent_id in since_ban:
+                    since_ban[e.agent_id] += 1
+            elif etype in governance:
+                governance[etype].append(f"    seq={e.sequence} agent={e.agent_id} {e.data}")
+                if etype == EventType.AGENT_BANNED:
+                    since_ban[e.agent_id] = 0
+            elif etype in influence:
+                influence[etype].append(_influence_line(e))
+        total_intents, verified_count, failed_count = signatures.result()
+    finally:
+        signatures.close()
+
+    fp.write("\nGOVERNANCE EVENTS\n")
+    fp.write("-" * 40 + "\n")
+    for etype, lines in governance.items():
+        if lines:
+            fp.write(f"\n  {etype.value} ({len(lines)} events):\n")
+            fp.writelines(line + "\n" for line in lines)
 
     # Influence chains
-    lines.append("")
-    lines.append("INFLUENCE CHAINS")
-    lines.append("-" * 40)
-    requested = log.events_of_type(EventType.INFLUENCE_REQUESTED)
-    provided = log.events_of_type(EventType.INFLUENCE_PROVIDED)
-    fulfilled = log.events_of_type(EventType.INFLUENCE_FULFILLED)
-    if requested:
-        for e in requested:
-            lines.append(f"  REQUEST:  seq={e.sequence} agent={e.agent_id} task={e.data.get('task_id')}")
-    if provided:
-        for e in provided:
-            lines.append(f"  PROVIDED: seq={e.sequence} agent={e.agent_id} -> {e.data.get('to')} task={e.data.get('task_id')}")
-    if fulfilled:
-        for e in fulfilled:
-            lines.append(f"  FULFILLED: seq={e.sequence} agent={e.agent_id} <- {e.data.get('from')} task={e.data.get('task_id')}")
-
-    if not requested and not provided and not fulfilled:
-        lines.append("  (none)")
+    fp.write("\nINFLUENCE CHAINS\n")
+    fp.write("-" * 40 + "\n")
+    for lines in influence.values():
+        fp.writelines(line + "\n" for line in lines)
+    if not any(influence.values()):
+        fp.write("  (none)\n")
 
     # Signature verification sweep
-    lines.append("")
-    lines.append("SIGNATURE VERIFICATION SWEEP")
-    lines.append("-" * 40)
-    intent_events = log.events_of_type(EventType.INTENT_SUBMITTED)
-    verified_count = 0
-    failed_count = 0
-    for e in intent_events:
-        if e.signature and e.agent_id in kernel.public_keys:
-            _, pub = derive_keypair(e.agent_id)
-            # Reconstruct the intent payload
-            from sie.types import IntentPayload
-            payload = IntentPayload(
-                action=e.data.get("action", ""),
-                task_id=e.data.get("task_id", ""),
-                detail=e.data.get("detail", ""),
-            )
-            sig_bytes = bytes.fromhex(e.signature)
-            if verify(pub, payload.serialize(), sig_bytes):
-                verified_count += 1
-            else:
-                failed_count += 1
-
-    lines.append(f"  Total INTENT_SUBMITTED events: {len(intent_events)}")
-    lines.append(f"  Verified:   {verified_count}")
-    lines.append(f"  Failed:     {failed_count}")
+    fp.write("\nSIGNATURE VERIFICATION SWEEP\n")
+    fp.write("-" * 40 + "\n")
+    fp.write(f"  Total INTENT_SUBMITTED events: {total_intents}\n")
+    fp.write(f"  Verified:   {verified_count}\n")
+    fp.write(f"  Failed:     {failed_count}\n")
 
     # Log integrity
-    lines.append("")
-    lines.append("LOG INTEGRITY")
-    lines.append("-" * 40)
-    all_events = log.events
-    contiguous = all(all_events[i].sequence == i for i in range(len(all_events)))
-    lines.append(f"  Total events:      {len(all_events)}")
-    lines.append(f"  Contiguous seqs:   {contiguous}")
-
-    # Check no post-ban events from banned agents
-    banned_at: dict[str, int] = {}
-    post_ban_events = 0
-    for e in all_events:
-        if e.event_type == EventType.AGENT_BANNED:
-            banned_at[e.agent_id] = e.sequence
-    for e in all_events:
-        if e.agent_id in banned_at and e.sequence > banned_at[e.agent_id]:
-            if e.event_type == EventType.INTENT_SUBMITTED:
-                post_ban_events += 1
-    lines.append(f"  Post-ban intents:  {post_ban_events}")
-
-    lines.append("")
-    lines.append("=" * 60)
-    lines.append("END OF REPORT")
-    lines.append("=" * 60)
-    lines.append("")
-
-    return "\n".join(lines)
+    fp.write("\nLOG INTEGRITY\n")
+    fp.write("-" * 40 + "\n")
+    fp.write(f"  Total events:      {total}\n")
+    fp.write(f"  Contiguous seqs:   {contiguous}\n")
+    fp.write(f"  Hash chain:        {'intact' if chain_ok else 'BROKEN'}\n")
+    fp.write(f"  Chain head:        {last.hex()}\n")
+    fp.write(f"  Post-ban intents:  {sum(since_ban.values())}\n")
+
+    fp.write("\n" + "=" * 60 + "\n")
+    fp.write("END OF REPORT\n")
+    fp.write("=" * 60 + "\n")
+
+
+def generate_report(kernel: Kernel, workers: int | None = None) -> str:
+    buf = io.StringIO()
+    write_report(kernel, buf, workers=workers)
+    return buf.getvalue()
@@ -0,0 +1,151 @@
+"""
+Seeded synthetic scenarios for load testing.
+
+generate_scenario builds M tasks with a difficulty and tier mix and N agent
+configs with a behavior mix, all from one seed, in the (tasks, agent_configs)
+shape build_simulation takes. Only plain configs are generated here; agents
+are constructed by build_simulation and derive their keys on first use.
+
+Agents are named "<behavior>-<n>", numbered from 1 per behavior as in the
+standard simulation, so efficient-1 provides influence when present.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from sie.agents.base import BaseAgent
+from sie.agents.boundary import BoundaryAgent
+from sie.agents.deceptive import DeceptiveAgent
+from sie.agents.efficient import EfficientAgent
+from sie.agents.looper import LooperAgent
+from sie.agents.naive import NaiveAgent
+from sie.agents.specialist import SpecialistAgent
+from sie.compact_log import CompactEventLog
+from sie.main import AgentConfig, build_simulation, run_simulation
+from sie.types import Task
+
+BEHAVIORS: dict[str, type[BaseAgent]] = {
+    "efficient": EfficientAgent,
+    "looper": LooperAgent,
+    "deceptive": DeceptiveAgent,
+    "specialist": SpecialistAgent,
+    "naive": NaiveAgent,
+    "boundary": BoundaryAgent,
+}
+
+# Behaviors whose constructors also take expected_output and required_steps
+OUTPUT_BEHAVIORS = ("efficient", "specialist", "naive")
+
+DEFAULT_BEHAVIOR_MIX = {name: 1.0 for name in BEHAVIORS}
+DEFAULT_DIFFICULTY_MIX = {"easy": 0.7, "hard": 0.3}
+DEFAULT_TIER_MIX = {0: 0.8, 1: 0.1, 2: 0.1}
+# Fraction of hard tasks that require influence
+INFLUENCE_SHARE = 0.5
+
+# difficulty -> (min steps, max steps, budget cost per step)
+DIFFICULTY_PROFILES = {
+    "easy": (2, 3, 5.0),
+    "hard": (4, 6, 8.0),
+}
+
+
+@dataclass
+class Scenario:
+    seed: int
+    tasks: list[Task]
+    agent_configs: list[AgentConfig]
+
+
+def _pick(rng: random.Random, mix: Mapping, k: int) -> list:
+    return rng.choices(list(mix), weights=list(mix.values()), k=k)
+
+
+def generate_tasks(
+    num_tasks: int,
+    rng: random.Random,
+    difficulty_mix: Mapping[str, float] = DEFAULT_DIFFICULTY_MIX,
+    tier_mix: Mapping[int, float] = DEFAULT_TIER_MIX,
+) -> list[Task]:
+    tasks = []
+    for i, (difficulty, tier) in enumerate(zip(_pick(rng, difficulty_mix, num_tasks), _pick(rng, tier_mix, num_tasks))):
+        low, high, cost = DIFFICULTY_PROFILES[difficulty]
+        tasks.append(Task(
+            task_id=f"task-{difficulty}-{i + 1}",
+            difficulty=difficulty,
+            required_steps=rng.randint(low, high),
+            expected_output=f"OUT-{rng.getrandbits(32):08x}",
+            budget_cost_per_step=cost,
+            requires_tier=tier,
+            requires_influence=difficulty == "hard" and rng.random() < INFLUENCE_SHARE,
+        ))
+    return tasks
+
+
+def _task_pools(tasks: list[Task]) -> dict[str, list[Task]]:
+    """Tasks each behavior is drawn from: specialists take influence tasks and
+    boundary agents privileged ones when any exist; everyone else any task."""
+    influence = [t for t in tasks if t.requires_influence]
+    privileged = [t for t in tasks if t.requires_tier > 0]
+    pools = {name: tasks for name in BEHAVIORS}
+    pools["specialist"] = influence or tasks
+    pools["boundary"] = privileged or tasks
+    return pools
+
+
+def generate_scenario(
+    num_agents: int,
+    num_tasks: int,
+    seed: int = 0,
+    behavior_mix: Mapping[str, float] = DEFAULT_BEHAVIOR_MIX,
+    difficulty_mix: Mapping[str, float] = DEFAULT_DIFFICULTY_MIX,
+    tier_mix: Mapping[int, float] = DEFAULT_TIER_MIX,
+) -> Scenario:
+    unknown = set(behavior_mix) - set(BEHAVIORS)
+    if unknown:
+        raise ValueError(f"unknown behaviors: {sorted(unknown)}")
+    rng = random.Random(seed)
+    tasks = generate_tasks(num_tasks, rng, difficulty_mix, tier_mix)
+    pools = _task_pools(tasks)
+
+    counters = dict.fromkeys(BEHAVIORS, 0)
+    configs: list[AgentConfig] = []
+    for behavior in _pick(rng, behavior_mix, num_agents):
+        counters[behavior] += 1
+        pool = pools[behavior]
+        task = pool[rng.randrange(len(pool))]
+        kwargs = {"task_id": task.task_id}
+        if behavior in OUTPUT_BEHAVIORS:
+            kwargs["expected_output"] = task.expected_output
+            kwargs["required_steps"] = task.required_steps
+        configs.append((f"{behavior}-{counters[behavior]}", BEHAVIORS[behavior], kwargs))
+    return Scenario(seed, tasks, configs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build (and optionally run) a synthetic scenario.")
+    parser.add_argument("--agents", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=0, help="rounds to run after building (default: build only)")
+    parser.add_argument("--compact", action="store_true", help="log into a CompactEventLog")
+    parser.add_argument("--workers", type=int, default=0, help="threads for speculative agent decisions, a correctness check rather than a speedup (default: serial)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    scenario = generate_scenario(args.agents, args.tasks, args.seed)
+    t1 = time.perf_counter()
+    log = CompactEventLog() if args.compact else None
+    kernel, agents = build_simulation(log, tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+    t2 = time.perf_counter()
+    print(f"generate={t1 - t0:.2f}s  build={t2 - t1:.2f}s  agents={len(agents):,}  events={len(kernel.log):,}")
+    if args.rounds:
+        run_simulation(kernel, agents, num_rounds=args.rounds, workers=args.workers)
+        print(f"run={time.perf_counter() - t2:.2f}s  events={len(kernel.log):,}")
+
+
+if __name__ == "__main__":
+    main()
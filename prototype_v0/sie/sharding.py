@@ -0,0 +1,222 @@
+"""
+Sharded simulation runner.
+
+Agents are partitioned across shards by a stable hash of agent_id. Each shard
+owns a Kernel and EventLog for its agents and runs them in its own process
+(or in-process, for testing). Shards only interact at round barriers:
+
+1. act        every shard runs its agents' act() for the round
+2. provide    pending influence requests from all shards, in shard order, are
+              offered to the provider; influence for a requester on another
+              shard is half-applied and queued as an outbox message
+3. deliver    outbox messages are applied on the requester's shard
+4. decay      per-shard reputation decay, when the policy's decay_rate is set
+
+After each phase the coordinator appends the shards' new events to the
+global log in shard order, so the merged log depends only on the agent set
+and the shard count. With one shard it is identical to run_simulation's log.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import zlib
+from collections.abc import Sequence
+from multiprocessing.connection import Connection
+from typing import Any
+
+from sie.crypto import KEY_REGISTRY
+from sie.event_log import EventLog
+from sie.kernel import Kernel
+from sie.main import AGENT_CONFIGS, TASKS, AgentConfig, process_influence_queue
+from sie.policy import Policy
+from sie.types import AgentState, EventType, Task
+
+# (event_type, agent_id, data, signature), as passed to EventLog.append
+EventTuple = tuple[EventType, str, dict[str, Any], str]
+
+
+def shard_of(agent_id: str, num_shards: int) -> int:
+    return zlib.crc32(agent_id.encode()) % num_shards
+
+
+class Shard:
+    """One partition of the agents with its own Kernel and EventLog."""
+
+    def __init__(self, agent_configs: Sequence[AgentConfig], tasks: Sequence[Task], remote: frozenset[str], policy: Policy) -> None:
+        self.kernel = Kernel(EventLog(), policy=policy)
+        self.kernel.remote_agents = remote
+        self._mark = 0
+        for task in tasks:
+            self.kernel.register_task(task)
+        self.agents = []
+        for agent_id, agent_cls, kwargs in agent_configs:
+            agent = agent_cls(agent_id=agent_id, **kwargs)
+            self.kernel.register_agent(agent_id, None, policy.initial_budget)
+            self.kernel.assign_task_to_agent(agent_id, kwargs["task_id"])
+            self.agents.append(agent)
+
+    def drain(self) -> list[EventTuple]:
+        """Events logged since the last drain."""
+        log = self.kernel.log
+        events = [(e.event_type, e.agent_id, e.data, e.signature) for e in log.iter_range(self._mark)]
+        self._mark = len(log)
+        return events
+
+    def act(self, round_num: int) -> None:
+        for agent in self.agents:
+            agent.act(self.kernel, round_num)
+
+    def pending(self) -> list[dict[str, str]]:
+        return self.kernel.influence_queue.pending_requests()
+
+    def provide(self, pending: list[dict[str, str]]) -> list[tuple[str, str, str, str]]:
+        process_influence_queue(self.kernel, self.agents, pending)
+        outbox, self.kernel.outbox = self.kernel.outbox, []
+        return outbox
+
+    def deliver(self, messages: list[tuple[str, str, str, str]]) -> None:
+        for message in messages:
+            self.kernel.deliver(message)
+
+    def decay(self, rate: float) -> None:
+        self.kernel.decay_reputation(rate)
+
+    def states(self) -> dict[str, AgentState]:
+        return {
+            agent_id: state if isinstance(state, AgentState) else state.to_state()
+            for agent_id, state in self.kernel.agents.items()
+        }
+
+
+class LocalShard:
+    """Runs a Shard in this process behind the same send/recv protocol as ShardProcess."""
+
+    def __init__(self, *args: Any) -> None:
+        self._shard = Shard(*args)
+        self._result: Any = None
+
+    def send(self, command: str, *args: Any) -> None:
+        self._result = getattr(self._shard, command)(*args)
+
+    def recv(self) -> Any:
+        return self._result
+
+    def close(self) -> None:
+        pass
+
+
+def _serve(conn: Connection, args: tuple[Any, ...]) -> None:
+    shard = Shard(*args)
+    while True:
+        command, call_args = conn.recv()
+        if command == "close":
+            break
+        conn.send(getattr(shard, command)(*call_args))
+    conn.close()
+
+
+class ShardProcess:
+    """Runs a Shard in a child process; commands and results go over a pipe."""
+
+    def __init__(self, *args: Any) -> None:
+        self._conn, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_serve, args=(child, args), daemon=True)
+        self._process.start()
+        child.close()
+
+    def send(self, command: str, *args: Any) -> None:
+        self._conn.send((command, args))
+
+    def recv(self) -> Any:
+        return self._conn.recv()
+
+    def close(self) -> None:
+        self._conn.send(("close", ()))
+        self._process.join()
+        self._conn.close()
+
+
+def _broadcast(shards: Sequence[LocalShard | ShardProcess], command: str, *args: Any) -> list[Any]:
+    """Send a command to every shard, then collect the results in shard order."""
+    for shard in shards:
+        shard.send(command, *args)
+    return [shard.recv() for shard in shards]
+
+
+def _merge(log: EventLog, shards: Sequence[LocalShard | ShardProcess]) -> None:
+    for events in _broadcast(shards, "drain"):
+        for event_type, agent_id, data, signature in events:
+            log.append(event_type, agent_id, data, signature)
+
+
+def run_sharded(
+    agent_configs: Sequence[AgentConfig] = AGENT_CONFIGS,
+    tasks: Sequence[Task] = TASKS,
+    num_shards: int = 2,
+    log: EventLog | None = None,
+    processes: bool = True,
+    policy: Policy | None = None,
+) -> Kernel:
+    """Run the simulation across ``num_shards`` shards and merge their logs.
+
+    Returns a Kernel over the merged log holding the agents' final states,
+    suitable for generate_report. ``processes=False`` runs every shard in
+    this process.
+    """
+    log = log if log is not None else EventLog()
+    policy = policy if policy is not None else Policy.current()
+    num_rounds = policy.num_rounds
+    partitions: list[list[AgentConfig]] = [[] for _ in range(num_shards)]
+    for config in agent_configs:
+        partitions[shard_of(config[0], num_shards)].append(config)
+    all_ids = frozenset(config[0] for config in agent_configs)
+
+    shard_cls = ShardProcess if processes else LocalShard
+    shards = [
+        shard_cls(part, tasks, all_ids.difference(c[0] for c in part), policy)
+        for part in partitions
+    ]
+    try:
+        _merge(log, shards)
+        for round_num in range(num_rounds):
+            log.append(EventType.ROUND_START, "kernel", {"round": round_num})
+            _broadcast(shards, "act", round_num)
+            _merge(log, shards)
+
+            pending = [req for reqs in _broadcast(shards, "pending") for req in reqs]
+            if pending:
+                routed: list[list[tuple[str, str, str, str]]] = [[] for _ in shards]
+                for outbox in _broadcast(shards, "provide", pending):
+                    for message in outbox:
+                        routed[shard_of(message[1], num_shards)].append(message)
+                _merge(log, shards)
+                for shard, messages in zip(shards, routed):
+                    shard.send("deliver", messages)
+                for shard in shards:
+                    shard.recv()
+                _merge(log, shards)
+
+            rate = policy.decay_rate
+            if rate:
+                log.append(EventType.REPUTATION_DECAYED, "kernel", {"rate": rate, "baseline": policy.decay_baseline})
+                _broadcast(shards, "decay", rate)
+                _merge(log, shards)
+
+            log.append(EventType.ROUND_END, "kernel", {"round": round_num})
+        log.append(EventType.SIMULATION_COMPLETE, "kernel", {"total_rounds": num_rounds})
+        states = _broadcast(shards, "states")
+    finally:
+        for shard in shards:
+            shard.close()
+
+    kernel = Kernel(log, policy=policy)
+    for task in tasks:
+        kernel.register_task(task)
+    for agent_id, _, _ in agent_configs:
+        kernel.agents[agent_id] = states[shard_of(agent_id, num_shards)][agent_id]
+        kernel.key_seeds[agent_id] = agent_id
+    KEY_REGISTRY.reserve(len(kernel.key_seeds))
+    # Keys only for agents that submitted intents, as on the shards
+    for agent_id in dict.fromkeys(e.agent_id for e in log.events_of_type(EventType.INTENT_SUBMITTED)):
+        kernel.public_key(agent_id)
+    return kernel
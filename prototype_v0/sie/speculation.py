@@ -0,0 +1,229 @@
+"""
+Two-phase rounds: parallel speculative decisions, serial commit.
+
+Phase one runs every agent's act() in a thread pool against a
+SpeculativeKernel. The proxy reads the real kernel, which nothing writes
+during this phase, and keeps a transcript of what the agent saw and did:
+each attribute it read from an AgentState, and each signed intent, verified
+there and reported as accepted.
+
+Phase two walks the transcripts serially in agent order. Reads are checked
+against the kernel as it now stands and intents are applied, with their
+signature checks taken from ``Kernel.preverified``. If everything the agent
+saw still holds, its intents are committed and it keeps the state act() left
+it in. At the first mismatch (a read that differs, an intent that was not
+accepted, or a kernel attribute the proxy does not track) the agent diverged:
+its state is put back as it was before phase one and act() runs again,
+served the part of the transcript that held and then the real kernel. act()
+must be deterministic given what it reads, so the log is the same as a
+serial run's.
+
+This is a correctness prototype for the two-phase commit, not a speedup:
+act() and Ed25519 signing hold the GIL, so the pool's threads do not run
+phase one in parallel, and the transcripts make a round somewhat slower
+than a serial one.
+"""
+from __future__ import annotations
+
+import copy
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any
+
+from sie.agents.base import BaseAgent
+from sie.crypto import KEY_REGISTRY, verify
+from sie.kernel import Kernel
+from sie.types import AgentState, IntentPayload
+
+# Transcript entries, in the order the agent made them:
+#   (READ, agent_id, attribute, value)
+#   (INTENT, agent_id, intent, signature, verified, result)
+#   (UNTRACKED, name)     any other kernel attribute; always diverges
+#   (RAISED, exception)   act() raised; re-raised unless it diverged first
+READ, INTENT, UNTRACKED, RAISED = range(4)
+
+# snapshot() values that need no copy
+IMMUTABLE = (type(None), bool, int, float, str, bytes)
+
+
+class _Untracked(Exception):
+    """Raised into act() when it touches a kernel attribute the proxy does not track."""
+
+
+class _StateView:
+    """AgentState as seen in phase one; records every attribute read."""
+
+    __slots__ = ("_state", "_transcript")
+
+    def __init__(self, state: AgentState, transcript: list[tuple]) -> None:
+        self._state = state
+        self._transcript = transcript
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._state, name)
+        self._transcript.append((READ, self._state.agent_id, name, list(value) if isinstance(value, list) else value))
+        return value
+
+
+class SpeculativeKernel:
+    """Read-only view of a Kernel that records an agent's reads and intents."""
+
+    def __init__(self, kernel: Kernel) -> None:
+        self._kernel = kernel
+        self.transcript: list[tuple] = []
+
+    def get_state(self, agent_id: str) -> AgentState:
+        return _StateView(self._kernel.get_state(agent_id), self.transcript)  # type: ignore[return-value]
+
+    def process_intent(
+        self,
+        agent_id: str,
+        intent: IntentPayload,
+        signature: bytes,
+        verified: bool | None = None,
+    ) -> bool:
+        if verified is None:
+            # Not kernel.public_key(), which would cache the key on the kernel
+            kernel = self._kernel
+            public_key = kernel.public_keys.get(agent_id) or KEY_REGISTRY.public_key(kernel.key_seeds[agent_id])
+            verified = verify(public_key, intent.serialize(), signature)
+        self.transcript.append((INTENT, agent_id, intent, signature, verified, True))
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        self.transcript.append((UNTRACKED, name))
+        raise _Untracked(name)
+
+
+class ReplayKernel:
+    """The real kernel for a diverged agent's second act(), except that its
+    first ``stop`` transcript entries are answered from the transcript."""
+
+    def __init__(self, kernel: Kernel, agent_id: str, transcript: list[tuple], stop: int) -> None:
+        self._kernel = kernel
+        self._agent_id = agent_id
+        self._transcript = transcript
+        self._stop = stop
+        self._position = 0
+
+    def _next(self, kind: int) -> tuple | None:
+        """The next transcript entry, or None once act() is past the replayed part."""
+        if self._position >= self._stop:
+            return None
+        entry = self._transcript[self._position]
+        if entry[0] != kind:
+            raise RuntimeError(f"agent {self._agent_id!r} acted differently when replayed; act() must be deterministic")
+        self._position += 1
+        return entry
+
+    def read(self, state: AgentState, name: str) -> Any:
+        entry = self._next(READ)
+        return getattr(state, name) if entry is None else entry[3]
+
+    def get_state(self, agent_id: str) -> AgentState:
+        return _ReplayState(self, self._kernel.get_state(agent_id))  # type: ignore[return-value]
+
+    def process_intent(
+        self,
+        agent_id: str,
+        intent: IntentPayload,
+        signature: bytes,
+        verified: bool | None = None,
+    ) -> bool:
+        entry = self._next(INTENT)
+        if entry is None:
+            return self._kernel.process_intent(agent_id, intent, signature, verified)
+        return entry[5]
+
+    def __getattr__(self, name: str) -> Any:
+        if self._position < self._stop:
+            raise RuntimeError(f"agent {self._agent_id!r} acted differently when replayed; act() must be deterministic")
+        return getattr(self._kernel, name)
+
+
+class _ReplayState:
+    __slots__ = ("_replay", "_state")
+
+    def __init__(self, replay: ReplayKernel, state: AgentState) -> None:
+        self._replay = replay
+        self._state = state
+
+    def __getattr__(self, name: str) -> Any:
+        return self._replay.read(self._state, name)
+
+
+def _copied(snapshot: dict[str, Any]) -> dict[str, Any]:
+    return {name: value if type(value) in IMMUTABLE else copy.deepcopy(value) for name, value in snapshot.items()}
+
+
+def speculate(agents: Sequence[BaseAgent], kernel: Kernel, round_num: int) -> list[tuple[dict[str, Any], list[tuple]]]:
+    """Phase one for some agents: run each act() against a SpeculativeKernel;
+    returns (agent state before act(), transcript) per agent."""
+    results = []
+    for agent in agents:
+        saved = _copied(agent.snapshot())
+        proxy = SpeculativeKernel(kernel)
+        try:
+            agent.act(proxy, round_num)  # type: ignore[arg-type]
+        except _Untracked:
+            pass
+        except Exception as exc:
+            proxy.transcript.append((RAISED, exc))
+        results.append((saved, proxy.transcript))
+    return results
+
+
+def commit(kernel: Kernel, agent: BaseAgent, round_num: int, saved: dict[str, Any], transcript: list[tuple]) -> None:
+    """Phase two for one agent: apply its transcript, or replay act() from
+    the first entry that no longer holds."""
+    get_state = kernel.get_state
+    for i, entry in enumerate(transcript):
+        kind = entry[0]
+        if kind == READ:
+            if getattr(get_state(entry[1]), entry[2]) != entry[3]:
+                break
+        elif kind == INTENT:
+            _, agent_id, intent, signature, verified, predicted = entry
+            result = kernel.process_intent(agent_id, intent, signature)
+            if result != predicted:
+                # Applied; the replayed act() is given the real result
+                transcript[i] = (INTENT, agent_id, intent, signature, verified, result)
+                i += 1
+                break
+        elif kind == RAISED:
+            raise entry[1]
+        else:
+            break
+    else:
+        return
+    agent.restore(saved)
+    agent.act(ReplayKernel(kernel, agent.agent_id, transcript, i), round_num)  # type: ignore[arg-type]
+
+
+def run_round(kernel: Kernel, agents: Sequence[BaseAgent], round_num: int, pool: Executor, workers: int) -> None:
+    """Both phases of one round, with the same effects as calling each
+    agent's act() in turn. Agents are speculated in a few chunks per worker."""
+    size = max(1, -(-len(agents) // (4 * workers)))
+    chunks = [agents[i:i + size] for i in range(0, len(agents), size)]
+    speculated = [
+        result
+        for results in pool.map(lambda chunk: speculate(chunk, kernel, round_num), chunks)
+        for result in results
+    ]
+
+    # Signatures and checks for intents a replayed act() makes again
+    for agent, (_, transcript) in zip(agents, speculated):
+        for entry in transcript:
+            if entry[0] == INTENT:
+                _, agent_id, intent, signature, verified, _ = entry
+                payload = intent.serialize()
+                agent._presigned[payload] = signature
+                kernel.preverified[(agent_id, payload, signature)] = verified
+    try:
+        for agent, (saved, transcript) in zip(agents, speculated):
+            commit(kernel, agent, round_num, saved, transcript)
+    finally:
+        kernel.preverified.clear()
+        for agent in agents:
+            if agent._presigned:
+                agent._presigned.clear()
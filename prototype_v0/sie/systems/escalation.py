@@ -3,6 +3,9 @@ from __future__ import annotations
 from sie.event_log import EventLog
 from sie.types import AgentState, EventType, Task
 
+# Actions a sandboxed agent may still perform
+SANDBOX_ALLOWED_ACTIONS = ("work_step", "submit_result")
+
 
 def check_tier(state: AgentState, task: Task, log: EventLog) -> bool:
     if state.tier < task.requires_tier:
@@ -16,7 +19,7 @@ def check_tier(state: AgentState, task: Task, log: EventLog) -> bool:
 
 
 def check_sandbox(state: AgentState, action: str, log: EventLog) -> bool:
-    if state.sandboxed and action not in ("work_step", "submit_result"):
+    if state.sandboxed and action not in SANDBOX_ALLOWED_ACTIONS:
         log.append(
             EventType.ESCALATION_DENIED,
             state.agent_id,
@@ -1,20 +1,54 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from sie.event_log import EventLog
 from sie.types import AgentState, EventType
 
 
 class InfluenceQueue:
+    """Pending influence requests, kept in insertion order.
+
+    Requests are stored by ticket in an insertion-ordered dict, with a
+    (requester_id, task_id) index over the tickets, so fulfilling or
+    cancelling a request does not rescan the queue.
+    """
+
     def __init__(self) -> None:
-        self._requests: list[dict[str, str]] = []
+        self._requests: dict[int, dict[str, str]] = {}
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        self._next_ticket = 0
+
+    def __len__(self) -> int:
+        return len(self._requests)
 
     def request(self, requester: AgentState, task_id: str, log: EventLog) -> None:
-        self._requests.append({"requester_id": requester.agent_id, "task_id": task_id})
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        self._requests[ticket] = {"requester_id": requester.agent_id, "task_id": task_id}
+        self._by_key.setdefault((requester.agent_id, task_id), []).append(ticket)
         requester.influence_requests.append(task_id)
         log.append(EventType.INFLUENCE_REQUESTED, requester.agent_id, {"task_id": task_id})
 
+    def restore(self, requests: Iterable[dict[str, str]]) -> None:
+        """Re-queue snapshotted requests, without logging or touching agent state."""
+        for req in requests:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._requests[ticket] = dict(req)
+            self._by_key.setdefault((req["requester_id"], req["task_id"]), []).append(ticket)
+
     def pending_requests(self) -> list[dict[str, str]]:
-        return list(self._requests)
+        return list(self._requests.values())
+
+    def cancel(self, requester_id: str, task_id: str) -> bool:
+        """Drop pending requests for (requester, task); True if any were pending."""
+        tickets = self._by_key.pop((requester_id, task_id), None)
+        if not tickets:
+            return False
+        for ticket in tickets:
+            del self._requests[ticket]
+        return True
 
     def fulfill(
         self,
@@ -23,20 +57,48 @@ class InfluenceQueue:
         task_id: str,
         log: EventLog,
     ) -> None:
+        self.provide(provider, requester.agent_id, task_id, log)
+        self.receive(requester, provider.agent_id, task_id, log)
+
+    def provide(self, provider: AgentState, requester_id: str, task_id: str, log: EventLog) -> None:
+        """Provider half of fulfill(); the only half run when the requester is remote."""
         log.append(
             EventType.INFLUENCE_PROVIDED,
             provider.agent_id,
-            {"to": requester.agent_id, "task_id": task_id},
+            {"to": requester_id, "task_id": task_id},
         )
         provider.influence_provided.append(task_id)
+
+    def receive(self, requester: AgentState, provider_id: str, task_id: str, log: EventLog) -> None:
+        """Requester half of fulfill()."""
         requester.has_received_influence = True
         # Remove the fulfilled request
-        self._requests = [
-            r for r in self._requests
-            if not (r["requester_id"] == requester.agent_id and r["task_id"] == task_id)
-        ]
+        self.cancel(requester.agent_id, task_id)
         log.append(
             EventType.INFLUENCE_FULFILLED,
             requester.agent_id,
-            {"from": provider.agent_id, "task_id": task_id},
+            {"from": provider_id, "task_id": task_id},
         )
+
+    def fulfill_many(
+        self,
+        provider: AgentState,
+        requests: Iterable[tuple[AgentState, str]],
+        log: EventLog,
+    ) -> None:
+        """fulfill() for each (requester, task_id) one provider serves.
+
+        Emits the same PROVIDED/FULFILLED pairs in the same order as calling
+        fulfill() for each; each request's pending tickets are found through
+        the (requester_id, task_id) index.
+        """
+        provider_id = provider.agent_id
+        provided = provider.influence_provided
+        for requester, task_id in requests:
+            requester_id = requester.agent_id
+            log.append(EventType.INFLUENCE_PROVIDED, provider_id, {"to": requester_id, "task_id": task_id})
+            provided.append(task_id)
+            requester.has_received_influence = True
+            for ticket in self._by_key.pop((requester_id, task_id), ()):
+                del self._requests[ticket]
+            log.append(EventType.INFLUENCE_FULFILLED, requester_id, {"from": provider_id, "task_id": task_id})
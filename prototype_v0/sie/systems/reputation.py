@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from sie.event_log import EventLog
 from sie.types import AgentState, EventType
 
+if TYPE_CHECKING:
+    from sie.agent_store import AgentStore
+
 # Reputation adjustments
 TASK_SUCCESS = 0.10
 EFFICIENCY_BONUS = 0.05
@@ -12,6 +17,11 @@ BUDGET_ABUSE = -0.15
 PROVIDE_INFLUENCE = 0.08
 BOUNDARY_VIOLATION = -0.10
 
+# End-of-round decay: each round pulls reputation this fraction of the way
+# toward DECAY_BASELINE. 0 disables decay.
+DECAY_RATE = 0.0
+DECAY_BASELINE = 0.50
+
 
 def adjust(state: AgentState, delta: float, reason: str, log: EventLog) -> None:
     old = state.reputation
@@ -21,3 +31,15 @@ def adjust(state: AgentState, delta: float, reason: str, log: EventLog) -> None:
         state.agent_id,
         {"old": round(old, 4), "new": round(state.reputation, 4), "delta": delta, "reason": reason},
     )
+
+
+def decayed(reputation: float, rate: float, baseline: float = DECAY_BASELINE) -> float:
+    return max(0.0, min(1.0, reputation + (baseline - reputation) * rate))
+
+
+def decay_all(store: AgentStore, rate: float, baseline: float = DECAY_BASELINE) -> None:
+    """decayed() applied to every agent in a store as one array operation."""
+    import numpy as np
+
+    reputation = store.column("reputation")
+    np.clip(reputation + (baseline - reputation) * rate, 0.0, 1.0, out=reputation)
@@ -7,13 +7,25 @@ SANDBOX_THRESHOLD = 2
 BAN_THRESHOLD = 4
 
 
-def record_violation(state: AgentState, reason: str, log: EventLog) -> None:
+def record_violation(
+    state: AgentState,
+    reason: str,
+    log: EventLog,
+    sandbox_threshold: int | None = None,
+    ban_threshold: int | None = None,
+) -> None:
+    """Count a violation; sandbox or ban at the thresholds, which default to
+    SANDBOX_THRESHOLD and BAN_THRESHOLD as they are at call time."""
+    if sandbox_threshold is None:
+        sandbox_threshold = SANDBOX_THRESHOLD
+    if ban_threshold is None:
+        ban_threshold = BAN_THRESHOLD
     state.violation_count += 1
     log.append(EventType.VIOLATION_RECORDED, state.agent_id, {"count": state.violation_count, "reason": reason})
 
-    if state.violation_count >= BAN_THRESHOLD and not state.banned:
+    if state.violation_count >= ban_threshold and not state.banned:
         state.banned = True
         log.append(EventType.AGENT_BANNED, state.agent_id, {"violation_count": state.violation_count})
-    elif state.violation_count >= SANDBOX_THRESHOLD and not state.sandboxed:
+    elif state.violation_count >= sandbox_threshold and not state.sandboxed:
         state.sandboxed = True
         log.append(EventType.AGENT_SANDBOXED, state.agent_id, {"violation_count": state.violation_count})
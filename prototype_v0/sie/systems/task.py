@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from sie.event_log import EventLog
 from sie.types import AgentState, EventType, Task
 
@@ -14,6 +16,9 @@ class TaskRegistry:
     def get(self, task_id: str) -> Task | None:
         return self._tasks.get(task_id)
 
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
 
 def assign_task(state: AgentState, task: Task, log: EventLog) -> None:
     state.current_task_id = task.task_id
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
 from sie.event_log import EventLog
 from sie.types import AgentState, EventType
 
+if TYPE_CHECKING:
+    from sie.agent_store import AgentStore
+
 # Tier thresholds by reputation
 TIER_THRESHOLDS = {
     1: 0.55,
@@ -11,15 +18,58 @@ TIER_THRESHOLDS = {
 }
 
 
-def evaluate(state: AgentState, log: EventLog) -> None:
+def lookup(thresholds: Mapping[int, float] | None = None) -> tuple[list[float], list[int]]:
+    """(cutoffs, levels) for tier_for: levels[bisect_right(cutoffs, reputation)].
+
+    ``thresholds`` defaults to TIER_THRESHOLDS as it is at call time.
+    """
+    ordered = sorted((TIER_THRESHOLDS if thresholds is None else thresholds).items())
+    return [threshold for _, threshold in ordered], [0] + [t for t, _ in ordered]
+
+
+def tier_for(reputation: float, cutoffs: list[float] | None = None, levels: list[int] | None = None) -> int:
+    if cutoffs is None or levels is None:
+        cutoffs, levels = lookup()
+    return levels[bisect_right(cutoffs, reputation)]
+
+
+def _log_change(agent_id: str, old_tier: int, new_tier: int, reputation: float, log: EventLog) -> None:
+    event_type = EventType.TIER_UPGRADED if new_tier > old_tier else EventType.TIER_DOWNGRADED
+    log.append(event_type, agent_id, {"old_tier": old_tier, "new_tier": new_tier, "reputation": round(reputation, 4)})
+
+
+def evaluate(
+    state: AgentState,
+    log: EventLog,
+    cutoffs: list[float] | None = None,
+    levels: list[int] | None = None,
+) -> None:
     old_tier = state.tier
-    new_tier = 0
-    for t, threshold in sorted(TIER_THRESHOLDS.items()):
-        if state.reputation >= threshold:
-            new_tier = t
-    if new_tier > old_tier:
-        state.tier = new_tier
-        log.append(EventType.TIER_UPGRADED, state.agent_id, {"old_tier": old_tier, "new_tier": new_tier, "reputation": round(state.reputation, 4)})
-    elif new_tier < old_tier:
+    new_tier = tier_for(state.reputation, cutoffs, levels)
+    if new_tier != old_tier:
         state.tier = new_tier
-        log.append(EventType.TIER_DOWNGRADED, state.agent_id, {"old_tier": old_tier, "new_tier": new_tier, "reputation": round(state.reputation, 4)})
+        _log_change(state.agent_id, old_tier, new_tier, state.reputation, log)
+
+
+def evaluate_all(
+    store: AgentStore,
+    log: EventLog,
+    cutoffs: list[float] | None = None,
+    levels: list[int] | None = None,
+) -> None:
+    """Re-tier every agent in a store in one vectorized pass.
+
+    Tier changes are logged in handle (registration) order.
+    """
+    import numpy as np
+
+    if cutoffs is None or levels is None:
+        cutoffs, levels = lookup()
+
+    reputation = store.column("reputation")
+    tiers = store.column("tier")
+    new_tiers = np.asarray(levels, dtype=tiers.dtype)[np.searchsorted(cutoffs, reputation, side="right")]
+    changed = np.flatnonzero(new_tiers != tiers)
+    for handle in changed.tolist():
+        _log_change(store.agent_ids[handle], int(tiers[handle]), int(new_tiers[handle]), float(reputation[handle]), log)
+    tiers[changed] = new_tiers[changed]
@@ -0,0 +1,132 @@
+"""
+Parallel policy parameter sweeps.
+
+Each configuration is a dict of Policy field overrides. Configurations are
+fanned out across a process pool; a worker runs the standard simulation under
+that policy and returns only aggregate outcome metrics, never the log, so
+large sweeps stay cheap to ship back and hold. Results come back in
+configuration order.
+
+Run: python -m sie.tuning --grid ban_threshold=3,4,5 decay_rate=0,0.1 --output sweep.jsonl
+     python -m sie.tuning --random 1000 --seed 1 --range deception=-0.5:-0.1 --output sweep.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from sie.main import build_simulation, run_simulation
+from sie.policy import Policy
+from sie.types import EventType
+
+CHUNKSIZE = 8
+
+
+def grid(space: Mapping[str, Sequence[Any]]) -> Iterator[dict[str, Any]]:
+    """Every combination of the listed values, in row-major order."""
+    names = list(space)
+    for values in itertools.product(*(space[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def random_configs(space: Mapping[str, tuple[float, float]], count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """``count`` seeded draws, uniform over each (low, high); int bounds draw ints."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        config = {}
+        for name, (low, high) in space.items():
+            if isinstance(low, int) and isinstance(high, int):
+                config[name] = rng.randint(low, high)
+            else:
+                config[name] = rng.uniform(low, high)
+        yield config
+
+
+def outcome(changes: Mapping[str, Any], base: Policy | None = None) -> dict[str, Any]:
+    """Run the standard simulation under base+changes; aggregate metrics only."""
+    policy = (base if base is not None else Policy.current()).with_changes(**changes)
+    kernel, agents = build_simulation(policy=policy)
+    run_simulation(kernel, agents)
+    log = kernel.log
+    states = sorted(kernel.agents.values(), key=lambda s: s.agent_id)
+    return {
+        "events": len(log),
+        "banned": [s.agent_id for s in states if s.banned],
+        "sandboxed": [s.agent_id for s in states if s.sandboxed],
+        "tiers": {s.agent_id: s.tier for s in states},
+        "tasks_completed": sum(s.tasks_completed for s in states),
+        "tasks_failed": sum(s.tasks_failed for s in states),
+        "mean_reputation": round(sum(s.reputation for s in states) / len(states), 4),
+        "violations": len(log.sequences_of_type(EventType.VIOLATION_RECORDED)),
+        "denials": len(log.sequences_of_type(EventType.INTENT_DENIED)) + len(log.sequences_of_type(EventType.ESCALATION_DENIED)),
+    }
+
+
+def _outcome_star(args: tuple[Mapping[str, Any], Policy | None]) -> dict[str, Any]:
+    return outcome(*args)
+
+
+def sweep(
+    configs: Iterable[Mapping[str, Any]],
+    base: Policy | None = None,
+    workers: int | None = None,
+    chunksize: int = CHUNKSIZE,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """(config, outcome) per configuration, in order. workers=1 runs serially."""
+    configs = [dict(c) for c in configs]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for config in configs:
+            yield config, outcome(config, base)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip(configs, pool.map(_outcome_star, ((c, base) for c in configs), chunksize=chunksize))
+
+
+def _parse_value(text: str) -> Any:
+    return json.loads(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--grid", nargs="*", default=[], metavar="NAME=V1,V2", help="grid axes")
+    parser.add_argument("--random", type=int, default=0, metavar="N", help="draw N random configurations")
+    parser.add_argument("--range", nargs="*", default=[], metavar="NAME=LOW:HIGH", help="random axes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="write one JSON line per configuration (default: stdout)")
+    args = parser.parse_args()
+
+    if args.random:
+        space = {}
+        for spec in args.range:
+            name, bounds = spec.split("=", 1)
+            low, high = bounds.split(":", 1)
+            space[name] = (_parse_value(low), _parse_value(high))
+        configs: Iterable[dict[str, Any]] = random_configs(space, args.random, args.seed)
+    else:
+        axes = {}
+        for spec in args.grid:
+            name, values = spec.split("=", 1)
+            axes[name] = [_parse_value(v) for v in values.split(",")]
+        configs = grid(axes)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for config, result in sweep(configs, workers=args.workers):
+            out.write(json.dumps({"config": config, "outcome": result}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import struct
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 
@@ -24,6 +26,7 @@ class EventType(Enum):
 
     # Reputation
     REPUTATION_ADJUSTED = "REPUTATION_ADJUSTED"
+    REPUTATION_DECAYED = "REPUTATION_DECAYED"
 
     # Tier
     TIER_UPGRADED = "TIER_UPGRADED"
@@ -65,6 +68,8 @@ class Event:
     agent_id: str
     data: dict[str, Any]
     signature: str
+    # Running BLAKE2b over the previous hash and this event's encode() bytes
+    chain_hash: bytes = field(default=b"", compare=False, repr=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -76,6 +81,22 @@ class Event:
             "signature": self.signature,
         }
 
+    def encode(self) -> bytes:
+        """Compact JSON record, as written by persisted logs."""
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any], chain_hash: bytes = b"") -> Event:
+        return cls(
+            sequence=d["sequence"],
+            timestamp=d["timestamp"],
+            event_type=EventType(d["event_type"]),
+            agent_id=d["agent_id"],
+            data=d["data"],
+            signature=d["signature"],
+            chain_hash=chain_hash,
+        )
+
 
 @dataclass
 class AgentState:
@@ -121,14 +142,56 @@ class Task:
     requires_influence: bool = False
 
 
+# IntentPayload wire format: version byte, then action, task_id and detail as
+# u16 little-endian length-prefixed UTF-8
+WIRE_VERSION = 1
+_WIRE_LENGTH = struct.Struct("<H")
+# Longest encoded field a u16 length can describe
+WIRE_FIELD_MAX = 0xFFFF
+
+
 @dataclass(frozen=True)
 class IntentPayload:
     action: str
     task_id: str
     detail: str
 
-    def serialize(self) -> bytes:
+    @cached_property
+    def canonical(self) -> bytes:
+        """The signed JSON form, computed once per payload."""
         return json.dumps(
             {"action": self.action, "task_id": self.task_id, "detail": self.detail},
             sort_keys=True,
         ).encode()
+
+    def serialize(self) -> bytes:
+        return self.canonical
+
+    def to_wire(self) -> bytes:
+        parts = [bytes((WIRE_VERSION,))]
+        for value in (self.action, self.task_id, self.detail):
+            raw = value.encode()
+            if len(raw) > WIRE_FIELD_MAX:
+                raise ValueError(f"intent field of {len(raw)} bytes exceeds the wire limit of {WIRE_FIELD_MAX}")
+            parts.append(_WIRE_LENGTH.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+    @classmethod
+    def from_wire(cls, buf: bytes) -> IntentPayload:
+        if not buf or buf[0] != WIRE_VERSION:
+            raise ValueError("unsupported intent wire version")
+        fields = []
+        pos = 1
+        for _ in range(3):
+            if pos + _WIRE_LENGTH.size > len(buf):
+                raise ValueError("truncated intent")
+            (length,) = _WIRE_LENGTH.unpack_from(buf, pos)
+            pos += _WIRE_LENGTH.size
+            if pos + length > len(buf):
+                raise ValueError("truncated intent")
+            fields.append(bytes(buf[pos:pos + length]).decode())
+            pos += length
+        if pos != len(buf):
+            raise ValueError("trailing bytes after intent")
+        return cls(*fields)
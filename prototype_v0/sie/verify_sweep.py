@@ -0,0 +1,216 @@
+"""
+Signature verification sweep over INTENT_SUBMITTED events.
+
+Intent events are sharded by sequence range and verified across a process
+pool; per-shard counts are summed in shard order, so the result does not
+depend on scheduling. For a DiskEventLog each worker streams its shard from
+the segment files itself, so only (directory, start, stop) crosses the
+process boundary. In-memory logs ship each shard as compact
+(agent_id, payload bytes, signature bytes) tuples. Small logs are verified
+serially in-process.
+
+Each worker receives the registered agents' raw public keys once, at start-up,
+and builds key objects lazily into its own cache.
+
+StreamingSweep gives the same counts for events fed one at a time, as part
+of a caller's own pass over the log: signed intents are batched and each
+full batch is handed to the pool while the pass continues.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from sie.crypto import verify
+from sie.disk_log import DiskEventLog, read_range
+from sie.event_log import EventLog
+from sie.types import Event, EventType, IntentPayload
+
+# Below this many intent events the sweep runs serially
+SERIAL_THRESHOLD = 20_000
+# Intent events per shard
+SHARD_INTENTS = 50_000
+
+INTENT_NEEDLE = b'"event_type":"INTENT_SUBMITTED"'
+
+# Per-worker state, set by _init_worker
+_raw_keys: dict[str, bytes] = {}
+_key_cache: dict[str, Ed25519PublicKey] = {}
+
+
+def _init_worker(raw_keys: dict[str, bytes]) -> None:
+    global _raw_keys, _key_cache
+    _raw_keys = raw_keys
+    _key_cache = {}
+
+
+def _worker_key(agent_id: str) -> Ed25519PublicKey:
+    key = _key_cache.get(agent_id)
+    if key is None:
+        key = _key_cache[agent_id] = Ed25519PublicKey.from_public_bytes(_raw_keys[agent_id])
+    return key
+
+
+def _intent_bytes(e: Event) -> bytes:
+    return IntentPayload(
+        action=e.data.get("action", ""),
+        task_id=e.data.get("task_id", ""),
+        detail=e.data.get("detail", ""),
+    ).serialize()
+
+
+def _count(items: Iterable[tuple[str, bytes, bytes]], keys: Mapping[str, Ed25519PublicKey] | None) -> tuple[int, int]:
+    verified = 0
+    failed = 0
+    for agent_id, payload, sig in items:
+        pub = keys[agent_id] if keys is not None else _worker_key(agent_id)
+        if verify(pub, payload, sig):
+            verified += 1
+        else:
+            failed += 1
+    return verified, failed
+
+
+def _checkable(events: Iterable[Event], registered: Iterable[str]) -> Iterable[tuple[str, bytes, bytes]]:
+    for e in events:
+        if e.event_type == EventType.INTENT_SUBMITTED and e.signature and e.agent_id in registered:
+            yield e.agent_id, _intent_bytes(e), bytes.fromhex(e.signature)
+
+
+def _verify_tuples(items: list[tuple[str, bytes, bytes]]) -> tuple[int, int]:
+    return _count(items, None)
+
+
+def _verify_disk_range(directory: str, start: int, stop: int) -> tuple[int, int]:
+    return _count(_checkable(read_range(directory, start, stop, INTENT_NEEDLE), _raw_keys), None)
+
+
+def _shards(sequences: Sequence[int], size: int) -> list[tuple[int, int]]:
+    """Split sorted intent sequence numbers into [start, stop) sequence ranges."""
+    return [
+        (sequences[i], sequences[min(i + size, len(sequences)) - 1] + 1)
+        for i in range(0, len(sequences), size)
+    ]
+
+
+def sweep(
+    log: EventLog,
+    public_keys: Mapping[str, Ed25519PublicKey],
+    workers: int | None = None,
+    shard_intents: int = SHARD_INTENTS,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> tuple[int, int, int]:
+    """Verify every signed intent from a registered agent.
+
+    Returns (INTENT_SUBMITTED events, verified, failed). ``workers`` defaults
+    to the CPU count; 1 forces the serial path.
+    """
+    sequences = log.sequences_of_type(EventType.INTENT_SUBMITTED)
+    total = len(sequences)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or total < serial_threshold:
+        verified, failed = _count(_checkable(log.events_of_type(EventType.INTENT_SUBMITTED), public_keys), public_keys)
+        return total, verified, failed
+
+    raw_keys = {agent_id: pub.public_bytes_raw() for agent_id, pub in public_keys.items()}
+    shards = _shards(sequences, shard_intents)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(raw_keys,)) as pool:
+        if isinstance(log, DiskEventLog):
+            log.flush()
+            futures = [pool.submit(_verify_disk_range, log.directory, start, stop) for start, stop in shards]
+        else:
+            futures = [
+                pool.submit(_verify_tuples, list(_checkable(log.events_of_type(EventType.INTENT_SUBMITTED, start, stop), raw_keys)))
+                for start, stop in shards
+            ]
+        counts = [f.result() for f in futures]
+
+    return total, sum(v for v, _ in counts), sum(f for _, f in counts)
+
+
+class StreamingSweep:
+    """sweep() over events fed in sequence order with add(); result() finishes it.
+
+    Intents are verified serially in-process unless ``workers`` asks for
+    more than one. Then batches go to the pool as they fill, with at most
+    two per worker in flight, so memory stays bounded by the batch size; if
+    fewer than ``serial_threshold`` signed intents arrive in total they are
+    still verified serially. The pool is shut down by result(), or by
+    close() (or leaving a ``with`` block) if the pass stops early.
+    """
+
+    def __init__(
+        self,
+        public_keys: Mapping[str, Ed25519PublicKey],
+        workers: int | None = None,
+        shard_intents: int = SHARD_INTENTS,
+        serial_threshold: int = SERIAL_THRESHOLD,
+    ) -> None:
+        self.public_keys = public_keys
+        self.workers = workers or 1
+        self.shard_intents = shard_intents
+        self.serial_threshold = serial_threshold
+        self.total = 0
+        self.verified = 0
+        self.failed = 0
+        self._batch: list[tuple[str, bytes, bytes]] = []
+        self._pool: ProcessPoolExecutor | None = None
+        self._futures: deque[Future[tuple[int, int]]] = deque()
+
+    def add(self, e: Event) -> None:
+        if e.event_type != EventType.INTENT_SUBMITTED:
+            return
+        self.total += 1
+        if not e.signature or e.agent_id not in self.public_keys:
+            return
+        self._batch.append((e.agent_id, _intent_bytes(e), bytes.fromhex(e.signature)))
+        if self.workers <= 1:
+            self._tally(_count(self._batch, self.public_keys))
+            self._batch.clear()
+        elif len(self._batch) >= self.shard_intents:
+            self._submit()
+
+    def result(self) -> tuple[int, int, int]:
+        """(INTENT_SUBMITTED events, verified, failed) over everything added."""
+        if self._batch:
+            if self._pool is None and len(self._batch) < self.serial_threshold:
+                self._tally(_count(self._batch, self.public_keys))
+                self._batch = []
+            else:
+                self._submit()
+        while self._futures:
+            self._tally(self._futures.popleft().result())
+        self.close()
+        return self.total, self.verified, self.failed
+
+    def close(self) -> None:
+        """Shut the pool down, dropping batches still pending."""
+        self._futures.clear()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> StreamingSweep:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _tally(self, counts: tuple[int, int]) -> None:
+        self.verified += counts[0]
+        self.failed += counts[1]
+
+    def _submit(self) -> None:
+        if self._pool is None:
+            raw_keys = {agent_id: pub.public_bytes_raw() for agent_id, pub in self.public_keys.items()}
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(raw_keys,))
+        self._futures.append(self._pool.submit(_verify_tuples, self._batch))
+        self._batch = []
+        while len(self._futures) > 2 * self.workers:
+            self._tally(self._futures.popleft().result())
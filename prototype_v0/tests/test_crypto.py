@@ -0,0 +1,56 @@
+"""Key registry caching, bulk verification and intent encodings."""
+
+import pytest
+
+import sie.crypto as crypto
+from sie.crypto import KeyRegistry, derive_keypair, sign, verify_many
+from sie.types import WIRE_FIELD_MAX, IntentPayload
+
+
+def test_key_registry_derives_once_per_seed_and_evicts(monkeypatch):
+    calls = []
+    real = crypto.derive_keypair
+    monkeypatch.setattr(crypto, "derive_keypair", lambda seed: calls.append(seed) or real(seed))
+
+    registry = KeyRegistry(maxsize=2)
+    for _ in range(3):
+        registry.private_key("a")
+        registry.public_key("a")
+    assert calls == ["a"]
+
+    registry.public_key("b")
+    registry.public_key("c")
+    assert "a" not in registry and len(registry) == 2
+    # An evicted seed derives the same key again
+    assert registry.public_key("a").public_bytes_raw() == derive_keypair("a")[1].public_bytes_raw()
+    assert calls == ["a", "b", "c", "a"]
+
+    # Reserving room for more seeds stops the eviction
+    registry.reserve(4)
+    for seed in "abcd":
+        registry.public_key(seed)
+    assert len(registry) == 4 and calls == ["a", "b", "c", "a", "b", "d"]
+    registry.reserve(1)
+    assert registry.maxsize == 4
+
+
+def test_verify_many_preserves_order():
+    private_key, public_key = derive_keypair("a")
+    good = sign(private_key, b"x")
+    items = [(public_key, b"x", good), (public_key, b"y", good)] * 5
+    assert verify_many(items) == verify_many(items, workers=3) == [True, False] * 5
+
+
+def test_intent_wire_round_trip():
+    intent = IntentPayload(action="submit_result", task_id="task-easy-2", detail="olleh é")
+    assert intent.serialize() is intent.serialize()
+    assert IntentPayload.from_wire(intent.to_wire()) == intent
+    wire = intent.to_wire()
+    for bad in (b"", b"\x02" + wire[1:], wire[:-1], wire + b"\x00"):
+        with pytest.raises(ValueError):
+            IntentPayload.from_wire(bad)
+
+    longest = IntentPayload(action="a", task_id="t", detail="x" * WIRE_FIELD_MAX)
+    assert IntentPayload.from_wire(longest.to_wire()) == longest
+    with pytest.raises(ValueError, match="wire limit"):
+        IntentPayload(action="a", task_id="t", detail="é" * 40_000).to_wire()
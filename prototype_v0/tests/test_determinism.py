@@ -1,6 +1,15 @@
 """Run the simulation twice and assert the event logs are byte-identical."""
 
+from collections import Counter
+
+import pytest
+
+from sie import kernel
+from sie.agents.efficient import EfficientAgent
+from sie.crypto import verify
 from sie.main import build_simulation, run_simulation
+from sie.scenario import generate_scenario
+from sie.types import EventType, IntentPayload
 
 
 def test_deterministic_logs():
@@ -16,3 +25,52 @@ def test_deterministic_logs():
 
     assert log1 == log2, "Event logs differ between runs — simulation is non-deterministic"
     assert len(kernel1.log.events) > 0, "No events produced"
+
+
+def test_speculative_rounds_match_serial(monkeypatch):
+    kernel1, agents1 = build_simulation()
+    run_simulation(kernel1, agents1)
+
+    checks = []
+    monkeypatch.setattr(kernel, "verify", lambda *args: checks.append(args) or verify(*args))
+    kernel2, agents2 = build_simulation()
+    run_simulation(kernel2, agents2, workers=4)
+
+    assert kernel2.log.to_json() == kernel1.log.to_json()
+    assert kernel2.snapshot(agents2) == kernel1.snapshot(agents1)
+    # Agents' own intents are verified during speculation; the kernel itself
+    # only verifies the influence intents submitted between rounds
+    between_rounds = [
+        IntentPayload(action=e.data["action"], task_id=e.data["task_id"], detail=e.data["detail"]).serialize()
+        for e in kernel1.log.events_of_type(EventType.INTENT_SUBMITTED)
+        if e.data["action"] == "provide_influence"
+    ]
+    assert between_rounds and [payload for _, payload, _ in checks] == between_rounds
+    assert not kernel2.preverified and not any(agent._presigned for agent in agents2)
+
+
+def test_speculative_rounds_rerun_only_diverged_agents(monkeypatch):
+    calls = Counter()
+    kernel1, agents = build_simulation()
+    for agent in agents:
+        monkeypatch.setattr(agent, "act", lambda k, r, act=agent.act, agent_id=agent.agent_id: calls.update([agent_id]) or act(k, r))
+    run_simulation(kernel1, agents, workers=2)
+
+    # efficient-1 is accepted every round it acts; boundary-1 never is
+    assert calls["efficient-1"] == 15
+    assert calls["boundary-1"] == 30
+
+    scenario = generate_scenario(300, 20, seed=5)
+    logs = []
+    for workers in (0, 3):
+        kernel2, agents2 = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+        run_simulation(kernel2, agents2, num_rounds=8, workers=workers)
+        logs.append(kernel2.log.to_json())
+    assert logs[0] == logs[1]
+
+
+def test_speculative_rounds_raise_agent_errors(monkeypatch):
+    monkeypatch.setattr(EfficientAgent, "act", lambda self, k, r: 1 / 0)
+    kernel1, agents = build_simulation()
+    with pytest.raises(ZeroDivisionError):
+        run_simulation(kernel1, agents, workers=2)
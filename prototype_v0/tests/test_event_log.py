@@ -0,0 +1,199 @@
+"""Alternative EventLog backends must be drop-in replacements for the in-memory log."""
+
+import io
+import json
+import os
+import threading
+
+import pytest
+
+from sie.compact_log import CompactEventLog
+from sie.disk_log import DiskEventLog, list_segments
+from sie.event_log import EventLog, NdjsonTail, follow_ndjson
+from sie.main import build_simulation, run_simulation
+from sie.types import EventType
+
+
+def _run(log=None):
+    kernel, agents = build_simulation(log)
+    run_simulation(kernel, agents)
+    return kernel
+
+
+def test_compact_log_matches_memory():
+    expected = _run().log
+    log = _run(CompactEventLog()).log
+    assert log.to_json() == expected.to_json()
+    assert log.verify_chain() and log.head == expected.head
+    assert log.events_of_type(EventType.INTENT_SUBMITTED) == expected.events_of_type(EventType.INTENT_SUBMITTED)
+    assert log.events_for_agent("specialist-1", 40, 120) == expected.events_for_agent("specialist-1", 40, 120)
+    assert [e.chain_hash for e in log.iter_range(10, 20)] == [e.chain_hash for e in expected.iter_range(10, 20)]
+
+    log.append(EventType.ROUND_START, "kernel", {"round": [1, None], "note": "x"}, signature="not-hex")
+    assert log.events[-1].data == {"round": [1, None], "note": "x"} and log.events[-1].signature == "not-hex"
+    log.truncate(100)
+    expected.truncate(100)
+    assert log.to_json() == expected.to_json() and log.head == expected.head
+
+
+def test_disk_log_matches_memory(tmp_path):
+    expected = _run().log
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as log:
+        _run(log)
+        assert len(list_segments(str(tmp_path))) > 1
+        assert log.to_json() == expected.to_json()
+        assert log.events_of_type(EventType.AGENT_BANNED) == expected.events_of_type(EventType.AGENT_BANNED)
+        assert log.events_for_agent("specialist-1") == expected.events_for_agent("specialist-1")
+        assert log.events_of_type(EventType.TASK_STEP, 40, 90) == expected.events_of_type(EventType.TASK_STEP, 40, 90)
+
+    reopened = DiskEventLog(str(tmp_path), segment_bytes=4096)
+    assert len(reopened) == len(expected)
+    events = reopened.events
+    assert not isinstance(events, list) and len(events) == len(expected)
+    assert list(events) == expected.events
+    assert events[-1] == expected.events[-1] and events[10:20] == expected.events[10:20]
+    assert events[::50] == expected.events[::50]
+    reopened.close()
+
+
+def test_disk_log_recovers_a_torn_record_before_rollover(tmp_path):
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as log:
+        _run(log)
+    segments = list_segments(str(tmp_path))
+    _, path = segments[1]
+    second, _ = segments[2]
+    for _, later in segments[2:]:
+        os.remove(later)
+    # The segment rolled after the torn record was created but never written
+    open(os.path.join(str(tmp_path), os.path.basename(segments[2][1])), "wb").close()
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as log:
+        assert len(log) == second - 1 and log.verify_chain()
+        assert len(list_segments(str(tmp_path))) == 2
+        log.append(EventType.ROUND_START, "kernel", {"round": 0})
+        assert log.verify_chain()
+
+    # A torn record followed by segments holding events cannot be repaired
+    with DiskEventLog(str(tmp_path / "full"), segment_bytes=4096) as log:
+        _run(log)
+    _, path = list_segments(str(tmp_path / "full"))[1]
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+    with pytest.raises(ValueError, match="torn record"):
+        DiskEventLog(str(tmp_path / "full"), segment_bytes=4096)
+
+
+def test_indexed_queries_slice_by_sequence():
+    log = _run().log
+    events = log.events
+    for etype in (EventType.REPUTATION_ADJUSTED, EventType.ROUND_START, EventType.SIGNATURE_INVALID):
+        assert log.events_of_type(etype) == [e for e in events if e.event_type == etype]
+        assert log.events_of_type(etype, 50, 120) == [e for e in events[50:120] if e.event_type == etype]
+    assert log.events_for_agent("looper-1", start=100) == [e for e in events[100:] if e.agent_id == "looper-1"]
+    assert log.events_for_agent("nobody") == []
+
+
+def test_write_json_matches_to_json():
+    for log in (EventLog(), _run().log):
+        buf = io.StringIO()
+        log.write_json(buf)
+        assert buf.getvalue() == log.to_json()
+
+
+def test_ndjson_tail_can_be_followed(tmp_path):
+    path = str(tmp_path / "log.ndjson")
+    kernel, agents = build_simulation()
+    followed = []
+    reader = threading.Thread(target=lambda: followed.extend(follow_ndjson(path, poll_interval=0.01)))
+    reader.start()
+    with open(path, "w") as f:
+        tail = NdjsonTail(kernel.log, f, flush_every=16)
+        run_simulation(kernel, agents)
+        tail.close()
+    reader.join(timeout=10)
+    assert followed == kernel.log.events
+
+
+def test_hash_chain_detects_tampering():
+    log = _run().log
+    assert log.verify_chain()
+    checkpoint = log.checkpoint()
+    log.append(EventType.ROUND_START, "kernel", {"round": 99})
+    assert log.verify_chain(checkpoint)
+
+    log.events_of_type(EventType.TASK_VALIDATED)[0].data["efficient"] = False
+    assert not log.verify_chain()
+    assert log.verify_chain(checkpoint)
+
+
+def test_disk_log_chain_survives_reopen_and_detects_tampering(tmp_path):
+    expected = _run().log
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as log:
+        _run(log)
+        assert log.verify_chain()
+    reopened = DiskEventLog(str(tmp_path), segment_bytes=4096)
+    assert reopened.head == expected.head
+    assert reopened.verify_chain()
+    reopened.close()
+
+    for _, path in list_segments(str(tmp_path)):
+        with open(path, "r+b") as f:
+            raw = f.read()
+            if b'"reason":"deception"' in raw:
+                f.seek(0)
+                f.write(raw.replace(b'"reason":"deception"', b'"reason":"deceptioN"', 1))
+                break
+    tampered = DiskEventLog(str(tmp_path), segment_bytes=4096)
+    assert not tampered.verify_chain()
+    tampered.close()
+
+
+def test_columnar_export_streams_by_round(tmp_path):
+    pytest.importorskip("numpy")
+    from sie.columnar import ColumnarTail, load_columnar
+
+    kernel, agents = build_simulation()
+    tail = ColumnarTail(kernel.log, str(tmp_path / "live"))
+    run_simulation(kernel, agents)
+    tail.close()
+    kernel.log.write_columnar(str(tmp_path / "after"))
+
+    for directory in ("live", "after"):
+        columns = load_columnar(str(tmp_path / directory))
+        assert len(columns) == len(kernel.log)
+        assert [p["round"] for p in columns.partitions] == [-1, *range(15), -1]
+        assert columns.events()["sequence"].tolist() == list(range(len(kernel.log)))
+
+        adjusted = kernel.log.events_of_type(EventType.REPUTATION_ADJUSTED)
+        sequences, reputation = columns.trajectory("efficient-1")
+        assert sequences.tolist() == [e.sequence for e in adjusted if e.agent_id == "efficient-1"]
+        assert reputation.tolist() == [e.data["new"] for e in adjusted if e.agent_id == "efficient-1"]
+
+        intents = columns.table(EventType.INTENT_SUBMITTED, rounds=[2])
+        expected = [e for e in kernel.log.events_of_type(EventType.INTENT_SUBMITTED) if e.sequence in set(intents["sequence"].tolist())]
+        assert columns.decode(intents["action"]) == [e.data["action"] for e in expected]
+        assert [s.hex() for s in intents["signature"]] == [e.signature for e in expected]
+
+
+def test_columnar_tables_combine_partition_dtypes(tmp_path):
+    np = pytest.importorskip("numpy")
+    from sie.columnar import STRINGS, load_columnar
+
+    log = EventLog()
+    for round_num, step in enumerate([1, 1.5, "x"]):
+        log.append(EventType.ROUND_START, "kernel", {"round": round_num})
+        log.append(EventType.TASK_STEP, "a", {"task_id": "t", "step": step})
+        log.append(EventType.ROUND_END, "kernel", {"round": round_num})
+    log.write_columnar(str(tmp_path))
+
+    columns = load_columnar(str(tmp_path))
+    steps = columns.table(EventType.TASK_STEP, rounds=[0, 1])["step"]
+    assert steps.dtype == np.float64 and steps.tolist() == [1.0, 1.5]
+    with pytest.raises(ValueError, match="TASK_STEP.step"):
+        columns.table(EventType.TASK_STEP)
+
+    # Each string is appended to the strings file once
+    with open(tmp_path / STRINGS) as f:
+        assert [json.loads(line) for line in f] == columns.strings == ["kernel", "a", "t", "x"]
@@ -0,0 +1,78 @@
+"""The intent gateway must apply framed intents to the kernel in arrival order."""
+
+import asyncio
+import threading
+
+from sie.crypto import KEY_REGISTRY, sign
+from sie.gateway import (
+    STATUS_ACCEPTED,
+    STATUS_MALFORMED,
+    STATUS_REJECTED,
+    STATUS_UNKNOWN_AGENT,
+    FRAME_HEADER,
+    GatewayClient,
+    IntentGateway,
+    build_gateway_kernel,
+    generate_load,
+)
+from sie.types import EventType, IntentPayload
+
+
+def _signed(agent_id, intent):
+    return sign(KEY_REGISTRY.private_key(agent_id), intent.serialize())
+
+
+def test_pipelined_intents_match_direct_processing(tmp_path):
+    intents = [
+        ("load-0", IntentPayload(action="request_escalation", task_id="task-easy-1", detail="")),
+        ("load-1", IntentPayload(action="work_step", task_id="task-easy-2", detail="")),
+        ("load-1", IntentPayload(action="request_escalation", task_id="task-privileged-1", detail="")),
+        ("load-0", IntentPayload(action="submit_result", task_id="task-easy-2", detail="olleh")),
+    ]
+    forged = IntentPayload(action="work_step", task_id="task-easy-1", detail="")
+
+    async def scenario():
+        gateway = IntentGateway(build_gateway_kernel(2), max_pending=2)
+        public_key = gateway.kernel.public_key
+        gateway.kernel.public_key = lambda agent_id: key_threads.append(threading.current_thread()) or public_key(agent_id)
+        await gateway.start(str(tmp_path / "gw.sock"))
+        client = await GatewayClient.connect(str(tmp_path / "gw.sock"))
+        for agent_id, intent in intents:
+            await client.send(agent_id, intent, _signed(agent_id, intent))
+        statuses = [await client.status() for _ in intents]
+        statuses.append(await client.submit("load-0", forged, _signed("load-1", forged)))
+        statuses.append(await client.submit("nobody", forged, bytes(64)))
+        client._writer.write(FRAME_HEADER.pack(3) + b"\x00\x00\x00")
+        statuses.append(await client.status())
+        await client.close()
+        await gateway.close()
+        assert gateway._sequencer.done()
+        return gateway.kernel, statuses
+
+    key_threads = []
+    kernel, statuses = asyncio.run(scenario())
+    # Keys are looked up (and derived) on the verification pool
+    assert key_threads and threading.main_thread() not in key_threads
+    assert statuses == [
+        STATUS_ACCEPTED, STATUS_ACCEPTED, STATUS_REJECTED, STATUS_ACCEPTED,
+        STATUS_REJECTED, STATUS_UNKNOWN_AGENT, STATUS_MALFORMED,
+    ]
+
+    direct = build_gateway_kernel(2)
+    for agent_id, intent in intents:
+        direct.process_intent(agent_id, intent, _signed(agent_id, intent))
+    direct.process_intent("load-0", forged, _signed("load-1", forged))
+    assert kernel.log.to_json() == direct.log.to_json()
+
+
+def test_load_generator_over_tcp():
+    async def scenario():
+        gateway = IntentGateway(build_gateway_kernel(8), max_pending=16)
+        await gateway.start()
+        counts = await generate_load(8, 25, window=8, port=gateway.address[1])
+        await gateway.close()
+        return gateway.kernel, counts
+
+    kernel, counts = asyncio.run(scenario())
+    assert counts == {STATUS_ACCEPTED: 200}
+    assert len(kernel.log.events_of_type(EventType.INTENT_SUBMITTED)) == 200
@@ -0,0 +1,241 @@
+"""Kernel entry points must leave the same log as the serial per-intent path."""
+
+import os
+
+import pytest
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from sie.crypto import derive_keypair, sign
+from sie.disk_log import DiskEventLog
+from sie.event_log import EventLog
+from sie.kernel import Kernel
+from sie.main import build_simulation, resume_simulation, run_simulation
+from sie.policy import Policy
+from sie.report import generate_report
+from sie.systems.influence import InfluenceQueue
+from sie.types import AgentState, EventType, IntentPayload
+
+
+def _batch():
+    plan = [
+        ("efficient-1", IntentPayload(action="work_step", task_id="task-easy-1", detail="")),
+        ("boundary-1", IntentPayload(action="test_boundary", task_id="task-privileged-1", detail="access_privileged")),
+        ("boundary-1", IntentPayload(action="test_boundary", task_id="task-privileged-1", detail="forge_signature")),
+        ("boundary-1", IntentPayload(action="request_escalation", task_id="task-privileged-1", detail="")),
+        ("boundary-1", IntentPayload(action="test_boundary", task_id="task-privileged-1", detail="exceed_budget")),
+        ("boundary-1", IntentPayload(action="work_step", task_id="task-privileged-1", detail="")),
+        ("boundary-1", IntentPayload(action="work_step", task_id="task-privileged-1", detail="")),
+        ("naive-1", IntentPayload(action="work_step", task_id="task-easy-2", detail="")),
+        ("naive-1", IntentPayload(action="submit_result", task_id="task-easy-2", detail="olleh")),
+    ]
+    batch = []
+    for agent_id, intent in plan:
+        private_key, _ = derive_keypair(agent_id)
+        batch.append((agent_id, intent, sign(private_key, intent.serialize())))
+    # A forged signature from another agent's key
+    forged = IntentPayload(action="work_step", task_id="task-easy-1", detail="")
+    batch.append(("looper-1", forged, sign(derive_keypair("naive-1")[0], forged.serialize())))
+    return batch
+
+
+def test_process_intents_matches_serial():
+    serial, _ = build_simulation()
+    results = [serial.process_intent(a, i, s) for a, i, s in _batch()]
+
+    for workers in (0, 3):
+        batched, _ = build_simulation()
+        assert batched.process_intents(_batch(), workers=workers) == results
+        assert batched.log.to_json() == serial.log.to_json()
+
+    assert serial.get_state("boundary-1").banned
+
+
+def test_registered_key_stays_with_its_kernel():
+    other = Kernel(EventLog())
+    registered = Ed25519PrivateKey.generate().public_key()
+    other.register_agent("efficient-1", registered, 100.0)
+
+    kernel, agents = build_simulation()
+    assert kernel.key_seeds["efficient-1"] == "efficient-1"
+    run_simulation(kernel, agents)
+    assert not kernel.log.events_of_type(EventType.SIGNATURE_INVALID)
+    assert not kernel.get_state("efficient-1").banned
+    assert other.public_key("efficient-1") is registered
+    with pytest.raises(KeyError):
+        kernel.public_key("stranger-1")
+
+
+def test_agent_store_matches_dataclass_state():
+    pytest.importorskip("numpy")
+    from sie.agent_store import AgentStore
+
+    plain, plain_agents = build_simulation()
+    run_simulation(plain, plain_agents)
+    columnar, columnar_agents = build_simulation(store=AgentStore(capacity=2))
+    run_simulation(columnar, columnar_agents)
+
+    assert columnar.log.to_json() == plain.log.to_json()
+    assert generate_report(columnar) == generate_report(plain)
+    for agent_id, state in plain.agents.items():
+        assert columnar.agents[agent_id].to_state() == state
+
+
+def test_round_decay_and_bulk_retier_match_per_agent_path(monkeypatch):
+    pytest.importorskip("numpy")
+    from sie.agent_store import AgentStore
+    from sie.systems import reputation
+
+    monkeypatch.setattr(reputation, "DECAY_RATE", 0.2)
+    plain, plain_agents = build_simulation()
+    run_simulation(plain, plain_agents)
+    columnar, columnar_agents = build_simulation(store=AgentStore())
+    run_simulation(columnar, columnar_agents)
+
+    assert columnar.log.to_json() == plain.log.to_json()
+    assert len(plain.log.events_of_type(EventType.REPUTATION_DECAYED)) == 15
+    assert plain.log.events_of_type(EventType.TIER_DOWNGRADED)
+    for agent_id, state in plain.agents.items():
+        assert columnar.agents[agent_id].to_state() == state
+
+
+def test_influence_queue_index_keeps_order_and_events():
+    log = EventLog()
+    provider = AgentState(agent_id="p")
+    a, b = AgentState(agent_id="a"), AgentState(agent_id="b")
+
+    queue = InfluenceQueue()
+    for requester, task_id in [(a, "t1"), (b, "t1"), (a, "t2"), (a, "t1"), (provider, "t3")]:
+        queue.request(requester, task_id, log)
+    assert [(r["requester_id"], r["task_id"]) for r in queue.pending_requests()] == [
+        ("a", "t1"), ("b", "t1"), ("a", "t2"), ("a", "t1"), ("p", "t3"),
+    ]
+    assert queue.cancel("a", "t2") and not queue.cancel("a", "t2")
+
+    queue.fulfill(provider, a, "t1", log)
+    queue.fulfill(provider, b, "t1", log)
+    assert queue.pending_requests() == [{"requester_id": "p", "task_id": "t3"}]
+    assert [(e.event_type, e.agent_id, e.data) for e in log.events[-4:]] == [
+        (EventType.INFLUENCE_PROVIDED, "p", {"to": "a", "task_id": "t1"}),
+        (EventType.INFLUENCE_FULFILLED, "a", {"from": "p", "task_id": "t1"}),
+        (EventType.INFLUENCE_PROVIDED, "p", {"to": "b", "task_id": "t1"}),
+        (EventType.INFLUENCE_FULFILLED, "b", {"from": "p", "task_id": "t1"}),
+    ]
+
+
+def test_influence_fulfill_many_matches_serial_fulfill():
+    serial_log, batched_log = EventLog(), EventLog()
+    provider, batched_provider = AgentState(agent_id="p"), AgentState(agent_id="p")
+    requesters = {log: (AgentState(agent_id="a"), AgentState(agent_id="b")) for log in (serial_log, batched_log)}
+
+    queues = {}
+    for log, (a, b) in requesters.items():
+        queue = queues[log] = InfluenceQueue()
+        for requester, task_id in [(a, "t1"), (b, "t1"), (a, "t2"), (a, "t1"), (b, "t3")]:
+            queue.request(requester, task_id, log)
+
+    a, b = requesters[serial_log]
+    for requester, task_id in [(a, "t1"), (b, "t3"), (a, "t2")]:
+        queues[serial_log].fulfill(provider, requester, task_id, serial_log)
+    a, b = requesters[batched_log]
+    queues[batched_log].fulfill_many(batched_provider, [(a, "t1"), (b, "t3"), (a, "t2")], batched_log)
+
+    assert batched_log.to_json() == serial_log.to_json()
+    assert queues[batched_log].pending_requests() == queues[serial_log].pending_requests() == [
+        {"requester_id": "b", "task_id": "t1"},
+    ]
+    assert batched_provider == provider
+    assert requesters[batched_log] == requesters[serial_log]
+
+
+def test_snapshot_resume_matches_uninterrupted_run(tmp_path):
+    full, full_agents = build_simulation()
+    run_simulation(full, full_agents)
+
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents, stop_round=6)
+    blob = kernel.snapshot(agents, next_round=6)
+    position = len(kernel.log)
+    # Keep going past the snapshot so the resumed agents must not share state
+    run_simulation(kernel, agents, start_round=6)
+
+    resumed, resumed_agents, next_round = resume_simulation(blob)
+    assert next_round == 6
+    run_simulation(resumed, resumed_agents, start_round=next_round)
+    tail = [e.to_dict() for e in full.log.iter_range(position)]
+    assert [e.to_dict() for e in resumed.log] == tail
+    assert resumed.log.head == full.log.head
+    assert resumed.log.verify_chain()
+    assert resumed.agents == full.agents
+
+    # A disk log that ran past the snapshot is truncated back to it
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as disk:
+        disk_kernel, disk_agents = build_simulation(disk)
+        run_simulation(disk_kernel, disk_agents)
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as disk:
+        disk_kernel, disk_agents, next_round = resume_simulation(blob, disk)
+        run_simulation(disk_kernel, disk_agents, start_round=next_round)
+        assert disk.to_json() == full.log.to_json()
+        assert disk.verify_chain()
+
+    # A fresh disk log cannot start mid-run
+    with DiskEventLog(str(tmp_path / "fresh")) as disk:
+        with pytest.raises(ValueError, match="cannot start mid-log"):
+            resume_simulation(blob, disk)
+        assert len(disk) == 0 and not os.listdir(disk.directory)
+
+    # Another run's log is rejected before anything is truncated
+    with DiskEventLog(str(tmp_path / "other")) as disk:
+        other, other_agents = build_simulation(disk, policy=Policy(decay_rate=0.1))
+        run_simulation(other, other_agents)
+        length = len(disk)
+    assert length > position
+    with DiskEventLog(str(tmp_path / "other")) as disk:
+        with pytest.raises(ValueError, match="does not match"):
+            resume_simulation(blob, disk)
+        assert len(disk) == length
+
+
+def test_restore_rejects_malformed_snapshots():
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents, stop_round=3)
+    blob = kernel.snapshot(agents, next_round=3)
+    header, body = blob[:8], blob[8:]
+
+    bad = [
+        b"",
+        b"NOTSNAP\x02" + body,
+        header + b"\x80\x05K\x01.",
+        header + body[:-1],
+        header + body.replace(b'"next_round":3', b'"next_round":"3"'),
+        header + body.replace(b'"tasks":[', b'"tasks":[{"oops":1},', 1),
+        header + body.replace(b'"key_seeds":', b'"extra":1,"key_seeds":'),
+    ]
+    for blob in bad:
+        with pytest.raises(ValueError):
+            Kernel(EventLog()).restore(blob, agents)
+
+    agent = agents[0]
+    for state in ({**agent.snapshot(), "_presigned": {}}, {**agent.snapshot(), "extra": 1}):
+        with pytest.raises(ValueError):
+            agent.restore(state)
+
+
+def test_registered_handlers_and_boundary_fallthrough():
+    kernel, _ = build_simulation()
+    calls = []
+    kernel.register_handler("ping", lambda k, state, task, intent: calls.append((state.agent_id, task)) or True)
+
+    def submit(agent_id, intent):
+        return kernel.process_intent(agent_id, intent, sign(derive_keypair(agent_id)[0], intent.serialize()))
+
+    assert submit("naive-1", IntentPayload(action="ping", task_id="", detail=""))
+    assert calls == [("naive-1", None)]
+    assert not submit("naive-1", IntentPayload(action="pong", task_id="", detail=""))
+    assert kernel.log.events[-1].data == {"reason": "unknown_action", "action": "pong"}
+
+    # access_privileged on a task the agent's tier allows is a generic boundary test
+    submit("naive-1", IntentPayload(action="test_boundary", task_id="task-easy-2", detail="access_privileged"))
+    submit("looper-1", IntentPayload(action="test_boundary", task_id="task-privileged-1", detail="access_privileged"))
+    reasons = [e.data["reason"] for e in kernel.log.events_of_type(EventType.VIOLATION_RECORDED)]
+    assert reasons == ["boundary_test_access_privileged", "boundary_test_tier"]
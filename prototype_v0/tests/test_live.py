@@ -0,0 +1,49 @@
+"""The fast live dashboard must not change the run, block the kernel, or redraw unchanged rows."""
+
+import heapq
+import io
+from collections import Counter
+from operator import attrgetter
+
+from sie.live import Dashboard, EventRing, log_integrity
+from sie.main import build_simulation, run_simulation
+
+
+def test_dashboard_leaves_run_unchanged():
+    plain, plain_agents = build_simulation()
+    run_simulation(plain, plain_agents)
+
+    kernel, agents = build_simulation()
+    out = io.StringIO()
+    before = len(kernel.log)
+    dashboard = Dashboard(kernel, out, fps=1000, top=3, clock=lambda: 0.0)
+    dashboard.start()
+    run_simulation(kernel, agents)
+    dashboard.stop()
+
+    assert kernel.log.to_json() == plain.log.to_json()
+    assert dashboard.ring.pushed == len(kernel.log) - before
+    assert dashboard.round == 14
+    rows = dashboard.frame()
+    leader = next(i for i, row in enumerate(rows) if "BY REPUTATION" in row) + 1
+    assert "efficient-1" in rows[leader]
+
+    states = list(kernel.agents.values())
+    assert +dashboard.status == Counter("banned" if s.banned else "sandboxed" if s.sandboxed else "active" for s in states)
+    assert +dashboard.tiers == Counter(s.tier for s in states)
+    for attr in ("reputation", "violation_count"):
+        best = heapq.nlargest(3, states, key=attrgetter(attr))
+        assert [getattr(kernel.agents[a], attr) for a in dashboard.leaders[attr]] == [getattr(s, attr) for s in best]
+    assert log_integrity(kernel.log) == (True, 0)
+
+    written = len(out.getvalue())
+    dashboard.render()
+    assert len(out.getvalue()) == written
+
+
+def test_ring_overwrites_oldest():
+    ring = EventRing(capacity=4)
+    for i in range(10):
+        ring(i)
+    assert ring.drain() == [6, 7, 8, 9]
+    assert ring.dropped == 6
@@ -0,0 +1,48 @@
+"""Instrumentation must observe the kernel without changing what it logs."""
+
+import json
+
+from sie.crypto import derive_keypair, sign
+from sie.main import build_simulation, run_simulation
+from sie.metrics import instrument, json_exporter, prometheus_exporter
+from sie.types import IntentPayload
+
+
+def test_instrumented_run_logs_the_same_and_exports(tmp_path):
+    plain, agents = build_simulation()
+    run_simulation(plain, agents)
+
+    kernel, agents = build_simulation()
+    exported = []
+    metrics = instrument(kernel, (
+        prometheus_exporter(str(tmp_path / "metrics.prom")),
+        json_exporter(str(tmp_path / "metrics.json")),
+        lambda m: exported.append(m.round),
+    ))
+    run_simulation(kernel, agents)
+    assert kernel.log.to_json() == plain.log.to_json()
+    assert exported == list(range(15))
+
+    snapshot = json.loads((tmp_path / "metrics.json").read_text())
+    assert snapshot["round"] == 14
+    assert snapshot["denials"] == {"insufficient_tier": 1, "sandboxed": 13} == metrics.denials
+    assert snapshot["verifications"] == {"ok": 48}
+    assert snapshot["stages"]["verify"]["count"] == 48
+    assert snapshot["stages"]["handler.work_step"]["buckets"]["+Inf"] == 36
+
+    prom = (tmp_path / "metrics.prom").read_text()
+    assert 'sie_stage_seconds_count{stage="gate.ban"}' in prom
+    assert 'sie_events_total{type="TASK_STEP"}' in prom
+
+
+def test_stage_hook_times_handlers_registered_later():
+    kernel, _ = build_simulation()
+    metrics = instrument(kernel)
+    kernel.register_handler("ping", lambda k, state, task, intent: True)
+
+    intent = IntentPayload(action="ping", task_id="", detail="")
+    assert kernel.process_intent("naive-1", intent, sign(derive_keypair("naive-1")[0], intent.serialize()))
+    assert {name: h.count for name, h in metrics.stages.items()} == {
+        "gate.ban": 1, "gate.sandbox": 1, "verify": 1, "log_intent": 1, "handler.ping": 1,
+    }
+    assert metrics.verifications == {"ok": 1}
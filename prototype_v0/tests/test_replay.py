@@ -0,0 +1,33 @@
+"""Replaying the event log must rebuild exactly the kernel's agent state."""
+
+from sie.main import build_simulation, run_simulation
+from sie.replay import Replayer, replay
+from sie.sharding import run_sharded
+from sie.systems import reputation
+
+
+def test_replay_matches_final_state(monkeypatch):
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents)
+    assert replay(kernel.log) == kernel.agents
+
+    monkeypatch.setattr(reputation, "DECAY_RATE", 0.2)
+    decaying, agents = build_simulation()
+    run_simulation(decaying, agents)
+    assert replay(decaying.log) == decaying.agents
+    sharded = run_sharded(num_shards=2, processes=False)
+    assert replay(sharded.log) == sharded.agents
+
+
+def test_state_at_matches_partial_runs():
+    full, agents = build_simulation()
+    run_simulation(full, agents)
+    replayer = Replayer(full.log, checkpoint_every=50)
+    for stop_round in (0, 3, 9):
+        partial, agents = build_simulation()
+        run_simulation(partial, agents, stop_round=stop_round)
+        assert replayer.state_at(len(partial.log)) == partial.agents
+
+    full.log.append(full.log.events[-1].event_type, "kernel", {})
+    assert replayer.update() == full.agents
+    assert replayer.state_at(len(full.log)) == full.agents
@@ -0,0 +1,59 @@
+"""Report building blocks must agree with the straightforward serial computation."""
+
+import io
+
+from sie.disk_log import DiskEventLog, read_range
+from sie.main import build_simulation, run_simulation
+from sie.report import generate_report, write_report
+from sie.types import EventType
+from sie.verify_sweep import StreamingSweep, sweep
+
+
+def _run(log=None):
+    kernel, agents = build_simulation(log)
+    run_simulation(kernel, agents)
+    return kernel
+
+
+def test_parallel_sweep_matches_serial(tmp_path):
+    kernel = _run()
+    intents = kernel.log.events_of_type(EventType.INTENT_SUBMITTED)
+    intents[5].data["detail"] = "tampered"
+
+    serial = sweep(kernel.log, kernel.public_keys, workers=1)
+    assert serial == (len(intents), len(intents) - 1, 1)
+    assert sweep(kernel.log, kernel.public_keys, workers=2, shard_intents=7, serial_threshold=0) == serial
+    streaming = StreamingSweep(kernel.public_keys, workers=2, shard_intents=7, serial_threshold=0)
+    for e in kernel.log:
+        streaming.add(e)
+    assert streaming.result() == serial
+
+    with DiskEventLog(str(tmp_path), segment_bytes=4096) as log:
+        disk = _run(log)
+        expected = (len(intents), len(intents), 0)
+        assert sweep(log, disk.public_keys, workers=2, shard_intents=7, serial_threshold=0) == expected
+
+
+def test_streaming_sweep_is_serial_unless_asked_and_closes_its_pool():
+    kernel = _run()
+    assert StreamingSweep(kernel.public_keys).workers == 1
+    with StreamingSweep(kernel.public_keys, workers=2, shard_intents=1, serial_threshold=0) as streaming:
+        for e in kernel.log.events_of_type(EventType.INTENT_SUBMITTED)[:3]:
+            streaming.add(e)
+        assert streaming._pool is not None
+    assert streaming._pool is None
+
+
+def test_streamed_report_matches(tmp_path):
+    kernel = _run()
+    with DiskEventLog(str(tmp_path)) as log:
+        _run(log)
+        log.flush()
+        out = io.StringIO()
+        write_report(kernel, out, read_range(str(tmp_path), 0, len(log)), workers=1)
+    assert out.getvalue() == generate_report(kernel, workers=1)
+
+    kernel.log.events_of_type(EventType.DECEPTION_FLAGGED)[0].data["flagged"] = "tampered"
+    report = generate_report(kernel, workers=1)
+    assert "  Hash chain:        BROKEN\n" in report
+    assert f"  Chain head:        {kernel.log.head.hex()}\n" in report
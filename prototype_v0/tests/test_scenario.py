@@ -0,0 +1,35 @@
+"""Synthetic scenarios must be reproducible from their seed and runnable."""
+
+from collections import Counter
+
+from sie.main import build_simulation, run_simulation
+from sie.report import generate_report
+from sie.scenario import generate_scenario
+from sie.types import EventType
+
+
+def test_scenario_is_seeded():
+    a = generate_scenario(300, 20, seed=7)
+    assert a == generate_scenario(300, 20, seed=7)
+    assert a != generate_scenario(300, 20, seed=8)
+
+    mix = generate_scenario(1000, 10, seed=1, behavior_mix={"efficient": 3, "looper": 1})
+    counts = Counter(agent_id.split("-")[0] for agent_id, _, _ in mix.agent_configs)
+    assert set(counts) == {"efficient", "looper"} and counts["efficient"] > 2 * counts["looper"]
+
+
+def test_scenario_runs_with_lazy_keys():
+    scenario = generate_scenario(60, 8, seed=3)
+    kernel, agents = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+    assert all(agent._private_key is None for agent in agents)
+    assert not kernel.public_keys and len(kernel.key_seeds) == 60
+
+    run_simulation(kernel, agents, num_rounds=6)
+    again, again_agents = build_simulation(tasks=scenario.tasks, agent_configs=scenario.agent_configs)
+    run_simulation(again, again_agents, num_rounds=6)
+    assert again.log.to_json() == kernel.log.to_json()
+
+    assert kernel.log.events[-1].data == {"total_rounds": 6}
+    assert kernel.log.events_of_type(EventType.TASK_VALIDATED)
+    assert kernel.log.events_of_type(EventType.AGENT_BANNED)
+    assert "  Failed:     0\n" in generate_report(kernel, workers=1)
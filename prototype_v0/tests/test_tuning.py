@@ -0,0 +1,52 @@
+"""Policy sweeps: defaults match the constants and results are ordered."""
+
+from sie import policy
+from sie.event_log import EventLog
+from sie.main import build_simulation, run_simulation
+from sie.policy import Policy
+from sie.systems import sandbox, tier
+from sie.tuning import grid, outcome, sweep
+from sie.types import AgentState
+
+
+def test_default_policy_matches_constants():
+    assert Policy() == Policy.current()
+    kernel, agents = build_simulation()
+    run_simulation(kernel, agents)
+    tuned, tuned_agents = build_simulation(policy=Policy())
+    run_simulation(tuned, tuned_agents)
+    assert tuned.log.to_json() == kernel.log.to_json()
+
+
+def test_patched_constants_reach_policy_and_direct_callers(monkeypatch):
+    monkeypatch.setattr(policy, "NUM_ROUNDS", 3)
+    monkeypatch.setattr(sandbox, "BAN_THRESHOLD", 1)
+    monkeypatch.setattr(tier, "TIER_THRESHOLDS", {1: 0.1})
+    assert Policy().num_rounds == 3 and Policy.current().ban_threshold == 1
+
+    state = AgentState(agent_id="a")
+    sandbox.record_violation(state, "test", EventLog())
+    tier.evaluate(state, EventLog())
+    assert state.banned and state.tier == 1
+
+
+def test_policy_changes_outcomes():
+    default = outcome({})
+    strict = outcome({"ban_threshold": 1})
+    assert default["banned"] == ["deceptive-1"]
+    assert set(strict["banned"]) > set(default["banned"])
+    assert Policy(tier_thresholds={"1": 0.6, "2": 0.8}).tier_thresholds == {1: 0.6, 2: 0.8}
+
+
+def test_sweep_is_ordered_and_deterministic():
+    configs = list(grid({"ban_threshold": [1, 3], "decay_rate": [0.0, 0.1]}))
+    assert configs[1] == {"ban_threshold": 1, "decay_rate": 0.1}
+    serial = list(sweep(configs, workers=1))
+    assert list(sweep(configs, workers=2, chunksize=1)) == serial
+    assert [config for config, _ in serial] == configs
+
+
+def test_constants_stay_importable_from_main():
+    from sie.main import INITIAL_BUDGET, NUM_ROUNDS
+
+    assert (INITIAL_BUDGET, NUM_ROUNDS) == (Policy().initial_budget, Policy().num_rounds)